@@ -23,6 +23,7 @@ from jsonschema._types import (
 from jsonschema.validators import (
     Draft3Validator, Draft4Validator, RefResolver, validate
 )
+from jsonschema._bundle import bundle
 
 from pkg_resources import get_distribution
 __version__ = get_distribution(__name__).version
@@ -0,0 +1,172 @@
+"""
+Bundling of schemas which refer to other documents into a single document.
+
+"""
+import copy
+import re
+
+from jsonschema.compat import iteritems, str_types, urldefrag, urlsplit
+from jsonschema.validators import RefResolver
+
+
+def bundle(schema, resolver=None):
+    """
+    Inline every document a schema refers to, producing one single schema.
+
+    Each external document (or part of one) which is referred to is copied
+    into the ``definitions`` of the returned schema, and each ``$ref`` is
+    rewritten to point at its copy, so that validating with the returned
+    schema only ever resolves (cheap) references within it.
+
+    Subschemas' ``id``\\s are removed, since they would otherwise change
+    what the rewritten references are resolved relative to.
+
+    Arguments:
+
+        schema (dict):
+
+            the schema to bundle, which is not modified
+
+        resolver (jsonschema.RefResolver):
+
+            the resolver to resolve references with, which determines the
+            base URI of the schema and which documents are available. If
+            unprovided, one is created with `RefResolver.from_schema`.
+
+    Returns:
+
+        dict: the bundled schema
+
+    Raises:
+
+        `jsonschema.exceptions.RefResolutionError` if any reference can't
+        be resolved
+
+    """
+
+    if resolver is None:
+        resolver = RefResolver.from_schema(schema)
+
+    bundled = copy.deepcopy(schema)
+    base_uri, scope = resolver.base_uri, resolver.resolution_scope
+    existing = bundled.get(u"definitions", {})
+    pointers, definitions = {}, {}
+
+    def pointer_to(url):
+        """
+        Find (or make) the local pointer to the copy of what a URL refers to.
+        """
+
+        pointer = pointers.get(url)
+        if pointer is None:
+            name = _unique_name(url, taken=(existing, definitions))
+            pointers[url] = pointer = u"#/definitions/" + _escape(name)
+
+            _, resolved = resolver.resolve(url)
+            definitions[name] = resolved = copy.deepcopy(resolved)
+            pending.append((resolved, url))
+        return pointer
+
+    pending = [(bundled, scope)]
+    while pending:
+        document, document_scope = pending.pop()
+        for subschema, subschema_scope in _subschemas(
+            document, document_scope, resolver._urljoin_cache,
+        ):
+            if subschema is not bundled:
+                subschema.pop(u"id", None)
+
+            ref = subschema.get(u"$ref")
+            if not isinstance(ref, str_types):
+                continue
+            url = resolver._urljoin_cache(subschema_scope, ref)
+            uri, fragment = urldefrag(url)
+            if uri == base_uri:
+                subschema[u"$ref"] = u"#" + fragment
+            else:
+                subschema[u"$ref"] = pointer_to(url)
+
+    if definitions:
+        bundled.setdefault(u"definitions", {}).update(definitions)
+    return bundled
+
+
+def _subschemas(schema, scope, urljoin):
+    """
+    Yield each subschema within a schema, along with its resolution scope.
+
+    Only keywords known to contain subschemas are descended into, so that
+    e.g. instances within an ``enum`` aren't mistaken for schemas.
+
+    """
+
+    stack = [(schema, scope)]
+    while stack:
+        schema, scope = stack.pop()
+        if not isinstance(schema, dict):
+            continue
+
+        id_of = schema.get(u"id")
+        if isinstance(id_of, str_types):
+            scope = urljoin(scope, id_of)
+        yield schema, scope
+
+        for keyword, value in iteritems(schema):
+            if keyword in _SINGLE:
+                stack.append((value, scope))
+            elif keyword in _LISTS and isinstance(value, list):
+                stack.extend((each, scope) for each in value)
+            elif keyword in _MAPPINGS and isinstance(value, dict):
+                stack.extend((each, scope) for each in value.values())
+
+
+_SINGLE = frozenset(
+    [
+        u"additionalItems",
+        u"additionalProperties",
+        u"extends",
+        u"items",
+        u"not",
+    ],
+)
+_LISTS = frozenset(
+    [
+        u"allOf",
+        u"anyOf",
+        u"disallow",
+        u"extends",
+        u"items",
+        u"oneOf",
+        u"type",
+    ],
+)
+_MAPPINGS = frozenset(
+    [
+        u"definitions",
+        u"dependencies",
+        u"patternProperties",
+        u"properties",
+    ],
+)
+
+
+def _unique_name(url, taken):
+    uri, fragment = urldefrag(url)
+    path = urlsplit(uri).path.rstrip(u"/")
+    name = path.rsplit(u"/", 1)[-1] or urlsplit(uri).netloc or u"schema"
+    if fragment.strip(u"/"):
+        name += u"-" + fragment.strip(u"/")
+    name = _UNSAFE.sub(u"_", name)
+
+    unique, suffix = name, 2
+    while any(unique in each for each in taken):
+        unique = u"%s-%s" % (name, suffix)
+        suffix += 1
+    return unique
+
+
+_UNSAFE = re.compile(u"[^\\w.-]+", re.UNICODE)
+
+
+def _escape(name):
+    return name.replace(u"~", u"~0").replace(u"/", u"~1")
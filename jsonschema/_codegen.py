@@ -0,0 +1,1013 @@
+"""
+Generation of Python source code which validates instances under a schema.
+
+Each (sub)schema becomes one function in the generated module, with its
+type checks written out as `isinstance` calls and its comparisons written
+out inline, so that validating an instance calls no validator functions at
+all. The generated module only depends on `jsonschema` for the exception
+classes and a few helpers, and can be written to disk and imported.
+
+Only the validator functions and type checkers which come with
+`jsonschema` can be turned into source. Schemas using anything else (or
+whose references cannot be resolved ahead of time) should be compiled with
+the default backend instead.
+
+"""
+import contextlib
+import math
+import re
+import types
+
+from jsonschema import _types, _utils, _validators
+from jsonschema._compiler import _scopes
+from jsonschema.compat import PY3, int_types, iteritems, str_types, urldefrag
+
+
+_HEADER = '''\
+"""
+Validation functions generated by jsonschema.
+
+"""
+import numbers
+import re
+
+from jsonschema import _utils
+from jsonschema.compat import int_types, iteritems, str_types
+from jsonschema.exceptions import FormatError, UnknownType, ValidationError
+
+
+#: The `jsonschema.FormatChecker` used for the format validator, if any.
+format_checker = None
+
+#: The limits on the errors produced (see `IValidator`), if any.
+max_errors = max_errors_per_path = max_context_errors = None
+
+
+def iter_errors(instance):
+    return _utils.limit_errors(
+        _v0(instance),
+        max_errors=max_errors,
+        max_errors_per_path=max_errors_per_path,
+    )
+
+
+def is_valid(instance):
+    return _is_valid(_v0(instance))
+
+
+def validate(instance):
+    for error in _v0(instance):
+        raise error
+
+
+def _is_valid(errors):
+    for _ in errors:
+        return False
+    return True
+
+
+def _descend(errors, schema_path):
+    for error in errors:
+        error.schema_path.appendleft(schema_path)
+        yield error
+
+
+def _unknown_type(type, instance):
+    raise UnknownType(type, instance, _d0)
+
+
+def _type_draft3(instance, types, checks):
+    all_errors = []
+    for index, check in checks:
+        if check is None:
+            return
+        elif index is not None:
+            errors = _descend(check(instance), schema_path=index)
+            if not _utils.extend_context(
+                all_errors, errors, max_context_errors,
+            ):
+                return
+        elif check(instance):
+            return
+    yield ValidationError(
+        _utils.types_msg(instance, types), context=all_errors,
+    )
+
+
+def _oneOf_draft4(instance, subschemas):
+    subschemas = iter(subschemas)
+    all_errors = []
+    for index, function, subschema in subschemas:
+        errs = _descend(function(instance), schema_path=index)
+        if not _utils.extend_context(all_errors, errs, max_context_errors):
+            first_valid = subschema
+            break
+    else:
+        yield ValidationError(
+            _utils.Message(
+                "%r is not valid under any of the given schemas", instance,
+            ),
+            context=all_errors,
+        )
+
+    more_valid = [
+        subschema
+        for _, function, subschema in subschemas
+        if _is_valid(function(instance))
+    ]
+    if more_valid:
+        more_valid.append(first_valid)
+        reprs = ", ".join(repr(schema) for schema in more_valid)
+        yield ValidationError(
+            _utils.Message("%r is valid under each of %s", instance, reprs)
+        )
+
+
+def _anyOf_draft4(instance, functions):
+    all_errors = []
+    for index, function in enumerate(functions):
+        errs = _descend(function(instance), schema_path=index)
+        if not _utils.extend_context(all_errors, errs, max_context_errors):
+            return
+    yield ValidationError(
+        _utils.Message(
+            "%r is not valid under any of the given schemas", instance,
+        ),
+        context=all_errors,
+    )
+'''
+
+
+_TYPES = {
+    _types.is_any: "True",
+    _types.is_array: "isinstance({0}, list)",
+    _types.is_bool: "isinstance({0}, bool)",
+    _types.is_integer: (
+        "isinstance({0}, int_types) and not isinstance({0}, bool)"
+    ),
+    _types.is_null: "{0} is None",
+    _types.is_number: (
+        "isinstance({0}, numbers.Number) and not isinstance({0}, bool)"
+    ),
+    _types.is_object: "isinstance({0}, dict)",
+    _types.is_string: "isinstance({0}, str_types)",
+}
+
+
+class GeneratedValidator(object):
+    """
+    A validator whose schema has been turned into Python source code.
+
+    Produces the same errors as the `IValidator` it was generated from.
+
+    Don't instantiate this directly, use `IValidator.compile`.
+
+    Attributes:
+
+        source (str):
+
+            The source code of the generated module
+
+        module:
+
+            The generated module itself
+
+    """
+
+    def __init__(self, validator):
+        self.validator = validator
+        self.schema = validator.schema
+        self.source = _Generator(validator).module()
+
+        self.module = types.ModuleType("jsonschema_generated")
+        code = compile(self.source, "<jsonschema generated>", "exec")
+        exec(code, self.module.__dict__)
+        self.module.format_checker = validator.format_checker
+        self.module.max_errors = validator.max_errors
+        self.module.max_errors_per_path = validator.max_errors_per_path
+        self.module.max_context_errors = validator.max_context_errors
+
+    def __repr__(self):
+        return "<%s for %r>" % (self.__class__.__name__, self.validator)
+
+    def iter_errors(self, instance):
+        """
+        Lazily yield each of the validation errors in the given instance.
+
+        """
+
+        return self.module.iter_errors(instance)
+
+    def is_valid(self, instance):
+        """
+        Check if the instance is valid under the compiled schema.
+
+        """
+
+        return self.module.is_valid(instance)
+
+    def validate(self, instance):
+        """
+        Check if the instance is valid under the compiled schema.
+
+        Raises:
+
+            `jsonschema.exceptions.ValidationError` if the instance
+                is invalid
+
+        """
+
+        self.module.validate(instance)
+
+    def dump(self, path):
+        """
+        Write the generated module's source to ``path``.
+
+        The written module can be imported like any other. If the validator
+        it was generated from had a `FormatChecker`, it must be assigned to
+        the imported module's ``format_checker`` attribute for formats to be
+        checked, and likewise any limits on the errors produced must be
+        assigned to its ``max_errors``, ``max_errors_per_path`` and
+        ``max_context_errors`` attributes.
+
+        """
+
+        with open(path, "w") as file:
+            file.write(self.source)
+
+
+class _Function(object):
+    """
+    A function being generated for a (sub)schema.
+
+    """
+
+    def __init__(self, name, schema, pushes):
+        self.name = name
+        self.schema = schema
+        self.pushes = pushes
+        self.dispatched = None
+
+
+class _Writer(object):
+    def __init__(self, depth=1):
+        self.lines = []
+        self.depth = depth
+
+    def line(self, text):
+        self.lines.append("    " * self.depth + text)
+
+    @contextlib.contextmanager
+    def block(self, header):
+        self.line(header)
+        self.depth += 1
+        written = len(self.lines)
+        yield
+        if len(self.lines) == written:
+            self.line("pass")
+        self.depth -= 1
+
+
+class _Generator(object):
+    def __init__(self, validator):
+        self.validator = validator
+        self._assignments = []
+        self._functions = []
+        self._names = {}
+        self._expressions = {}
+        self._regexes = {}
+        self._documents = 0
+
+    def module(self):
+        """
+        Generate the source of a module validating under the schema.
+
+        """
+
+        self.document(self.validator.schema)
+        self.function(self.validator.schema)
+        return "\n\n\n".join(
+            [_HEADER.rstrip(), "\n".join(self._assignments)] + self._functions,
+        ) + "\n"
+
+    def assign(self, prefix, expression):
+        name = "_%s%d" % (prefix, len(self._assignments))
+        self._assignments.append("%s = %s" % (name, expression))
+        return name
+
+    def document(self, document):
+        """
+        Write out a document (a schema or subschema) as a literal.
+
+        Containers within it can afterwards be referred to by `constant`.
+
+        """
+
+        name = "_d%d" % (self._documents,)
+        self._documents += 1
+        self._assignments.append("%s = %s" % (name, _literal(document)))
+
+        containers = [(document, name)]
+        while containers:
+            container, expression = containers.pop()
+            if id(container) in self._expressions:
+                continue
+            self._expressions[id(container)] = expression, container
+
+            if isinstance(container, dict):
+                children = iteritems(container)
+            elif isinstance(container, (list, tuple)):
+                children = enumerate(container)
+            else:
+                continue
+            for key, child in children:
+                if isinstance(child, (dict, list, tuple)):
+                    containers.append(
+                        (child, "%s[%s]" % (expression, _literal(key))),
+                    )
+        return name
+
+    def constant(self, value):
+        """
+        Retrieve an expression evaluating to ``value`` in the module.
+
+        """
+
+        if not isinstance(value, (dict, list, tuple)):
+            return _literal(value)
+
+        expression, _ = self._expressions.get(id(value), (None, None))
+        if expression is None:
+            return self.document(value)
+        elif "[" not in expression:
+            return expression
+        name = self.assign("c", expression)
+        self._expressions[id(value)] = name, value
+        return name
+
+    def regex(self, pattern):
+        name = self._regexes.get(pattern)
+        if name is None:
+            re.compile(pattern)
+            name = self._regexes[pattern] = self.assign(
+                "r", "re.compile(%s)" % (_literal(pattern),),
+            )
+        return name
+
+    def dispatch(self, out, schema, function):
+        """
+        Write out sorting out the instance's properties, once per function.
+
+        Returns the name of the local holding the matches of each of the
+        ``patternProperties`` and the additional properties (see
+        `_utils.PropertyDispatcher`), or ``None`` if the patterns can't be
+        combined into one which means the same thing, in which case the
+        keywords need to search for each pattern themselves.
+
+        """
+
+        if function.dispatched is None:
+            try:
+                exact = _utils.PropertyDispatcher(schema).exact
+            except re.error:
+                exact = False
+
+            if not exact:
+                function.dispatched = False
+            else:
+                dispatcher = self.assign(
+                    "p", "_utils.PropertyDispatcher(%s)" % (function.schema,),
+                )
+                out.line("dispatched = %s.dispatch(instance)" % (dispatcher,))
+                function.dispatched = u"dispatched"
+        return function.dispatched or None
+
+    def is_type(self, type, instance=u"instance"):
+        """
+        Retrieve an expression checking whether ``instance`` is of ``type``.
+
+        """
+
+        checker = self.validator.TYPE_CHECKER
+        fn = checker._checks.get(type)
+        if fn is None:
+            return "_unknown_type(%s, %s)" % (_literal(type), instance)
+
+        expression = _TYPES.get(fn)
+        if expression is None:
+            raise ValueError(
+                "Cannot generate source for the %r type checker" % (type,),
+            )
+        return "(%s)" % (expression.format(instance),)
+
+    def function(self, schema, pushes=()):
+        """
+        Generate the function validating under the given (sub)schema.
+
+        """
+
+        resolver = self.validator.resolver
+
+        scope = schema.get(u"id")
+        if scope:
+            pushes += (scope,)
+
+        # Fragments in the scope don't affect how references resolve.
+        with _scopes(resolver, pushes):
+            key = id(schema), urldefrag(resolver.resolution_scope)[0]
+        name = self._names.get(key)
+        if name is not None:
+            return name
+
+        # Named before generating its body, so that recursive references
+        # find it.
+        name = self._names[key] = "_v%d" % (len(self._names),)
+        function = _Function(
+            name=name, schema=self.constant(schema), pushes=pushes,
+        )
+
+        out = _Writer()
+        ref = schema.get(u"$ref")
+        if ref is not None:
+            keywords = [(u"$ref", ref)]
+        else:
+            keywords = iteritems(schema)
+
+        for k, v in keywords:
+            fn = self.validator.VALIDATORS.get(k)
+            if fn is None:
+                continue
+            generate = _KEYWORDS.get(fn)
+            if generate is None:
+                raise ValueError(
+                    "Cannot generate source for the %r validator" % (k,),
+                )
+            generate(self, out, k, v, schema, function)
+
+        if not out.lines:
+            out.line("return ()")
+        self._functions.append(
+            "def %s(instance):\n%s" % (name, "\n".join(out.lines)),
+        )
+        return name
+
+    def error(self, out, k, v, function, message, **kwargs):
+        """
+        Write out yielding a new error for the ``k`` validator.
+
+        """
+
+        kwargs.setdefault("validator", _literal(k))
+        kwargs.setdefault("validator_value", self.constant(v))
+        kwargs.setdefault("instance", u"instance")
+        kwargs.setdefault("schema", function.schema)
+        kwargs.setdefault("schema_path", "(%s,)" % (_literal(k),))
+        arguments = ", ".join(
+            "%s=%s" % (each, kwargs[each]) for each in sorted(kwargs)
+        )
+        out.line("yield ValidationError(%s, %s)" % (message, arguments))
+
+    def descend(
+        self, out, k, function, instance, path=None, schema_path=None,
+    ):
+        """
+        Write out yielding the errors from ``function``, as ``descend`` does.
+
+        """
+
+        with out.block("for error in %s(%s):" % (function, instance)):
+            if path is not None:
+                out.line("error.path.appendleft(%s)" % (path,))
+            if schema_path is not None:
+                out.line(
+                    "error.schema_path.extendleft((%s, %s))" % (
+                        schema_path, _literal(k),
+                    ),
+                )
+            else:
+                out.line("error.schema_path.appendleft(%s)" % (_literal(k),))
+            out.line("yield error")
+
+    def set_details(self, out, k, v, function, errors):
+        """
+        Write out yielding ``errors``, as ``iter_errors`` does.
+
+        """
+
+        with out.block("for error in %s:" % (errors,)):
+            out.line(
+                "error._set(validator=%s, validator_value=%s, "
+                "instance=instance, schema=%s)" % (
+                    _literal(k), self.constant(v), function.schema,
+                ),
+            )
+            out.line("error.schema_path.appendleft(%s)" % (_literal(k),))
+            out.line("yield error")
+
+
+def _literal(value):
+    """
+    Retrieve Python source evaluating to the given JSON ``value``.
+
+    """
+
+    if isinstance(value, dict):
+        return "{%s}" % ", ".join(
+            "%s: %s" % (_literal(k), _literal(v)) for k, v in iteritems(value)
+        )
+    elif isinstance(value, list):
+        return "[%s]" % ", ".join(_literal(each) for each in value)
+    elif isinstance(value, tuple):
+        return "(%s)" % "".join(_literal(each) + ", " for each in value)
+    elif isinstance(value, float):
+        if math.isinf(value) or math.isnan(value):
+            return "float(%r)" % (repr(value),)
+        return repr(value)
+    elif value is None or isinstance(value, (bool, int_types, str_types)):
+        return repr(value)
+    elif not PY3 and isinstance(value, bytes):
+        return repr(value)
+    raise ValueError("Cannot generate source for %r" % (value,))
+
+
+def _message(template, *arguments):
+    """
+    Retrieve source creating a lazily formatted message.
+
+    """
+
+    return "_utils.Message(%s)" % (
+        ", ".join((_literal(template),) + arguments),
+    )
+
+
+def patternProperties(gen, out, k, patternProperties, schema, function):
+    with out.block("if %s:" % (gen.is_type(u"object"),)):
+        dispatched = gen.dispatch(out, schema, function)
+        for index, pattern in enumerate(patternProperties):
+            subfunction = gen.function(
+                patternProperties[pattern], function.pushes,
+            )
+            if dispatched is None:
+                with out.block("for key in instance:"):
+                    with out.block(
+                        "if %s.search(key):" % (gen.regex(pattern),),
+                    ):
+                        gen.descend(
+                            out, k, subfunction, u"instance[key]",
+                            path=u"key", schema_path=_literal(pattern),
+                        )
+                continue
+
+            with out.block("for key in %s[0][%d]:" % (dispatched, index)):
+                gen.descend(
+                    out, k, subfunction, u"instance[key]",
+                    path=u"key", schema_path=_literal(pattern),
+                )
+
+
+def additionalProperties(gen, out, k, aP, schema, function):
+    if not gen.validator.is_type(aP, u"object") and aP:
+        return
+
+    with out.block("if %s:" % (gen.is_type(u"object"),)):
+        dispatched = gen.dispatch(out, schema, function)
+        if dispatched is not None:
+            out.line("extras = set(%s[1])" % (dispatched,))
+        else:
+            properties = gen.constant(schema.get(u"properties", {}))
+            patterns = u"|".join(schema.get(u"patternProperties", {}))
+            condition = "property not in %s" % (properties,)
+            if patterns:
+                condition += " and not %s.search(property)" % (
+                    gen.regex(patterns),
+                )
+            out.line(
+                "extras = set(property for property in instance if %s)" % (
+                    condition,
+                ),
+            )
+
+        if gen.validator.is_type(aP, u"object"):
+            subfunction = gen.function(aP, function.pushes)
+            with out.block("for extra in extras:"):
+                gen.descend(
+                    out, k, subfunction, u"instance[extra]", path=u"extra",
+                )
+        elif u"patternProperties" in schema:
+            with out.block("if extras:"):
+                out.line(
+                    'verb = "does" if len(extras) == 1 else "do"',
+                )
+                regexes = ", ".join(
+                    map(repr, sorted(schema[u"patternProperties"])),
+                )
+                gen.error(
+                    out, k, aP, function, _message(
+                        "%s %s not match any of the regexes: %s",
+                        '", ".join(map(repr, sorted(extras)))',
+                        u"verb",
+                        _literal(regexes),
+                    ),
+                )
+        else:
+            with out.block("if extras:"):
+                gen.error(
+                    out, k, aP, function,
+                    '"Additional properties are not allowed (%s %s '
+                    'unexpected)" % _utils.extras_msg(extras)',
+                )
+
+
+def items(gen, out, k, items, schema, function):
+    with out.block("if %s:" % (gen.is_type(u"array"),)):
+        if gen.validator.is_type(items, u"object"):
+            subfunction = gen.function(items, function.pushes)
+            with out.block("for index, item in enumerate(instance):"):
+                gen.descend(out, k, subfunction, u"item", path=u"index")
+        else:
+            subfunctions = [
+                gen.function(each, function.pushes) for each in items
+            ]
+            with out.block(
+                "for (index, item), function in zip(enumerate(instance), "
+                "(%s)):" % ("".join(each + ", " for each in subfunctions),),
+            ):
+                gen.descend(
+                    out, k, u"function", u"item",
+                    path=u"index", schema_path=u"index",
+                )
+
+
+def additionalItems(gen, out, k, aI, schema, function):
+    if gen.validator.is_type(schema.get(u"items", {}), u"object"):
+        return
+
+    len_items = len(schema.get(u"items", []))
+    with out.block("if %s:" % (gen.is_type(u"array"),)):
+        if gen.validator.is_type(aI, u"object"):
+            subfunction = gen.function(aI, function.pushes)
+            with out.block(
+                "for index, item in enumerate(instance[%d:], start=%d):" % (
+                    len_items, len_items,
+                ),
+            ):
+                gen.descend(out, k, subfunction, u"item", path=u"index")
+        elif not aI:
+            with out.block("if len(instance) > %d:" % (len_items,)):
+                gen.error(
+                    out, k, aI, function,
+                    '"Additional items are not allowed (%%s %%s '
+                    'unexpected)" %% _utils.extras_msg(instance[%d:])' % (
+                        len_items,
+                    ),
+                )
+
+
+def minimum(gen, out, k, minimum, schema, function):
+    if schema.get(u"exclusiveMinimum", False):
+        operator, cmp = "<=", "less than or equal to"
+    else:
+        operator, cmp = "<", "less than"
+
+    with out.block(
+        "if %s and instance %s %s:" % (
+            gen.is_type(u"number"), operator, gen.constant(minimum),
+        ),
+    ):
+        gen.error(
+            out, k, minimum, function, _message(
+                "%r is %s the minimum of %r",
+                u"instance", _literal(cmp), gen.constant(minimum),
+            ),
+        )
+
+
+def maximum(gen, out, k, maximum, schema, function):
+    if schema.get(u"exclusiveMaximum", False):
+        operator, cmp = ">=", "greater than or equal to"
+    else:
+        operator, cmp = ">", "greater than"
+
+    with out.block(
+        "if %s and instance %s %s:" % (
+            gen.is_type(u"number"), operator, gen.constant(maximum),
+        ),
+    ):
+        gen.error(
+            out, k, maximum, function, _message(
+                "%r is %s the maximum of %r",
+                u"instance", _literal(cmp), gen.constant(maximum),
+            ),
+        )
+
+
+def multipleOf(gen, out, k, dB, schema, function):
+    message = _message(
+        "%r is not a multiple of %r", u"instance", gen.constant(dB),
+    )
+    with out.block("if %s:" % (gen.is_type(u"number"),)):
+        if isinstance(dB, float):
+            out.line("quotient = instance / %s" % (gen.constant(dB),))
+            condition = "int(quotient) != quotient"
+        else:
+            condition = "instance %% %s" % (gen.constant(dB),)
+        with out.block("if %s:" % (condition,)):
+            gen.error(out, k, dB, function, message)
+
+
+def _length(type, operator, message):
+    def length(gen, out, k, value, schema, function):
+        with out.block(
+            "if %s and len(instance) %s %s:" % (
+                gen.is_type(type), operator, gen.constant(value),
+            ),
+        ):
+            gen.error(out, k, value, function, _message(message, u"instance"))
+    return length
+
+
+minItems = _length(u"array", "<", "%r is too short")
+maxItems = _length(u"array", ">", "%r is too long")
+minLength = _length(u"string", "<", "%r is too short")
+maxLength = _length(u"string", ">", "%r is too long")
+minProperties_draft4 = _length(
+    u"object", "<", "%r does not have enough properties",
+)
+maxProperties_draft4 = _length(u"object", ">", "%r has too many properties")
+
+
+def uniqueItems(gen, out, k, uI, schema, function):
+    if not uI:
+        return
+
+    with out.block("if %s:" % (gen.is_type(u"array"),)):
+        out.line("duplicate = _utils.duplicate(instance)")
+        with out.block("if duplicate is not None:"):
+            gen.error(
+                out, k, uI, function,
+                _message(
+                    "%r has non-unique elements (items %d and %d are equal)",
+                    u"instance", u"duplicate[0]", u"duplicate[1]",
+                ),
+            )
+
+
+def pattern(gen, out, k, patrn, schema, function):
+    with out.block(
+        "if %s and not %s.search(instance):" % (
+            gen.is_type(u"string"), gen.regex(patrn),
+        ),
+    ):
+        gen.error(
+            out, k, patrn, function, _message(
+                "%r does not match %r", u"instance", gen.constant(patrn),
+            ),
+        )
+
+
+def format(gen, out, k, format, schema, function):
+    if gen.validator.format_checker is None:
+        return
+
+    with out.block("if format_checker is not None:"):
+        with out.block("try:"):
+            out.line(
+                "format_checker.check(instance, %s)" % (
+                    gen.constant(format),
+                ),
+            )
+        with out.block("except FormatError as error:"):
+            gen.error(
+                out, k, format, function, u"error.message",
+                cause=u"error.cause",
+            )
+
+
+def dependencies(gen, out, k, dependencies, schema, function):
+    with out.block("if %s:" % (gen.is_type(u"object"),)):
+        for property, dependency in iteritems(dependencies):
+            with out.block("if %s in instance:" % (_literal(property),)):
+                if gen.validator.is_type(dependency, u"object"):
+                    subfunction = gen.function(dependency, function.pushes)
+                    gen.descend(
+                        out, k, subfunction, u"instance",
+                        schema_path=_literal(property),
+                    )
+                    continue
+
+                for each in _utils.ensure_list(dependency):
+                    with out.block(
+                        "if %s not in instance:" % (_literal(each),),
+                    ):
+                        gen.error(
+                            out, k, dependencies, function, _message(
+                                "%r is a dependency of %r",
+                                _literal(each),
+                                _literal(property),
+                            ),
+                        )
+
+
+def enum(gen, out, k, enums, schema, function):
+    members = gen.constant(enums)
+    if _utils.worth_hashing(enums):
+        members = gen.assign("e", "_utils.Members(%s)" % (members,))
+    with out.block("if instance not in %s:" % (members,)):
+        gen.error(
+            out, k, enums, function, _message(
+                "%r is not one of %r", u"instance", gen.constant(enums),
+            ),
+        )
+
+
+def ref(gen, out, k, ref, schema, function):
+    resolver = gen.validator.resolver
+    with _scopes(resolver, function.pushes):
+        url, resolved = resolver.resolve(ref)
+    subfunction = gen.function(resolved, function.pushes + (url,))
+    out.line("return %s(instance)" % (subfunction,))
+
+
+def type_draft3(gen, out, k, types, schema, function):
+    checks = []
+    for index, type in enumerate(_utils.ensure_list(types)):
+        if type == u"any":
+            checks.append("(None, None)")
+        elif gen.validator.is_type(type, u"object"):
+            subfunction = gen.function(type, function.pushes)
+            checks.append("(%d, %s)" % (index, subfunction))
+        else:
+            checks.append(
+                "(None, lambda instance: %s)" % (gen.is_type(type),),
+            )
+
+    gen.set_details(
+        out, k, types, function, "_type_draft3(instance, %s, (%s))" % (
+            gen.constant(_utils.ensure_list(types)),
+            "".join(each + ", " for each in checks),
+        ),
+    )
+
+
+def properties_draft3(gen, out, k, properties, schema, function):
+    with out.block("if %s:" % (gen.is_type(u"object"),)):
+        for property, subschema in iteritems(properties):
+            subfunction = gen.function(subschema, function.pushes)
+            with out.block("if %s in instance:" % (_literal(property),)):
+                gen.descend(
+                    out, k, subfunction,
+                    u"instance[%s]" % (_literal(property),),
+                    path=_literal(property),
+                    schema_path=_literal(property),
+                )
+            if subschema.get(u"required", False):
+                with out.block("else:"):
+                    gen.error(
+                        out, k, properties, function,
+                        _message(
+                            "%r is a required property", _literal(property),
+                        ),
+                        validator=_literal(u"required"),
+                        validator_value=gen.constant(subschema[u"required"]),
+                        path="(%s,)" % (_literal(property),),
+                        schema_path="(%s, %s, %s)" % (
+                            _literal(k),
+                            _literal(property),
+                            _literal(u"required"),
+                        ),
+                    )
+
+
+def disallow_draft3(gen, out, k, disallow, schema, function):
+    for disallowed in _utils.ensure_list(disallow):
+        subfunction = gen.function({u"type": [disallowed]}, function.pushes)
+        with out.block("if _is_valid(%s(instance)):" % (subfunction,)):
+            gen.error(
+                out, k, disallow, function, _message(
+                    "%r is disallowed for %r",
+                    gen.constant(disallowed), u"instance",
+                ),
+            )
+
+
+def extends_draft3(gen, out, k, extends, schema, function):
+    if gen.validator.is_type(extends, u"object"):
+        subfunction = gen.function(extends, function.pushes)
+        gen.descend(out, k, subfunction, u"instance")
+        return
+
+    for index, subschema in enumerate(extends):
+        subfunction = gen.function(subschema, function.pushes)
+        gen.descend(out, k, subfunction, u"instance", schema_path=str(index))
+
+
+def type_draft4(gen, out, k, types, schema, function):
+    listed = _utils.ensure_list(types)
+    checks = " or ".join(gen.is_type(type) for type in listed) or "False"
+    with out.block("if not (%s):" % (checks,)):
+        gen.error(
+            out, k, types, function, "_utils.types_msg(instance, %s)" % (
+                gen.constant(listed),
+            ),
+        )
+
+
+def properties_draft4(gen, out, k, properties, schema, function):
+    with out.block("if %s:" % (gen.is_type(u"object"),)):
+        for property, subschema in iteritems(properties):
+            subfunction = gen.function(subschema, function.pushes)
+            with out.block("if %s in instance:" % (_literal(property),)):
+                gen.descend(
+                    out, k, subfunction,
+                    u"instance[%s]" % (_literal(property),),
+                    path=_literal(property),
+                    schema_path=_literal(property),
+                )
+
+
+def required_draft4(gen, out, k, required, schema, function):
+    with out.block("if %s:" % (gen.is_type(u"object"),)):
+        for property in required:
+            with out.block("if %s not in instance:" % (_literal(property),)):
+                gen.error(
+                    out, k, required, function,
+                    _message(
+                        "%r is a required property", _literal(property),
+                    ),
+                )
+
+
+def allOf_draft4(gen, out, k, allOf, schema, function):
+    for index, subschema in enumerate(allOf):
+        subfunction = gen.function(subschema, function.pushes)
+        gen.descend(out, k, subfunction, u"instance", schema_path=str(index))
+
+
+def oneOf_draft4(gen, out, k, oneOf, schema, function):
+    subschemas = "".join(
+        "(%d, %s, %s), " % (
+            index,
+            gen.function(subschema, function.pushes),
+            gen.constant(subschema),
+        ) for index, subschema in enumerate(oneOf)
+    )
+    gen.set_details(
+        out, k, oneOf, function,
+        "_oneOf_draft4(instance, (%s))" % (subschemas,),
+    )
+
+
+def anyOf_draft4(gen, out, k, anyOf, schema, function):
+    functions = "".join(
+        gen.function(subschema, function.pushes) + ", " for subschema in anyOf
+    )
+    gen.set_details(
+        out, k, anyOf, function,
+        "_anyOf_draft4(instance, (%s))" % (functions,),
+    )
+
+
+def not_draft4(gen, out, k, not_schema, schema, function):
+    subfunction = gen.function(not_schema, function.pushes)
+    with out.block("if _is_valid(%s(instance)):" % (subfunction,)):
+        gen.error(
+            out, k, not_schema, function, _message(
+                "%r is not allowed for %r",
+                gen.constant(not_schema), u"instance",
+            ),
+        )
+
+
+_KEYWORDS = {
+    _validators.additionalItems: additionalItems,
+    _validators.additionalProperties: additionalProperties,
+    _validators.allOf_draft4: allOf_draft4,
+    _validators.anyOf_draft4: anyOf_draft4,
+    _validators.dependencies: dependencies,
+    _validators.disallow_draft3: disallow_draft3,
+    _validators.enum: enum,
+    _validators.extends_draft3: extends_draft3,
+    _validators.format: format,
+    _validators.items: items,
+    _validators.maxItems: maxItems,
+    _validators.maxLength: maxLength,
+    _validators.maxProperties_draft4: maxProperties_draft4,
+    _validators.maximum: maximum,
+    _validators.minItems: minItems,
+    _validators.minLength: minLength,
+    _validators.minProperties_draft4: minProperties_draft4,
+    _validators.minimum: minimum,
+    _validators.multipleOf: multipleOf,
+    _validators.not_draft4: not_draft4,
+    _validators.oneOf_draft4: oneOf_draft4,
+    _validators.pattern: pattern,
+    _validators.patternProperties: patternProperties,
+    _validators.properties_draft3: properties_draft3,
+    _validators.properties_draft4: properties_draft4,
+    _validators.ref: ref,
+    _validators.required_draft4: required_draft4,
+    _validators.type_draft3: type_draft3,
+    _validators.type_draft4: type_draft4,
+    _validators.uniqueItems: uniqueItems,
+}
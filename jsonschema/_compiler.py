@@ -0,0 +1,861 @@
+"""
+Compilation of schemas into trees of pre-bound callables.
+
+A compiled schema does, once and ahead of time, the work that
+``iter_errors`` otherwise repeats for every instance it sees -- looking up
+the validator function for each keyword, finding the type checking function
+for each type name, and computing the resolution scope of each subschema --
+leaving only the traversal of the instance itself at validation time.
+
+"""
+import contextlib
+import functools
+import operator
+import re
+
+from jsonschema import _utils, _validators
+from jsonschema.compat import iteritems
+from jsonschema.exceptions import FormatError, UnknownType, ValidationError
+
+
+class CompiledValidator(object):
+    """
+    A validator whose schema has been compiled ahead of time.
+
+    Produces the same errors as the `IValidator` it was compiled from, but
+    does not re-examine the schema on every call.
+
+    Don't instantiate this directly, use `IValidator.compile`.
+
+    """
+
+    def __init__(self, validator):
+        self.validator = validator
+        self.schema = validator.schema
+        self._compiler = _Compiler(validator)
+        self._root = self._compiler.node(self.schema)
+
+    def __repr__(self):
+        return "<%s for %r>" % (self.__class__.__name__, self.validator)
+
+    def iter_errors(self, instance):
+        """
+        Lazily yield each of the validation errors in the given instance.
+
+        """
+
+        validator = self.validator
+        return _utils.limit_errors(
+            self._root.iter_errors(instance),
+            max_errors=validator.max_errors,
+            max_errors_per_path=validator.max_errors_per_path,
+        )
+
+    def is_valid(self, instance):
+        """
+        Check if the instance is valid under the compiled schema.
+
+        """
+
+        return self._root.is_valid(instance)
+
+    def validate(self, instance):
+        """
+        Check if the instance is valid under the compiled schema.
+
+        Raises:
+
+            `jsonschema.exceptions.ValidationError` if the instance
+                is invalid
+
+        """
+
+        for error in self.iter_errors(instance):
+            raise error
+
+
+class _Node(object):
+    """
+    A compiled (sub)schema.
+
+    ``pushes`` are the scopes that the interpreted validator would have pushed
+    onto the resolver by the time it reached this subschema, and are replayed
+    whenever a keyword needs the resolver to be in the right scope.
+
+    """
+
+    def __init__(self, schema, pushes):
+        self.schema = schema
+        self.pushes = pushes
+        self.checks = []
+
+        # patternProperties and additionalProperties share one walk of each
+        # object's properties, done (by ``dispatch``) once per call, and
+        # passed to each of the checks in ``dispatching``.
+        self.dispatcher = None
+        self.dispatch = None
+        self.dispatching = set()
+
+    def iter_errors(self, instance):
+        schema, dispatching = self.schema, self.dispatching
+        dispatched = None
+        for k, v, check in self.checks:
+            if dispatching and check in dispatching:
+                if dispatched is None:
+                    dispatched = self.dispatch(instance)
+                errors = check(instance, dispatched)
+            else:
+                errors = check(instance)
+            if errors is None:
+                continue
+
+            for error in errors:
+                # set details if not already set by the called fn
+                error._set(
+                    validator=k,
+                    validator_value=v,
+                    instance=instance,
+                    schema=schema,
+                )
+                if k != u"$ref":
+                    error.schema_path.appendleft(k)
+                yield error
+
+    def descend(self, instance, path=None, schema_path=None):
+        for error in self.iter_errors(instance):
+            if path is not None:
+                error.path.appendleft(path)
+            if schema_path is not None:
+                error.schema_path.appendleft(schema_path)
+            yield error
+
+    def is_valid(self, instance):
+        return next(self.iter_errors(instance), None) is None
+
+
+class _Compiler(object):
+    def __init__(self, validator):
+        self.validator = validator
+        self._nodes = {}
+        self._type_checks = {}
+
+    def node(self, schema, pushes=()):
+        """
+        Compile the given subschema, reached after the given scope ``pushes``.
+
+        """
+
+        resolver = self.validator.resolver
+
+        scope = schema.get(u"id")
+        if scope:
+            pushes += (scope,)
+
+        with _scopes(resolver, pushes):
+            key = id(schema), resolver.resolution_scope
+        node = self._nodes.get(key)
+        if node is not None:
+            return node
+
+        # Registered before compiling its keywords, so that recursive
+        # references find it.
+        node = self._nodes[key] = _Node(schema=schema, pushes=pushes)
+
+        ref = schema.get(u"$ref")
+        if ref is not None:
+            keywords = [(u"$ref", ref)]
+        else:
+            keywords = iteritems(schema)
+
+        for k, v in keywords:
+            fn = self.validator.VALIDATORS.get(k)
+            if fn is None:
+                continue
+            check = self.keyword(fn, v, schema, node)
+            if check is not None:
+                node.checks.append((k, v, check))
+        return node
+
+    def keyword(self, fn, value, schema, node):
+        """
+        Compile a single keyword, falling back to calling ``fn`` as-is.
+
+        Returns ``None`` for keywords which can never produce errors.
+
+        """
+
+        compile_keyword = _KEYWORDS.get(fn)
+        if compile_keyword is not None:
+            try:
+                return compile_keyword(self, value, schema, node)
+            except (UnknownType, re.error):
+                # Let the interpreted validator function complain about
+                # these, at the point it would have complained anyhow.
+                pass
+        return _fallback(self, fn, value, schema, node)
+
+    def is_type(self, type):
+        """
+        Retrieve a function checking whether instances are of ``type``.
+
+        """
+
+        is_type = self._type_checks.get(type)
+        if is_type is None:
+            checker = self.validator.TYPE_CHECKER
+            fn = checker._checks.get(type)
+            if fn is None:
+                is_type = _unknown_type(type, self.validator.schema)
+            else:
+                is_type = functools.partial(fn, checker)
+            self._type_checks[type] = is_type
+        return is_type
+
+    def resolve(self, node, ref):
+        """
+        Resolve ``ref`` from within ``node`` and compile what it refers to.
+
+        """
+
+        resolver = self.validator.resolver
+        with _scopes(resolver, node.pushes):
+            url, resolved = resolver.resolve(ref)
+        return self.node(resolved, node.pushes + (url,))
+
+
+@contextlib.contextmanager
+def _scopes(resolver, pushes):
+    for scope in pushes:
+        resolver.push_scope(scope)
+    try:
+        yield
+    finally:
+        for _ in pushes:
+            resolver.pop_scope()
+
+
+def _unknown_type(type, schema):
+    def is_type(instance):
+        raise UnknownType(type, instance, schema)
+    return is_type
+
+
+def _fallback(compiler, fn, value, schema, node):
+    validator = compiler.validator
+    resolver = validator.resolver
+    pushes = node.pushes
+
+    def fallback(instance):
+        with _scopes(resolver, pushes):
+            for error in fn(validator, value, instance, schema) or ():
+                yield error
+    return fallback
+
+
+def _dispatcher(compiler, schema, node):
+    """
+    Retrieve the node's `_utils.PropertyDispatcher`, creating it if needed.
+
+    Checks which use what it sorts out need adding to ``node.dispatching``.
+
+    """
+
+    if node.dispatcher is None:
+        dispatcher = _utils.PropertyDispatcher(
+            schema, compiler.validator.regex_cache,
+        )
+        is_object = compiler.is_type(u"object")
+
+        def dispatch(instance):
+            if is_object(instance):
+                return dispatcher.dispatch(instance)
+
+        node.dispatcher, node.dispatch = dispatcher, dispatch
+    return node.dispatcher
+
+
+def patternProperties(compiler, patternProperties, schema, node):
+    dispatcher = _dispatcher(compiler, schema, node)
+    subnodes = [
+        compiler.node(patternProperties[pattern], node.pushes)
+        for pattern in dispatcher.patterns
+    ]
+    patterns = list(zip(dispatcher.patterns, subnodes))
+
+    def patternProperties(instance, dispatched):
+        if dispatched is None:
+            return
+
+        matches, _ = dispatched
+        for (pattern, subnode), matched in zip(patterns, matches):
+            for k in matched:
+                for error in subnode.descend(
+                    instance[k], path=k, schema_path=pattern,
+                ):
+                    yield error
+    node.dispatching.add(patternProperties)
+    return patternProperties
+
+
+def additionalProperties(compiler, aP, schema, node):
+    validator = compiler.validator
+    if not validator.is_type(aP, u"object") and aP:
+        return None
+
+    _dispatcher(compiler, schema, node)
+    if validator.is_type(aP, u"object"):
+        subnode = compiler.node(aP, node.pushes)
+
+        def additionalProperties(instance, dispatched):
+            if dispatched is None:
+                return
+
+            _, extras = dispatched
+            for extra in set(extras):
+                for error in subnode.descend(instance[extra], path=extra):
+                    yield error
+    else:
+        def additionalProperties(instance, dispatched):
+            if dispatched is None:
+                return
+            _, extras = dispatched
+            if extras:
+                return _validators.additionalProperties(
+                    validator, aP, instance, schema,
+                )
+    node.dispatching.add(additionalProperties)
+    return additionalProperties
+
+
+def items(compiler, items, schema, node):
+    is_array = compiler.is_type(u"array")
+
+    if compiler.validator.is_type(items, u"object"):
+        subnode = compiler.node(items, node.pushes)
+
+        def items(instance):
+            if not is_array(instance):
+                return
+
+            for index, item in enumerate(instance):
+                for error in subnode.descend(item, path=index):
+                    yield error
+    else:
+        subnodes = [compiler.node(each, node.pushes) for each in items]
+
+        def items(instance):
+            if not is_array(instance):
+                return
+
+            for (index, item), subnode in zip(enumerate(instance), subnodes):
+                for error in subnode.descend(
+                    item, path=index, schema_path=index,
+                ):
+                    yield error
+    return items
+
+
+def additionalItems(compiler, aI, schema, node):
+    validator = compiler.validator
+    if validator.is_type(schema.get(u"items", {}), u"object"):
+        return
+
+    is_array = compiler.is_type(u"array")
+    len_items = len(schema.get(u"items", []))
+
+    if validator.is_type(aI, u"object"):
+        subnode = compiler.node(aI, node.pushes)
+
+        def additionalItems(instance):
+            if not is_array(instance):
+                return
+
+            rest = instance[len_items:]
+            for index, item in enumerate(rest, start=len_items):
+                for error in subnode.descend(item, path=index):
+                    yield error
+        return additionalItems
+    elif not aI:
+        def additionalItems(instance):
+            if is_array(instance) and len(instance) > len_items:
+                return _validators.additionalItems(
+                    validator, aI, instance, schema,
+                )
+        return additionalItems
+
+
+def minimum(compiler, minimum, schema, node):
+    validator = compiler.validator
+    is_number = compiler.is_type(u"number")
+    if schema.get(u"exclusiveMinimum", False):
+        failed = operator.le
+    else:
+        failed = operator.lt
+
+    def check(instance):
+        if is_number(instance) and failed(instance, minimum):
+            return _validators.minimum(validator, minimum, instance, schema)
+    return check
+
+
+def maximum(compiler, maximum, schema, node):
+    validator = compiler.validator
+    is_number = compiler.is_type(u"number")
+    if schema.get(u"exclusiveMaximum", False):
+        failed = operator.ge
+    else:
+        failed = operator.gt
+
+    def check(instance):
+        if is_number(instance) and failed(instance, maximum):
+            return _validators.maximum(validator, maximum, instance, schema)
+    return check
+
+
+def multipleOf(compiler, dB, schema, node):
+    validator = compiler.validator
+    is_number = compiler.is_type(u"number")
+
+    if isinstance(dB, float):
+        def failed(instance):
+            quotient = instance / dB
+            return int(quotient) != quotient
+    else:
+        def failed(instance):
+            return instance % dB
+
+    def multipleOf(instance):
+        if is_number(instance) and failed(instance):
+            return _validators.multipleOf(validator, dB, instance, schema)
+    return multipleOf
+
+
+def minItems(compiler, mI, schema, node):
+    validator = compiler.validator
+    is_array = compiler.is_type(u"array")
+
+    def minItems(instance):
+        if is_array(instance) and len(instance) < mI:
+            return _validators.minItems(validator, mI, instance, schema)
+    return minItems
+
+
+def maxItems(compiler, mI, schema, node):
+    validator = compiler.validator
+    is_array = compiler.is_type(u"array")
+
+    def maxItems(instance):
+        if is_array(instance) and len(instance) > mI:
+            return _validators.maxItems(validator, mI, instance, schema)
+    return maxItems
+
+
+def uniqueItems(compiler, uI, schema, node):
+    if not uI:
+        return
+
+    validator = compiler.validator
+    is_array = compiler.is_type(u"array")
+
+    def uniqueItems(instance):
+        if is_array(instance) and not _utils.uniq(instance):
+            return _validators.uniqueItems(validator, uI, instance, schema)
+    return uniqueItems
+
+
+def pattern(compiler, patrn, schema, node):
+    validator = compiler.validator
+    is_string = compiler.is_type(u"string")
+    search = validator.regex_cache(patrn).search
+
+    def pattern(instance):
+        if is_string(instance) and not search(instance):
+            return _validators.pattern(validator, patrn, instance, schema)
+    return pattern
+
+
+def format(compiler, format, schema, node):
+    format_checker = compiler.validator.format_checker
+    if format_checker is None:
+        return
+
+    def check(instance):
+        try:
+            format_checker.check(instance, format)
+        except FormatError as error:
+            return [ValidationError(error.message, cause=error.cause)]
+    return check
+
+
+def minLength(compiler, mL, schema, node):
+    validator = compiler.validator
+    is_string = compiler.is_type(u"string")
+
+    def minLength(instance):
+        if is_string(instance) and len(instance) < mL:
+            return _validators.minLength(validator, mL, instance, schema)
+    return minLength
+
+
+def maxLength(compiler, mL, schema, node):
+    validator = compiler.validator
+    is_string = compiler.is_type(u"string")
+
+    def maxLength(instance):
+        if is_string(instance) and len(instance) > mL:
+            return _validators.maxLength(validator, mL, instance, schema)
+    return maxLength
+
+
+def dependencies(compiler, dependencies, schema, node):
+    is_object = compiler.is_type(u"object")
+
+    compiled = []
+    for property, dependency in iteritems(dependencies):
+        if compiler.validator.is_type(dependency, u"object"):
+            subnode = compiler.node(dependency, node.pushes)
+            compiled.append((property, subnode, ()))
+        else:
+            compiled.append((property, None, _utils.ensure_list(dependency)))
+
+    def dependencies(instance):
+        if not is_object(instance):
+            return
+
+        for property, subnode, required in compiled:
+            if property not in instance:
+                continue
+
+            if subnode is not None:
+                for error in subnode.descend(instance, schema_path=property):
+                    yield error
+            else:
+                for dependency in required:
+                    if dependency not in instance:
+                        yield ValidationError(
+                            _utils.Message(
+                                "%r is a dependency of %r",
+                                dependency,
+                                property,
+                            ),
+                        )
+    return dependencies
+
+
+def enum(compiler, enums, schema, node):
+    validator = compiler.validator
+    if _utils.worth_hashing(enums):
+        members = _utils.Members(enums)
+    else:
+        members = enums
+
+    def enum(instance):
+        if instance not in members:
+            return _validators.enum(validator, enums, instance, schema)
+    return enum
+
+
+def ref(compiler, ref, schema, node):
+    if getattr(compiler.validator.resolver, "resolve", None) is None:
+        # Legacy resolvers only know how to resolve within a context manager
+        return _fallback(compiler, _validators.ref, ref, schema, node)
+
+    resolved = []
+
+    def check(instance):
+        if not resolved:
+            resolved.append(compiler.resolve(node, ref))
+        return resolved[0].iter_errors(instance)
+    return check
+
+
+def type_draft3(compiler, types, schema, node):
+    types = _utils.ensure_list(types)
+
+    compiled = []
+    for index, type in enumerate(types):
+        if type == u"any":
+            compiled.append((None, None))
+        elif compiler.validator.is_type(type, u"object"):
+            compiled.append((index, compiler.node(type, node.pushes)))
+        else:
+            compiled.append((None, compiler.is_type(type)))
+
+    limit = compiler.validator.max_context_errors
+
+    def type_draft3(instance):
+        all_errors = []
+        for index, check in compiled:
+            if check is None:
+                return
+            elif index is not None:
+                errors = check.descend(instance, schema_path=index)
+                if not _utils.extend_context(all_errors, errors, limit):
+                    return
+            elif check(instance):
+                return
+        return [
+            ValidationError(
+                _utils.types_msg(instance, types), context=all_errors,
+            ),
+        ]
+    return type_draft3
+
+
+def properties_draft3(compiler, properties, schema, node):
+    is_object = compiler.is_type(u"object")
+    compiled = [
+        (property, subschema, compiler.node(subschema, node.pushes))
+        for property, subschema in iteritems(properties)
+    ]
+
+    def properties_draft3(instance):
+        if not is_object(instance):
+            return
+
+        for property, subschema, subnode in compiled:
+            if property in instance:
+                for error in subnode.descend(
+                    instance[property],
+                    path=property,
+                    schema_path=property,
+                ):
+                    yield error
+            elif subschema.get(u"required", False):
+                error = ValidationError(
+                    _utils.Message("%r is a required property", property),
+                )
+                error._set(
+                    validator=u"required",
+                    validator_value=subschema[u"required"],
+                    instance=instance,
+                    schema=schema,
+                )
+                error.path.appendleft(property)
+                error.schema_path.extend([property, u"required"])
+                yield error
+    return properties_draft3
+
+
+def disallow_draft3(compiler, disallow, schema, node):
+    compiled = [
+        (disallowed, compiler.node({u"type": [disallowed]}, node.pushes))
+        for disallowed in _utils.ensure_list(disallow)
+    ]
+
+    def disallow_draft3(instance):
+        for disallowed, subnode in compiled:
+            if subnode.is_valid(instance):
+                yield ValidationError(
+                    _utils.Message(
+                        "%r is disallowed for %r", disallowed, instance,
+                    ),
+                )
+    return disallow_draft3
+
+
+def extends_draft3(compiler, extends, schema, node):
+    if compiler.validator.is_type(extends, u"object"):
+        subnode = compiler.node(extends, node.pushes)
+
+        def extends_draft3(instance):
+            return subnode.descend(instance)
+        return extends_draft3
+
+    subnodes = [compiler.node(subschema, node.pushes) for subschema in extends]
+
+    def extends_draft3(instance):
+        for index, subnode in enumerate(subnodes):
+            for error in subnode.descend(instance, schema_path=index):
+                yield error
+    return extends_draft3
+
+
+def type_draft4(compiler, types, schema, node):
+    validator = compiler.validator
+    checks = [compiler.is_type(type) for type in _utils.ensure_list(types)]
+
+    def type_draft4(instance):
+        for is_type in checks:
+            if is_type(instance):
+                return
+        return _validators.type_draft4(validator, types, instance, schema)
+    return type_draft4
+
+
+def properties_draft4(compiler, properties, schema, node):
+    is_object = compiler.is_type(u"object")
+    compiled = [
+        (property, compiler.node(subschema, node.pushes))
+        for property, subschema in iteritems(properties)
+    ]
+
+    def properties_draft4(instance):
+        if not is_object(instance):
+            return
+
+        for property, subnode in compiled:
+            if property in instance:
+                for error in subnode.descend(
+                    instance[property],
+                    path=property,
+                    schema_path=property,
+                ):
+                    yield error
+    return properties_draft4
+
+
+def required_draft4(compiler, required, schema, node):
+    validator = compiler.validator
+    is_object = compiler.is_type(u"object")
+
+    def required_draft4(instance):
+        if not is_object(instance):
+            return
+        for property in required:
+            if property not in instance:
+                return _validators.required_draft4(
+                    validator, required, instance, schema,
+                )
+    return required_draft4
+
+
+def minProperties_draft4(compiler, mP, schema, node):
+    validator = compiler.validator
+    is_object = compiler.is_type(u"object")
+
+    def minProperties_draft4(instance):
+        if is_object(instance) and len(instance) < mP:
+            return _validators.minProperties_draft4(
+                validator, mP, instance, schema,
+            )
+    return minProperties_draft4
+
+
+def maxProperties_draft4(compiler, mP, schema, node):
+    validator = compiler.validator
+    is_object = compiler.is_type(u"object")
+
+    def maxProperties_draft4(instance):
+        if is_object(instance) and len(instance) > mP:
+            return _validators.maxProperties_draft4(
+                validator, mP, instance, schema,
+            )
+    return maxProperties_draft4
+
+
+def allOf_draft4(compiler, allOf, schema, node):
+    subnodes = [compiler.node(subschema, node.pushes) for subschema in allOf]
+
+    def allOf_draft4(instance):
+        for index, subnode in enumerate(subnodes):
+            for error in subnode.descend(instance, schema_path=index):
+                yield error
+    return allOf_draft4
+
+
+def oneOf_draft4(compiler, oneOf, schema, node):
+    subnodes = [compiler.node(subschema, node.pushes) for subschema in oneOf]
+    limit = compiler.validator.max_context_errors
+
+    def oneOf_draft4(instance):
+        remaining = enumerate(subnodes)
+        all_errors = []
+        for index, subnode in remaining:
+            errs = subnode.descend(instance, schema_path=index)
+            if not _utils.extend_context(all_errors, errs, limit):
+                first_valid = subnode.schema
+                break
+        else:
+            yield ValidationError(
+                _utils.Message(
+                    "%r is not valid under any of the given schemas",
+                    instance,
+                ),
+                context=all_errors,
+            )
+
+        more_valid = [
+            subnode.schema
+            for _, subnode in remaining if subnode.is_valid(instance)
+        ]
+        if more_valid:
+            more_valid.append(first_valid)
+            reprs = ", ".join(repr(schema) for schema in more_valid)
+            yield ValidationError(
+                _utils.Message(
+                    "%r is valid under each of %s", instance, reprs,
+                ),
+            )
+    return oneOf_draft4
+
+
+def anyOf_draft4(compiler, anyOf, schema, node):
+    subnodes = [compiler.node(subschema, node.pushes) for subschema in anyOf]
+    limit = compiler.validator.max_context_errors
+
+    def anyOf_draft4(instance):
+        all_errors = []
+        for index, subnode in enumerate(subnodes):
+            errs = subnode.descend(instance, schema_path=index)
+            if not _utils.extend_context(all_errors, errs, limit):
+                return
+        return [
+            ValidationError(
+                _utils.Message(
+                    "%r is not valid under any of the given schemas",
+                    instance,
+                ),
+                context=all_errors,
+            ),
+        ]
+    return anyOf_draft4
+
+
+def not_draft4(compiler, not_schema, schema, node):
+    subnode = compiler.node(not_schema, node.pushes)
+
+    def not_draft4(instance):
+        if subnode.is_valid(instance):
+            return [
+                ValidationError(
+                    _utils.Message(
+                        "%r is not allowed for %r", not_schema, instance,
+                    ),
+                ),
+            ]
+    return not_draft4
+
+
+_KEYWORDS = {
+    _validators.additionalItems: additionalItems,
+    _validators.additionalProperties: additionalProperties,
+    _validators.allOf_draft4: allOf_draft4,
+    _validators.anyOf_draft4: anyOf_draft4,
+    _validators.dependencies: dependencies,
+    _validators.disallow_draft3: disallow_draft3,
+    _validators.enum: enum,
+    _validators.extends_draft3: extends_draft3,
+    _validators.format: format,
+    _validators.items: items,
+    _validators.maxItems: maxItems,
+    _validators.maxLength: maxLength,
+    _validators.maxProperties_draft4: maxProperties_draft4,
+    _validators.maximum: maximum,
+    _validators.minItems: minItems,
+    _validators.minLength: minLength,
+    _validators.minProperties_draft4: minProperties_draft4,
+    _validators.minimum: minimum,
+    _validators.multipleOf: multipleOf,
+    _validators.not_draft4: not_draft4,
+    _validators.oneOf_draft4: oneOf_draft4,
+    _validators.pattern: pattern,
+    _validators.patternProperties: patternProperties,
+    _validators.properties_draft3: properties_draft3,
+    _validators.properties_draft4: properties_draft4,
+    _validators.ref: ref,
+    _validators.required_draft4: required_draft4,
+    _validators.type_draft3: type_draft3,
+    _validators.type_draft4: type_draft4,
+    _validators.uniqueItems: uniqueItems,
+}
@@ -0,0 +1,303 @@
+"""
+Boolean forms of the validator functions in `jsonschema._validators`.
+
+Each of these takes the same arguments as the validator function of the
+same name, but rather than yielding errors, returns whether the instance is
+valid, so that checking validity never needs to create (and format the
+messages of) errors which are immediately thrown away.
+
+"""
+from jsonschema import _utils, _validators
+from jsonschema.compat import iteritems
+
+
+def patternProperties(
+    validator, patternProperties, instance, schema, types=None,
+):
+    if types is None and not validator.is_type(instance, "object"):
+        return True
+
+    for pattern, subschema in iteritems(patternProperties):
+        search = validator.regex_cache(pattern).search
+        for k, v in iteritems(instance):
+            if search(k) and not validator.is_valid(v, subschema):
+                return False
+    return True
+
+
+def additionalProperties(validator, aP, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "object"):
+        return True
+
+    extras = _utils.find_additional_properties(
+        instance, schema, regex_cache=validator.regex_cache,
+    )
+
+    if validator.is_type(aP, "object"):
+        return all(validator.is_valid(instance[extra], aP) for extra in extras)
+    elif not aP:
+        return next(extras, None) is None
+    return True
+
+
+def items(validator, items, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "array"):
+        return True
+
+    if validator.is_type(items, "object"):
+        return all(validator.is_valid(item, items) for item in instance)
+    return all(
+        validator.is_valid(item, subschema)
+        for item, subschema in zip(instance, items)
+    )
+
+
+def additionalItems(validator, aI, instance, schema, types=None):
+    if (
+        (types is None and not validator.is_type(instance, "array")) or
+        validator.is_type(schema.get("items", {}), "object")
+    ):
+        return True
+
+    len_items = len(schema.get("items", []))
+    if validator.is_type(aI, "object"):
+        return all(
+            validator.is_valid(item, aI) for item in instance[len_items:]
+        )
+    return aI or len(instance) <= len_items
+
+
+def minimum(validator, minimum, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "number"):
+        return True
+
+    if schema.get("exclusiveMinimum", False):
+        return not instance <= minimum
+    return not instance < minimum
+
+
+def maximum(validator, maximum, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "number"):
+        return True
+
+    if schema.get("exclusiveMaximum", False):
+        return not instance >= maximum
+    return not instance > maximum
+
+
+def multipleOf(validator, dB, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "number"):
+        return True
+
+    if isinstance(dB, float):
+        quotient = instance / dB
+        return not int(quotient) != quotient
+    return not instance % dB
+
+
+def minItems(validator, mI, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "array"):
+        return True
+    return len(instance) >= mI
+
+
+def maxItems(validator, mI, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "array"):
+        return True
+    return len(instance) <= mI
+
+
+def uniqueItems(validator, uI, instance, schema, types=None):
+    return (
+        not uI or
+        (types is None and not validator.is_type(instance, "array")) or
+        _utils.uniq(instance)
+    )
+
+
+def pattern(validator, patrn, instance, schema, types=None):
+    return (
+        (types is None and not validator.is_type(instance, "string")) or
+        validator.regex_cache(patrn).search(instance) is not None
+    )
+
+
+def format(validator, format, instance, schema):
+    return (
+        validator.format_checker is None or
+        validator.format_checker.conforms(instance, format)
+    )
+
+
+def minLength(validator, mL, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "string"):
+        return True
+    return len(instance) >= mL
+
+
+def maxLength(validator, mL, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "string"):
+        return True
+    return len(instance) <= mL
+
+
+def dependencies(validator, dependencies, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "object"):
+        return True
+
+    for property, dependency in iteritems(dependencies):
+        if property not in instance:
+            continue
+
+        if validator.is_type(dependency, "object"):
+            if not validator.is_valid(instance, dependency):
+                return False
+        else:
+            for each in _utils.ensure_list(dependency):
+                if each not in instance:
+                    return False
+    return True
+
+
+def enum(validator, enums, instance, schema):
+    return instance in _utils.members(validator, enums)
+
+
+def ref(validator, ref, instance, schema):
+    resolve = getattr(validator.resolver, "resolve", None)
+    if resolve is None:
+        with validator.resolver.resolving(ref) as resolved:
+            return validator.is_valid(instance, resolved)
+
+    scope, resolved = _utils.resolve_ref(validator.resolver, ref, schema)
+    validator.resolver.push_scope(scope)
+    try:
+        return validator.is_valid(instance, resolved)
+    finally:
+        validator.resolver.pop_scope()
+
+
+def type_draft3(validator, types, instance, schema):
+    for type in _utils.ensure_list(types):
+        if type == "any":
+            return True
+        if validator.is_type(type, "object"):
+            if validator.is_valid(instance, type):
+                return True
+        elif validator.is_type(instance, type):
+            return True
+    return False
+
+
+def properties_draft3(validator, properties, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "object"):
+        return True
+
+    for property, subschema in iteritems(properties):
+        if property in instance:
+            if not validator.is_valid(instance[property], subschema):
+                return False
+        elif subschema.get("required", False):
+            return False
+    return True
+
+
+def disallow_draft3(validator, disallow, instance, schema):
+    return not any(
+        validator.is_valid(instance, {"type": [disallowed]})
+        for disallowed in _utils.ensure_list(disallow)
+    )
+
+
+def extends_draft3(validator, extends, instance, schema):
+    if validator.is_type(extends, "object"):
+        return validator.is_valid(instance, extends)
+    return all(validator.is_valid(instance, each) for each in extends)
+
+
+def type_draft4(validator, types, instance, schema):
+    return any(
+        validator.is_type(instance, type)
+        for type in _utils.ensure_list(types)
+    )
+
+
+def properties_draft4(validator, properties, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "object"):
+        return True
+
+    return all(
+        validator.is_valid(instance[property], subschema)
+        for property, subschema in iteritems(properties)
+        if property in instance
+    )
+
+
+def required_draft4(validator, required, instance, schema, types=None):
+    return (
+        (types is None and not validator.is_type(instance, "object")) or
+        all(property in instance for property in required)
+    )
+
+
+def minProperties_draft4(validator, mP, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "object"):
+        return True
+    return len(instance) >= mP
+
+
+def maxProperties_draft4(validator, mP, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "object"):
+        return True
+    return len(instance) <= mP
+
+
+def allOf_draft4(validator, allOf, instance, schema):
+    return all(validator.is_valid(instance, each) for each in allOf)
+
+
+def oneOf_draft4(validator, oneOf, instance, schema):
+    valid = (each for each in oneOf if validator.is_valid(instance, each))
+    return next(valid, None) is not None and next(valid, None) is None
+
+
+def anyOf_draft4(validator, anyOf, instance, schema):
+    return any(validator.is_valid(instance, each) for each in anyOf)
+
+
+def not_draft4(validator, not_schema, instance, schema):
+    return not validator.is_valid(instance, not_schema)
+
+
+PREDICATES = {
+    _validators.additionalItems: additionalItems,
+    _validators.additionalProperties: additionalProperties,
+    _validators.allOf_draft4: allOf_draft4,
+    _validators.anyOf_draft4: anyOf_draft4,
+    _validators.dependencies: dependencies,
+    _validators.disallow_draft3: disallow_draft3,
+    _validators.enum: enum,
+    _validators.extends_draft3: extends_draft3,
+    _validators.format: format,
+    _validators.items: items,
+    _validators.maxItems: maxItems,
+    _validators.maxLength: maxLength,
+    _validators.maxProperties_draft4: maxProperties_draft4,
+    _validators.maximum: maximum,
+    _validators.minItems: minItems,
+    _validators.minLength: minLength,
+    _validators.minProperties_draft4: minProperties_draft4,
+    _validators.minimum: minimum,
+    _validators.multipleOf: multipleOf,
+    _validators.not_draft4: not_draft4,
+    _validators.oneOf_draft4: oneOf_draft4,
+    _validators.pattern: pattern,
+    _validators.patternProperties: patternProperties,
+    _validators.properties_draft3: properties_draft3,
+    _validators.properties_draft4: properties_draft4,
+    _validators.ref: ref,
+    _validators.required_draft4: required_draft4,
+    _validators.type_draft3: type_draft3,
+    _validators.type_draft4: type_draft4,
+    _validators.uniqueItems: uniqueItems,
+}
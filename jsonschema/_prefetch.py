@@ -0,0 +1,118 @@
+"""
+Concurrent retrieval of the remote documents that references lead to.
+
+This module uses `asyncio`, and so is only importable on Python 3.
+
+"""
+import asyncio
+
+from jsonschema.compat import str_types, urldefrag, urlsplit
+from jsonschema.exceptions import RefResolutionError
+from jsonschema.validators import _walk
+
+
+def prefetch(resolver, fetch, loop=None):
+    """
+    Retrieve and store each remote document reachable from a resolver.
+
+    Arguments:
+
+        resolver (jsonschema.RefResolver):
+
+            the resolver whose referrer (and store) to start from, and
+            whose store to put retrieved documents in
+
+        fetch (callable):
+
+            called with each URI to retrieve. If it is a coroutine function,
+            it is scheduled on the event loop, otherwise it is run in the
+            loop's default executor.
+
+        loop (asyncio.AbstractEventLoop):
+
+            the event loop to use (by default, the running event loop)
+
+    Returns:
+
+        `asyncio.Future`: which is done once all documents have been
+        retrieved and stored, or which fails with a `RefResolutionError`
+        as soon as any can't be retrieved
+
+    """
+
+    if loop is None:
+        loop = _running_loop()
+
+    done = loop.create_future()
+    pending = set()
+    requested = set()
+
+    def visit(document, scope):
+        for uri in _remote_uris(resolver, document, scope):
+            if uri in requested:
+                continue
+            requested.add(uri)
+
+            if asyncio.iscoroutinefunction(fetch):
+                future = loop.create_task(fetch(uri))
+            else:
+                future = loop.run_in_executor(None, fetch, uri)
+            pending.add(future)
+            future.add_done_callback(
+                lambda future, uri=uri: retrieved(uri, future),
+            )
+
+    def retrieved(uri, future):
+        pending.discard(future)
+        if done.done():
+            return
+
+        if future.cancelled():
+            error = RefResolutionError("Retrieving %r was cancelled" % uri)
+        else:
+            error = future.exception()
+        if error is not None:
+            for each in list(pending):
+                each.cancel()
+            if not isinstance(error, RefResolutionError):
+                error = RefResolutionError(error)
+            done.set_exception(error)
+            return
+
+        document = future.result()
+        resolver._store(uri, document)
+        visit(document, uri)
+        if not pending:
+            done.set_result(None)
+
+    # Retrievals only finish once the loop runs, so every root is visited
+    # before any of them could be the last one pending.
+    visit(resolver.referrer, resolver.base_uri)
+    for uri, document in list(resolver.store.items()):
+        visit(document, uri)
+    if not pending:
+        done.set_result(None)
+    return done
+
+
+# get_event_loop is deprecated for this from 3.10, but get_running_loop is
+# new in 3.7.
+_running_loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)
+
+
+def _remote_uris(resolver, document, scope):
+    """
+    Find the URIs of remote documents referenced within a document.
+
+    Only URIs which aren't already in the resolver's store (and which could
+    be retrieved at all, i.e. which are absolute) are included.
+
+    """
+
+    for node, scope in _walk(document, scope, resolver._urljoin_cache):
+        ref = node.get(u"$ref")
+        if not isinstance(ref, str_types):
+            continue
+        uri, _ = urldefrag(resolver._urljoin_cache(scope, ref))
+        if urlsplit(uri).scheme and uri not in resolver.store:
+            yield uri
@@ -3,7 +3,7 @@ import numbers
 from pyrsistent import pmap
 import attr
 
-from jsonschema.compat import str_types, int_types
+from jsonschema.compat import PY3, str_types, int_types
 from jsonschema.exceptions import UndefinedTypeCheck
 
 
@@ -63,6 +63,37 @@ class TypeChecker(object):
     """
     _type_checkers = attr.ib(default=pmap(), convert=pmap)
 
+    def __attrs_post_init__(self):
+        # pmaps are comparatively slow to look things up in, and type checks
+        # are performed constantly, so each checker precomputes a plain dict
+        # of its functions, and a table of which of the built in types each
+        # (exact) Python type is, which spares calling their functions. Types
+        # checked by is_any are (built in and) every type.
+        names_by_type, builtin, others, anys = {}, set(), {}, set()
+        for name, fn in self._type_checkers.items():
+            if fn is is_any:
+                anys.add(name)
+                continue
+            pytypes = _BUILTIN_TYPES.get(fn)
+            if pytypes is None:
+                others[name] = fn
+                continue
+            builtin.add(name)
+            for pytype in pytypes:
+                names_by_type.setdefault(pytype, set()).add(name)
+        for names in names_by_type.values():
+            names.update(anys)
+
+        object.__setattr__(self, "_checks", dict(self._type_checkers))
+        object.__setattr__(self, "_builtin", frozenset(builtin | anys))
+        object.__setattr__(self, "_others", others)
+        object.__setattr__(
+            self, "_names_by_type", dict(
+                (pytype, frozenset(names))
+                for pytype, names in names_by_type.items()
+            ),
+        )
+
     def is_type(self, instance, type):
         """
         Check if the instance is of the appropriate type.
@@ -87,13 +118,46 @@ class TypeChecker(object):
             `jsonschema.exceptions.UndefinedTypeCheck`:
                 if type is unknown to this object.
         """
+        names = self._names_by_type.get(instance.__class__)
+        if names is not None and type in self._builtin:
+            return type in names
+
         try:
-            fn = self._type_checkers[type]
+            fn = self._checks[type]
         except KeyError:
             raise UndefinedTypeCheck(type)
 
         return fn(self, instance)
 
+    def classify(self, instance):
+        """
+        Find all of the types that the instance is of.
+
+        Arguments:
+
+            instance (object):
+
+                The instance to classify
+
+        Returns:
+
+            frozenset: the names of each of the types the instance
+            conformed to
+
+        """
+
+        names = self._names_by_type.get(instance.__class__)
+        if names is None:
+            checks = self._checks
+        elif self._others:
+            checks = self._others
+        else:
+            return names
+
+        return frozenset(
+            name for name, fn in checks.items() if fn(self, instance)
+        ) | (names or frozenset())
+
     def redefine(self, type, fn):
         """
         Redefine the checker for ``type`` to the function ``fn``.
@@ -188,6 +252,19 @@ class TypeChecker(object):
         return attr.evolve(self, type_checkers=checkers)
 
 
+#: The exact Python types which each built in type checking function accepts
+#: (though the functions may accept others too, such as subclasses)
+_BUILTIN_TYPES = {
+    is_array: (list,),
+    is_bool: (bool,),
+    is_integer: int_types,
+    is_null: (type(None),),
+    is_number: int_types + (float,),
+    is_object: (dict,),
+    is_string: (type(u""),) if PY3 else (type(b""), type(u"")),
+}
+
+
 draft3_type_checker = TypeChecker(
     {
         u"any": is_any,
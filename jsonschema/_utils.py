@@ -6,7 +6,9 @@ except:
 import pkgutil
 import re
 
-from jsonschema.compat import str_types, MutableMapping, urlsplit
+from jsonschema.compat import (
+    MutableMapping, Sequence, int_types, iteritems, str_types, urlsplit,
+)
 
 
 class URIDict(MutableMapping):
@@ -15,7 +17,8 @@ class URIDict(MutableMapping):
 
     """
 
-    def normalize(self, uri):
+    @staticmethod
+    def normalize(uri):
         return urlsplit(uri).geturl()
 
     def __init__(self, *args, **kwargs):
@@ -51,6 +54,61 @@ class Unset(object):
         return "<unset>"
 
 
+class Message(object):
+    """
+    An error message which is only formatted once it is needed.
+
+    Formatting a message often involves the repr of the (possibly very
+    large) instance being validated, which is wasted effort for callers
+    which never look at it.
+
+    Arguments:
+
+        template (str):
+
+            A ``%``-style format string
+
+        arguments:
+
+            the values to format into ``template``. Those formatted with
+            ``%r`` are truncated (see `truncated_repr`).
+
+    """
+
+    def __init__(self, template, *arguments):
+        self.template = template
+        self.arguments = arguments
+
+    def __repr__(self):
+        return "<Message: %r>" % (self.render(),)
+
+    def render(self):
+        """
+        Format the message.
+
+        """
+
+        conversions = (
+            conversion
+            for conversion in _CONVERSION.findall(self.template)
+            if conversion
+        )
+        arguments = tuple(
+            truncated_repr(argument) if next(conversions) == "r" else argument
+            for argument in self.arguments
+        )
+        return _CONVERSION.sub(_repr_as_str, self.template) % arguments
+
+
+_CONVERSION = re.compile(r"%%|%[-#0 +]*[0-9]*(?:\.[0-9]+)?([a-zA-Z])")
+
+
+def _repr_as_str(match):
+    if match.group(1) == "r":
+        return "%s"
+    return match.group(0)
+
+
 def load_schema(name):
     """
     Load a schema from ./schemas/``name``.json and return it.
@@ -70,6 +128,114 @@ def indent(string, times=1):
     return "\n".join(" " * (4 * times) + line for line in string.splitlines())
 
 
+def resolve_ref(resolver, ref, schema):
+    """
+    Resolve the ``$ref`` in a schema, following its ahead-of-time link if any.
+    """
+
+    linked = getattr(resolver, "linked", None)
+    if linked is not None:
+        link = linked(schema)
+        if link is not None:
+            return link
+    return resolver.resolve(ref)
+
+
+def limit_errors(errors, max_errors=None, max_errors_per_path=None):
+    """
+    Stop producing errors after a number of them, or a number at one path.
+
+    Arguments:
+
+        errors (collections.Iterable):
+
+            the errors to limit, which are consumed only as far as needed
+
+        max_errors (int):
+
+            the most errors to produce in total, after which no more are
+            looked for
+
+        max_errors_per_path (int):
+
+            the most errors to produce for any one path within the instance,
+            after which further ones at that path are skipped
+
+    """
+
+    if max_errors_per_path is not None:
+        errors = _per_path(errors, max_errors_per_path)
+    if max_errors is not None:
+        errors = itertools.islice(errors, max_errors)
+    return errors
+
+
+def _per_path(errors, limit):
+    counts = {}
+    for error in errors:
+        path = tuple(error.path)
+        count = counts.get(path, 0)
+        if count < limit:
+            counts[path] = count + 1
+            yield error
+
+
+def extend_context(context, errors, limit=None):
+    """
+    Add errors to an error's ``context``, up to a limit.
+
+    Arguments:
+
+        context (list):
+
+            the context to add errors to
+
+        errors (collections.Iterator):
+
+            errors from one subschema, which are consumed only as far as
+            needed to fill the context (but always far enough to know
+            whether there are any)
+
+        limit (int):
+
+            the most errors the context should hold
+
+    Returns:
+
+        bool: whether there were any errors
+
+    """
+
+    if limit is None:
+        count = len(context)
+        context.extend(errors)
+        return len(context) > count
+
+    first = next(errors, None)
+    if first is None:
+        return False
+    if len(context) < limit:
+        context.append(first)
+        context.extend(itertools.islice(errors, limit - len(context)))
+    return True
+
+
+def chunks(iterable, size):
+    """
+    Split an iterable into lists of (at most) ``size`` elements each.
+
+    The iterable is consumed lazily, one chunk at a time.
+
+    """
+
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
 def format_as_index(indices):
     """
     Construct a single string containing indexing operations for the indices.
@@ -89,7 +255,7 @@ def format_as_index(indices):
     return "[%s]" % "][".join(repr(index) for index in indices)
 
 
-def find_additional_properties(instance, schema):
+def find_additional_properties(instance, schema, regex_cache=re.compile):
     """
     Return the set of additional properties for the given ``instance``.
 
@@ -98,17 +264,142 @@ def find_additional_properties(instance, schema):
 
     Assumes ``instance`` is dict-like already.
 
+    The patterns are combined into a single regex, retrieved (once) from
+    ``regex_cache``.
+
     """
 
     properties = schema.get("properties", {})
     patterns = "|".join(schema.get("patternProperties", {}))
+    search = regex_cache(patterns).search if patterns else None
     for property in instance:
         if property not in properties:
-            if patterns and re.search(patterns, property):
+            if search is not None and search(property):
                 continue
             yield property
 
 
+class PropertyDispatcher(object):
+    """
+    The ``properties``, ``patternProperties`` and ``additionalProperties``
+    of a schema, which together decide what each property of an object is
+    validated under.
+
+    Built once per schema, so that an object's properties can be sorted out
+    for all three keywords at once, rather than walked by each of them (and
+    by ``patternProperties`` once for each pattern).
+
+    Which properties are additional is decided as by
+    `find_additional_properties`.
+
+    """
+
+    def __init__(self, schema, regex_cache=re.compile):
+        self.properties = schema.get("properties", {})
+        self.patterns = list(schema.get("patternProperties", {}))
+        self.searches = [
+            regex_cache(pattern).search for pattern in self.patterns
+        ]
+
+        combined = "|".join(self.patterns)
+        self.search = regex_cache(combined).search if combined else None
+
+        # Patterns referring to their groups by number, or setting flags,
+        # mean something else when combined, so the combined pattern can
+        # only rule out any other patterns matching when there are none.
+        self.exact = not any(
+            _GROUP_DEPENDENT.search(pattern) for pattern in self.patterns
+        )
+
+    def dispatch(self, instance):
+        """
+        Walk an object's properties once, sorting them out for each keyword.
+
+        Returns:
+
+            tuple: a list of the properties matching each of the patterns
+            (in the same order as ``patterns``), and a list of the
+            additional properties
+
+        """
+
+        searches, search, exact = self.searches, self.search, self.exact
+        properties = self.properties
+        matches = [[] for _ in searches]
+        extras = []
+        for property in instance:
+            found = search is not None and search(property)
+            if found or not exact:
+                for matched, search_each in zip(matches, searches):
+                    if search_each(property):
+                        matched.append(property)
+            if not found and property not in properties:
+                extras.append(property)
+        return matches, extras
+
+
+_GROUP_DEPENDENT = re.compile(r"\\[1-9]|\(\?(?![:=!]|<[=!]|P<)")
+
+
+#: The length beyond which reprs in error messages are truncated
+REPR_LIMIT = 1000
+
+
+def truncated_repr(thing, limit=REPR_LIMIT):
+    """
+    The repr of ``thing``, cut off after ``limit`` characters.
+
+    Only as much of ``thing`` as is needed is repr'd, so that large
+    instances can be described cheaply.
+
+    """
+
+    return _truncated(_repr_pieces(thing), limit=limit)
+
+
+def _truncated(pieces, limit):
+    seen, size = [], 0
+    for piece in pieces:
+        seen.append(piece)
+        size += len(piece)
+        if size > limit:
+            return "".join(seen)[:limit] + "..."
+    return "".join(seen)
+
+
+def _repr_pieces(thing):
+    """
+    Lazily produce the repr of ``thing`` a piece at a time.
+
+    """
+
+    if type(thing) in (list, tuple):
+        yield "[" if type(thing) is list else "("
+        for index, each in enumerate(thing):
+            if index:
+                yield ", "
+            for piece in _repr_pieces(each):
+                yield piece
+        if type(thing) is tuple and len(thing) == 1:
+            yield ","
+        yield "]" if type(thing) is list else ")"
+    elif type(thing) is dict:
+        yield "{"
+        for index, (key, value) in enumerate(thing.items()):
+            if index:
+                yield ", "
+            for piece in _repr_pieces(key):
+                yield piece
+            yield ": "
+            for piece in _repr_pieces(value):
+                yield piece
+        yield "}"
+    elif isinstance(thing, str_types) and len(thing) > REPR_LIMIT:
+        yield repr(thing[:REPR_LIMIT + 1])
+    else:
+        yield repr(thing)
+
+
 def extras_msg(extras):
     """
     Create an error message for extra items or properties.
@@ -119,7 +410,15 @@ def extras_msg(extras):
         verb = "was"
     else:
         verb = "were"
-    return ", ".join(repr(extra) for extra in extras), verb
+    return _truncated(_joined_reprs(extras), limit=REPR_LIMIT), verb
+
+
+def _joined_reprs(things):
+    for index, thing in enumerate(things):
+        if index:
+            yield ", "
+        for piece in _repr_pieces(thing):
+            yield piece
 
 
 def types_msg(instance, types):
@@ -139,7 +438,7 @@ def types_msg(instance, types):
             reprs.append(repr(type["name"]))
         except Exception:
             reprs.append(repr(type))
-    return "%r is not of type %s" % (instance, ", ".join(reprs))
+    return Message("%r is not of type %s", instance, ", ".join(reprs))
 
 
 def flatten(suitable_for_isinstance):
@@ -191,30 +490,179 @@ def unbool(element, true=object(), false=object()):
     return element
 
 
+class Members(object):
+    """
+    The members of an ``enum``, for checking membership in constant time.
+
+    Membership is the same as for the ``enum`` itself (i.e. by ``==``).
+    Hashable members are put in a set, and any others (objects and arrays)
+    are compared one by one, as are instances which can't be hashed.
+
+    """
+
+    def __init__(self, enums):
+        self.enums = enums
+        self.hashable = set()
+        self.unhashable = []
+        for each in enums:
+            try:
+                self.hashable.add(each)
+            except TypeError:
+                self.unhashable.append(each)
+
+    def __contains__(self, instance):
+        try:
+            if instance in self.hashable:
+                return True
+        except TypeError:
+            pass
+        return instance in self.unhashable
+
+    def __repr__(self):
+        return "<%s %r>" % (self.__class__.__name__, self.enums)
+
+
+#: The size past which an enum's members are worth putting in a set
+ENUM_SET_THRESHOLD = 8
+
+
+def worth_hashing(enums):
+    """
+    Whether an ``enum`` is large enough to be worth making `Members` of.
+
+    Small ones are quicker to search through.
+
+    """
+
+    return isinstance(enums, list) and len(enums) > ENUM_SET_THRESHOLD
+
+
+def members(validator, enums):
+    """
+    Retrieve the `Members` of an ``enum``, built once per validator.
+
+    ``enum``\\s which aren't `worth_hashing`, and those of validators which
+    don't cache their members, are returned as-is.
+
+    """
+
+    cache = getattr(validator, "_enum_members", None)
+    if cache is None or not worth_hashing(enums):
+        return enums
+
+    cached = cache.get(id(enums))
+    if cached is None or cached.enums is not enums:
+        cached = cache[id(enums)] = Members(enums)
+    return cached
+
+
 def uniq(container):
     """
     Check if all of a container's elements are unique.
 
-    Successively tries first to rely that the elements are hashable, then
-    falls back on them being sortable, and finally falls back on brute
-    force.
+    """
+
+    return duplicate(container) is None
+
+
+def duplicate(container):
+    """
+    Find the first pair of equal elements in a container.
+
+    Elements are compared by their `canonical` forms, so that this takes
+    linear time for any JSON, falling back on comparing each pair of
+    elements for elements which have no canonical form.
+
+    Returns:
+
+        tuple: the indices of the first pair of equal elements, or ``None``
+        if all of the elements are unique
 
     """
 
+    seen = {}
     try:
-        return len(set(unbool(i) for i in container)) == len(container)
+        for index, element in enumerate(container):
+            first = seen.setdefault(canonical(element), index)
+            if first != index:
+                return first, index
     except TypeError:
-        try:
-            sort = sorted(unbool(i) for i in container)
-            sliced = itertools.islice(sort, 1, None)
-            for i, j in zip(sort, sliced):
-                if i == j:
-                    return False
-        except (NotImplementedError, TypeError):
-            seen = []
-            for e in container:
-                e = unbool(e)
-                if e in seen:
-                    return False
-                seen.append(e)
-    return True
+        elements = [unbool(element) for element in container]
+        for index, element in enumerate(elements):
+            for first in range(index):
+                if elements[first] == element:
+                    return first, index
+    return None
+
+
+def canonical(element):
+    """
+    Make a hashable equivalent of a JSON value.
+
+    Two values have equal canonical forms exactly when they are equal as
+    JSON, which is to say that arrays and objects are compared element by
+    element, that ``True`` and ``False`` are distinct from ``1`` and ``0``
+    (see `unbool`) at any depth, and that otherwise numbers are compared
+    numerically (so that ``1`` and ``1.0`` are equal).
+
+    Raises:
+
+        `TypeError` if the value contains anything which isn't JSON (or a
+        hashable equivalent)
+
+    """
+
+    # The types JSON is deserialized into are checked for first, since
+    # checking against the abstract base classes is comparatively slow
+    kind = type(element)
+    if kind in _SCALARS:
+        return element
+    elif kind is dict or isinstance(element, MutableMapping):
+        return frozenset(
+            (key, canonical(value)) for key, value in iteritems(element)
+        )
+    elif kind is list or (
+        isinstance(element, Sequence) and
+        not isinstance(element, (str_types, bytes))
+    ):
+        return tuple(canonical(each) for each in element)
+    element = unbool(element)
+    hash(element)
+    return element
+
+
+def fingerprint(element):
+    """
+    Make a hashable identity of a JSON value.
+
+    Unlike `canonical`, each value is tagged with its type, so that ``1``
+    and ``1.0`` (which are equal as JSON, but not as far as a metaschema's
+    ``type`` is concerned) have distinct fingerprints.
+
+    Raises:
+
+        `TypeError` if the value contains anything which isn't JSON (or a
+        hashable equivalent)
+
+    """
+
+    kind = type(element)
+    if kind in _SCALARS or kind is bool:
+        return kind, element
+    elif kind is dict or isinstance(element, MutableMapping):
+        return dict, frozenset(
+            (key, fingerprint(value)) for key, value in iteritems(element)
+        )
+    elif kind is list or (
+        isinstance(element, Sequence) and
+        not isinstance(element, (str_types, bytes))
+    ):
+        return list, tuple(fingerprint(each) for each in element)
+    hash(element)
+    return kind, element
+
+
+#: Types which are their own canonical forms
+_SCALARS = frozenset(
+    [float, type(None), type(b""), type(u"")] + list(int_types),
+)
@@ -1,28 +1,33 @@
-import re
-
 from jsonschema import _utils
 from jsonschema.exceptions import FormatError, ValidationError
 from jsonschema.compat import iteritems
 
 
-def patternProperties(validator, patternProperties, instance, schema):
-    if not validator.is_type(instance, "object"):
+def patternProperties(
+    validator, patternProperties, instance, schema, types=None,
+):
+    if types is None and not validator.is_type(instance, "object"):
         return
 
     for pattern, subschema in iteritems(patternProperties):
+        search = validator.regex_cache(pattern).search
         for k, v in iteritems(instance):
-            if re.search(pattern, k):
+            if search(k):
                 for error in validator.descend(
                     v, subschema, path=k, schema_path=pattern,
                 ):
                     yield error
 
 
-def additionalProperties(validator, aP, instance, schema):
-    if not validator.is_type(instance, "object"):
+def additionalProperties(validator, aP, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "object"):
         return
 
-    extras = set(_utils.find_additional_properties(instance, schema))
+    extras = set(
+        _utils.find_additional_properties(
+            instance, schema, regex_cache=validator.regex_cache,
+        ),
+    )
 
     if validator.is_type(aP, "object"):
         for extra in extras:
@@ -46,8 +51,8 @@ def additionalProperties(validator, aP, instance, schema):
             yield ValidationError(error % _utils.extras_msg(extras))
 
 
-def items(validator, items, instance, schema):
-    if not validator.is_type(instance, "array"):
+def items(validator, items, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "array"):
         return
 
     if validator.is_type(items, "object"):
@@ -62,9 +67,9 @@ def items(validator, items, instance, schema):
                 yield error
 
 
-def additionalItems(validator, aI, instance, schema):
+def additionalItems(validator, aI, instance, schema, types=None):
     if (
-        not validator.is_type(instance, "array") or
+        (types is None and not validator.is_type(instance, "array")) or
         validator.is_type(schema.get("items", {}), "object")
     ):
         return
@@ -82,8 +87,8 @@ def additionalItems(validator, aI, instance, schema):
         )
 
 
-def minimum(validator, minimum, instance, schema):
-    if not validator.is_type(instance, "number"):
+def minimum(validator, minimum, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "number"):
         return
 
     if schema.get("exclusiveMinimum", False):
@@ -95,12 +100,14 @@ def minimum(validator, minimum, instance, schema):
 
     if failed:
         yield ValidationError(
-            "%r is %s the minimum of %r" % (instance, cmp, minimum)
+            _utils.Message(
+                "%r is %s the minimum of %r", instance, cmp, minimum,
+            )
         )
 
 
-def maximum(validator, maximum, instance, schema):
-    if not validator.is_type(instance, "number"):
+def maximum(validator, maximum, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "number"):
         return
 
     if schema.get("exclusiveMaximum", False):
@@ -112,12 +119,14 @@ def maximum(validator, maximum, instance, schema):
 
     if failed:
         yield ValidationError(
-            "%r is %s the maximum of %r" % (instance, cmp, maximum)
+            _utils.Message(
+                "%r is %s the maximum of %r", instance, cmp, maximum,
+            )
         )
 
 
-def multipleOf(validator, dB, instance, schema):
-    if not validator.is_type(instance, "number"):
+def multipleOf(validator, dB, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "number"):
         return
 
     if isinstance(dB, float):
@@ -127,34 +136,46 @@ def multipleOf(validator, dB, instance, schema):
         failed = instance % dB
 
     if failed:
-        yield ValidationError("%r is not a multiple of %r" % (instance, dB))
+        yield ValidationError(
+            _utils.Message("%r is not a multiple of %r", instance, dB),
+        )
 
 
-def minItems(validator, mI, instance, schema):
-    if validator.is_type(instance, "array") and len(instance) < mI:
-        yield ValidationError("%r is too short" % (instance,))
+def minItems(validator, mI, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "array"):
+        return
+    if len(instance) < mI:
+        yield ValidationError(_utils.Message("%r is too short", instance))
 
 
-def maxItems(validator, mI, instance, schema):
-    if validator.is_type(instance, "array") and len(instance) > mI:
-        yield ValidationError("%r is too long" % (instance,))
+def maxItems(validator, mI, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "array"):
+        return
+    if len(instance) > mI:
+        yield ValidationError(_utils.Message("%r is too long", instance))
 
 
-def uniqueItems(validator, uI, instance, schema):
-    if (
-        uI and
-        validator.is_type(instance, "array") and
-        not _utils.uniq(instance)
-    ):
-        yield ValidationError("%r has non-unique elements" % (instance,))
+def uniqueItems(validator, uI, instance, schema, types=None):
+    if not uI or (types is None and not validator.is_type(instance, "array")):
+        return
 
+    duplicate = _utils.duplicate(instance)
+    if duplicate is not None:
+        yield ValidationError(
+            _utils.Message(
+                "%r has non-unique elements (items %d and %d are equal)",
+                instance, duplicate[0], duplicate[1],
+            ),
+        )
 
-def pattern(validator, patrn, instance, schema):
-    if (
-        validator.is_type(instance, "string") and
-        not re.search(patrn, instance)
-    ):
-        yield ValidationError("%r does not match %r" % (instance, patrn))
+
+def pattern(validator, patrn, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "string"):
+        return
+    if not validator.regex_cache(patrn).search(instance):
+        yield ValidationError(
+            _utils.Message("%r does not match %r", instance, patrn),
+        )
 
 
 def format(validator, format, instance, schema):
@@ -165,18 +186,22 @@ def format(validator, format, instance, schema):
             yield ValidationError(error.message, cause=error.cause)
 
 
-def minLength(validator, mL, instance, schema):
-    if validator.is_type(instance, "string") and len(instance) < mL:
-        yield ValidationError("%r is too short" % (instance,))
+def minLength(validator, mL, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "string"):
+        return
+    if len(instance) < mL:
+        yield ValidationError(_utils.Message("%r is too short", instance))
 
 
-def maxLength(validator, mL, instance, schema):
-    if validator.is_type(instance, "string") and len(instance) > mL:
-        yield ValidationError("%r is too long" % (instance,))
+def maxLength(validator, mL, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "string"):
+        return
+    if len(instance) > mL:
+        yield ValidationError(_utils.Message("%r is too long", instance))
 
 
-def dependencies(validator, dependencies, instance, schema):
-    if not validator.is_type(instance, "object"):
+def dependencies(validator, dependencies, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "object"):
         return
 
     for property, dependency in iteritems(dependencies):
@@ -193,13 +218,17 @@ def dependencies(validator, dependencies, instance, schema):
             for dependency in dependencies:
                 if dependency not in instance:
                     yield ValidationError(
-                        "%r is a dependency of %r" % (dependency, property)
+                        _utils.Message(
+                            "%r is a dependency of %r", dependency, property,
+                        )
                     )
 
 
 def enum(validator, enums, instance, schema):
-    if instance not in enums:
-        yield ValidationError("%r is not one of %r" % (instance, enums))
+    if instance not in _utils.members(validator, enums):
+        yield ValidationError(
+            _utils.Message("%r is not one of %r", instance, enums),
+        )
 
 
 def ref(validator, ref, instance, schema):
@@ -209,7 +238,7 @@ def ref(validator, ref, instance, schema):
             for error in validator.descend(instance, resolved):
                 yield error
     else:
-        scope, resolved = validator.resolver.resolve(ref)
+        scope, resolved = _utils.resolve_ref(validator.resolver, ref, schema)
         validator.resolver.push_scope(scope)
 
         try:
@@ -222,15 +251,15 @@ def ref(validator, ref, instance, schema):
 def type_draft3(validator, types, instance, schema):
     types = _utils.ensure_list(types)
 
+    limit = getattr(validator, "max_context_errors", None)
     all_errors = []
     for index, type in enumerate(types):
         if type == "any":
             return
         if validator.is_type(type, "object"):
-            errors = list(validator.descend(instance, type, schema_path=index))
-            if not errors:
+            errors = validator.descend(instance, type, schema_path=index)
+            if not _utils.extend_context(all_errors, errors, limit):
                 return
-            all_errors.extend(errors)
         else:
             if validator.is_type(instance, type):
                 return
@@ -240,8 +269,8 @@ def type_draft3(validator, types, instance, schema):
         )
 
 
-def properties_draft3(validator, properties, instance, schema):
-    if not validator.is_type(instance, "object"):
+def properties_draft3(validator, properties, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "object"):
         return
 
     for property, subschema in iteritems(properties):
@@ -254,7 +283,9 @@ def properties_draft3(validator, properties, instance, schema):
             ):
                 yield error
         elif subschema.get("required", False):
-            error = ValidationError("%r is a required property" % property)
+            error = ValidationError(
+                _utils.Message("%r is a required property", property),
+            )
             error._set(
                 validator="required",
                 validator_value=subschema["required"],
@@ -270,7 +301,9 @@ def disallow_draft3(validator, disallow, instance, schema):
     for disallowed in _utils.ensure_list(disallow):
         if validator.is_valid(instance, {"type": [disallowed]}):
             yield ValidationError(
-                "%r is disallowed for %r" % (disallowed, instance)
+                _utils.Message(
+                    "%r is disallowed for %r", disallowed, instance,
+                )
             )
 
 
@@ -291,8 +324,8 @@ def type_draft4(validator, types, instance, schema):
         yield ValidationError(_utils.types_msg(instance, types))
 
 
-def properties_draft4(validator, properties, instance, schema):
-    if not validator.is_type(instance, "object"):
+def properties_draft4(validator, properties, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "object"):
         return
 
     for property, subschema in iteritems(properties):
@@ -306,26 +339,32 @@ def properties_draft4(validator, properties, instance, schema):
                 yield error
 
 
-def required_draft4(validator, required, instance, schema):
-    if not validator.is_type(instance, "object"):
+def required_draft4(validator, required, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "object"):
         return
     for property in required:
         if property not in instance:
-            yield ValidationError("%r is a required property" % property)
+            yield ValidationError(
+                _utils.Message("%r is a required property", property),
+            )
 
 
-def minProperties_draft4(validator, mP, instance, schema):
-    if validator.is_type(instance, "object") and len(instance) < mP:
+def minProperties_draft4(validator, mP, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "object"):
+        return
+    if len(instance) < mP:
         yield ValidationError(
-            "%r does not have enough properties" % (instance,)
+            _utils.Message("%r does not have enough properties", instance)
         )
 
 
-def maxProperties_draft4(validator, mP, instance, schema):
-    if not validator.is_type(instance, "object"):
+def maxProperties_draft4(validator, mP, instance, schema, types=None):
+    if types is None and not validator.is_type(instance, "object"):
         return
-    if validator.is_type(instance, "object") and len(instance) > mP:
-        yield ValidationError("%r has too many properties" % (instance,))
+    if len(instance) > mP:
+        yield ValidationError(
+            _utils.Message("%r has too many properties", instance),
+        )
 
 
 def allOf_draft4(validator, allOf, instance, schema):
@@ -335,45 +374,80 @@ def allOf_draft4(validator, allOf, instance, schema):
 
 
 def oneOf_draft4(validator, oneOf, instance, schema):
+    limit = getattr(validator, "max_context_errors", None)
     subschemas = enumerate(oneOf)
     all_errors = []
     for index, subschema in subschemas:
-        errs = list(validator.descend(instance, subschema, schema_path=index))
-        if not errs:
+        errors = validator.descend(instance, subschema, schema_path=index)
+        if not _utils.extend_context(all_errors, errors, limit):
             first_valid = subschema
             break
-        all_errors.extend(errs)
     else:
         yield ValidationError(
-            "%r is not valid under any of the given schemas" % (instance,),
+            _utils.Message(
+                "%r is not valid under any of the given schemas", instance,
+            ),
             context=all_errors,
         )
+        return
 
     more_valid = [s for i, s in subschemas if validator.is_valid(instance, s)]
     if more_valid:
         more_valid.append(first_valid)
         reprs = ", ".join(repr(schema) for schema in more_valid)
         yield ValidationError(
-            "%r is valid under each of %s" % (instance, reprs)
+            _utils.Message("%r is valid under each of %s", instance, reprs)
         )
 
 
 def anyOf_draft4(validator, anyOf, instance, schema):
+    limit = getattr(validator, "max_context_errors", None)
     all_errors = []
     for index, subschema in enumerate(anyOf):
-        errs = list(validator.descend(instance, subschema, schema_path=index))
-        if not errs:
-            break
-        all_errors.extend(errs)
-    else:
-        yield ValidationError(
-            "%r is not valid under any of the given schemas" % (instance,),
-            context=all_errors,
-        )
+        errors = validator.descend(instance, subschema, schema_path=index)
+        if not _utils.extend_context(all_errors, errors, limit):
+            return
+
+    yield ValidationError(
+        _utils.Message(
+            "%r is not valid under any of the given schemas", instance,
+        ),
+        context=all_errors,
+    )
 
 
 def not_draft4(validator, not_schema, instance, schema):
     if validator.is_valid(instance, not_schema):
         yield ValidationError(
-            "%r is not allowed for %r" % (not_schema, instance)
+            _utils.Message(
+                "%r is not allowed for %r", not_schema, instance,
+            )
         )
+
+
+#: The type of instance which each validator function constrains (and which
+#: any other instance is trivially valid under). Validators which have
+#: already found an instance's types only call these (and their predicates)
+#: for instances of that type, passing the types along, in which case they
+#: don't check it again. Called without them, they check for themselves.
+APPLIES_TO = {
+    additionalItems: u"array",
+    items: u"array",
+    maxItems: u"array",
+    minItems: u"array",
+    uniqueItems: u"array",
+    maximum: u"number",
+    minimum: u"number",
+    multipleOf: u"number",
+    additionalProperties: u"object",
+    dependencies: u"object",
+    maxProperties_draft4: u"object",
+    minProperties_draft4: u"object",
+    patternProperties: u"object",
+    properties_draft3: u"object",
+    properties_draft4: u"object",
+    required_draft4: u"object",
+    maxLength: u"string",
+    minLength: u"string",
+    pattern: u"string",
+}
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""
+A performance benchmark validating a batch of records under one schema.
+
+Compares validating each record in a loop with `IValidator.iter_errors`
+against validating the whole batch with `IValidator.iter_errors_many`.
+
+"""
+from perf import Runner
+
+import jsonschema
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer", "minimum": 0},
+        "kind": {"enum": ["click", "view", "purchase"]},
+        "user": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "maxLength": 64},
+                "email": {"type": "string", "pattern": "^[^@]+@[^@]+$"},
+            },
+            "required": ["name"],
+        },
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "amount": {"type": "number", "multipleOf": 0.01},
+    },
+    "required": ["id", "kind", "user"],
+    "additionalProperties": False,
+}
+
+INSTANCES = [
+    {
+        "id": index,
+        "kind": ["click", "view", "purchase"][index % 3],
+        "user": {"name": "user %s" % (index,), "email": "u%s@x.com" % index},
+        "tags": ["a", "b", "c"][:index % 4],
+        "amount": index * 0.25,
+    } for index in range(10000)
+]
+# A few invalid ones.
+for index in range(0, len(INSTANCES), 1000):
+    INSTANCES[index]["kind"] = "bogus"
+
+
+def validate_in_a_loop(validator, instances):
+    return dict(
+        (index, errors) for index, errors in (
+            (index, list(validator.iter_errors(instance)))
+            for index, instance in enumerate(instances)
+        ) if errors
+    )
+
+
+def validate_many(validator, instances):
+    return dict(validator.iter_errors_many(instances))
+
+
+if __name__ == "__main__":
+    runner = Runner()
+    validator = jsonschema.Draft4Validator(SCHEMA)
+    runner.bench_func(
+        "iter_errors in a loop", validate_in_a_loop, validator, INSTANCES,
+    )
+    runner.bench_func("iter_errors_many", validate_many, validator, INSTANCES)
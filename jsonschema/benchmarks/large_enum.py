@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+"""
+A performance benchmark validating records against a large enum.
+
+Schemas enumerating thousands of (e.g. country, currency or product) codes
+check every record against each of them.
+
+"""
+from perf import Runner
+
+import jsonschema
+
+
+CODES = ["CODE-%05d" % (index,) for index in range(5000)]
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"code": {"enum": CODES}},
+}
+
+INSTANCES = [{"code": CODES[-index]} for index in range(1, 1001)]
+
+
+def validate(validator, instances):
+    for instance in instances:
+        validator.is_valid(instance)
+
+
+if __name__ == "__main__":
+    runner = Runner()
+    validator = jsonschema.Draft4Validator(SCHEMA)
+    runner.bench_func("interpreted", validate, validator, INSTANCES)
+    runner.bench_func("compiled", validate, validator.compile(), INSTANCES)
+    runner.bench_func(
+        "generated", validate, validator.compile("source"), INSTANCES,
+    )
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+"""
+A performance benchmark validating objects with hundreds of properties.
+
+Objects whose properties are described by a mix of ``properties``,
+``patternProperties`` and ``additionalProperties`` have each of their
+properties sorted out under all three.
+
+"""
+from perf import Runner
+
+import jsonschema
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": dict(
+        ("field%d" % (index,), {"type": "integer"}) for index in range(50)
+    ),
+    "patternProperties": dict(
+        ("^p%d-" % (index,), {"type": "string"}) for index in range(10)
+    ),
+    "additionalProperties": {"type": "number"},
+}
+
+INSTANCE = dict(("field%d" % (index,), index) for index in range(50))
+INSTANCE.update(("p3-%d" % (index,), "value") for index in range(50))
+INSTANCE.update(("other%d" % (index,), 1.5) for index in range(200))
+
+
+if __name__ == "__main__":
+    runner = Runner()
+    validator = jsonschema.Draft4Validator(SCHEMA)
+    runner.bench_func("interpreted", validator.is_valid, INSTANCE)
+    runner.bench_func("compiled", validator.compile().is_valid, INSTANCE)
+    runner.bench_func(
+        "generated", validator.compile("source").is_valid, INSTANCE,
+    )
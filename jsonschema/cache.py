@@ -0,0 +1,220 @@
+"""
+A persistent cache of remote documents, shared between processes.
+
+Without one, each new process retrieves every remote document it resolves
+references into all over again.
+
+"""
+import errno
+import hashlib
+import os
+import re
+import tempfile
+import time
+try:
+    import ujson as json
+except:
+    import json
+
+import attr
+
+from jsonschema import _utils
+
+
+class DiskCache(object):
+    """
+    A cache of retrieved remote documents, stored as files in a directory.
+
+    Any number of processes may share the same directory. Entries are
+    written atomically, so a reader always sees either a complete old entry
+    or a complete new one.
+
+    Arguments:
+
+        directory (str):
+
+            the directory to store cached documents in, which will be
+            created if it doesn't exist
+
+        ttl (float):
+
+            the number of seconds a cached document is fresh for, unless
+            the response it came from said otherwise (with a
+            ``Cache-Control: max-age``)
+
+        clock (callable):
+
+            a function returning the current time, in seconds since the
+            epoch
+
+    Attributes:
+
+        hits (int):
+
+            the number of lookups (by this object) which found a fresh
+            document
+
+        misses (int):
+
+            the number of lookups which found a stale document, or none at
+            all
+
+    """
+
+    def __init__(self, directory, ttl=3600, clock=time.time):
+        try:
+            os.makedirs(directory)
+        except OSError as error:
+            if error.errno != errno.EEXIST:
+                raise
+
+        self.directory = directory
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return "<%s %r (hits=%s, misses=%s)>" % (
+            self.__class__.__name__, self.directory, self.hits, self.misses,
+        )
+
+    def lookup(self, uri):
+        """
+        Look up the entry cached for a URI, counting a hit or a miss.
+
+        Returns:
+
+            `CacheEntry`: the cached entry (which may be stale), or ``None``
+            if there isn't one
+
+        """
+
+        entry = self.get(uri)
+        if entry is not None and self.is_fresh(entry):
+            self.hits += 1
+        else:
+            self.misses += 1
+        return entry
+
+    def is_fresh(self, entry):
+        """
+        Whether a cached entry can be used without revalidating it.
+        """
+
+        return entry.expires > self.clock()
+
+    def get(self, uri):
+        """
+        Retrieve the entry cached for a URI (which may be stale), if any.
+        """
+
+        try:
+            with open(self._path(uri)) as file:
+                contents = json.load(file)
+        except (IOError, OSError, ValueError):
+            return None
+        return CacheEntry(
+            document=contents[u"document"],
+            etag=contents[u"etag"],
+            expires=contents[u"expires"],
+        )
+
+    def set(self, uri, document, etag=None, max_age=None):
+        """
+        Cache a retrieved document.
+
+        Arguments:
+
+            uri (str):
+
+                the URI the document was retrieved from
+
+            document:
+
+                the retrieved document
+
+            etag (str):
+
+                the ``ETag`` the document was served with, if any
+
+            max_age (float):
+
+                the number of seconds the document is fresh for, if the
+                response said so (otherwise, the cache's TTL is used)
+
+        """
+
+        if max_age is None:
+            max_age = self.ttl
+
+        file = tempfile.NamedTemporaryFile(
+            mode="w", dir=self.directory, suffix=".tmp", delete=False,
+        )
+        try:
+            with file:
+                json.dump(
+                    {
+                        u"uri": uri,
+                        u"document": document,
+                        u"etag": etag,
+                        u"expires": self.clock() + max_age,
+                    },
+                    file,
+                )
+            _replace(file.name, self._path(uri))
+        except BaseException:
+            os.remove(file.name)
+            raise
+
+    def _path(self, uri):
+        uri = _utils.URIDict.normalize(uri)
+        digest = hashlib.sha256(uri.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + ".json")
+
+
+@attr.s(frozen=True)
+class CacheEntry(object):
+    """
+    A cached document, along with what's needed to revalidate it.
+    """
+
+    document = attr.ib()
+    etag = attr.ib()
+    expires = attr.ib()
+
+
+def _max_age(cache_control):
+    """
+    Find how long a response may be cached for, from its ``Cache-Control``.
+
+    Returns:
+
+        int: the number of seconds, or ``None`` if the response didn't say
+
+    """
+
+    if not cache_control:
+        return None
+    if _NO_CACHE.search(cache_control):
+        return 0
+    match = _MAX_AGE.search(cache_control)
+    if match is None:
+        return None
+    return int(match.group(1))
+
+
+def _no_store(cache_control):
+    """
+    Check whether a response's ``Cache-Control`` forbids storing it at all.
+    """
+
+    return bool(cache_control) and _NO_STORE.search(cache_control) is not None
+
+
+_MAX_AGE = re.compile(r"max-age\s*=\s*\"?(\d+)")
+_NO_CACHE = re.compile(r"no-cache")
+_NO_STORE = re.compile(r"no-store")
+
+# os.replace is Python 3 only, but renaming is atomic (on POSIX) on 2 too
+_replace = getattr(os, "replace", os.rename)
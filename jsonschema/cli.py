@@ -4,10 +4,14 @@ try:
     import ujson as json
 except:
     import json
+import collections
+import multiprocessing
 import sys
 
+from jsonschema import _utils
+from jsonschema._bundle import bundle
 from jsonschema._reflect import namedAny
-from jsonschema.validators import validator_for
+from jsonschema.validators import RefResolver, validator_for
 
 
 def _namedAnyWithDefault(name):
@@ -21,6 +25,20 @@ def _json_file(path):
         return json.load(file)
 
 
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("%r is not positive" % (value,))
+    return number
+
+
+_ERROR_FORMAT = "{error.instance}: {error.message}\n"
+_NDJSON_ERROR_FORMAT = "{filename}:{line}: {error.message}\n"
+
+#: The number of newline-delimited JSON lines sent to a worker at a time
+_NDJSON_CHUNKSIZE = 1000
+
+
 parser = argparse.ArgumentParser(
     description="JSON Schema Validation CLI",
 )
@@ -34,13 +52,56 @@ parser.add_argument(
         "to validate (may be specified multiple times)"
     ),
 )
+parser.add_argument(
+    "--ndjson",
+    action="append",
+    dest="ndjson",
+    help=(
+        "a path to a file containing newline-delimited JSON instances, "
+        "one per line, which will be read and validated one at a time "
+        "(may be specified multiple times)"
+    ),
+)
+parser.add_argument(
+    "--stdin",
+    action="store_true",
+    help="validate newline-delimited JSON instances read from stdin",
+)
 parser.add_argument(
     "-F", "--error-format",
-    default="{error.instance}: {error.message}\n",
     help=(
         "the format to use for each error output message, specified in "
         "a form suitable for passing to str.format, which will be called "
-        "with 'error' for each error"
+        "with 'error' for each error, and additionally 'filename' and "
+        "'line' for errors in newline-delimited JSON instances "
+        "(default: %r, or %r for newline-delimited JSON instances)" % (
+            _ERROR_FORMAT, _NDJSON_ERROR_FORMAT,
+        )
+    ),
+)
+parser.add_argument(
+    "-j", "--jobs",
+    type=_positive_int,
+    help=(
+        "the number of worker processes to validate instances with. "
+        "Errors are still output in the same order as the instances "
+        "(by default, instances are validated in this process)"
+    ),
+)
+parser.add_argument(
+    "--bundle",
+    action="store_true",
+    help=(
+        "rather than validating any instances, output the schema with "
+        "every document it refers to inlined into it, so that it no longer "
+        "refers to any other document"
+    ),
+)
+parser.add_argument(
+    "--base-uri",
+    help=(
+        "the URI which references within the schema are relative to "
+        "(default: the schema's id, if it has one)"
     ),
 )
 parser.add_argument(
@@ -70,15 +131,148 @@ def main(args=sys.argv[1:]):
     sys.exit(run(arguments=parse_args(args=args)))
 
 
-def run(arguments, stdout=sys.stdout, stderr=sys.stderr):
+def run(arguments, stdout=sys.stdout, stderr=sys.stderr, stdin=sys.stdin):
     error_format = arguments["error_format"]
     validator = arguments["validator"](schema=arguments["schema"])
 
     validator.check_schema(arguments["schema"])
 
+    if arguments.get("bundle"):
+        schema = arguments["schema"]
+        base_uri = arguments.get("base_uri")
+        if base_uri is None:
+            resolver = RefResolver.from_schema(schema)
+        else:
+            resolver = RefResolver(base_uri=base_uri, referrer=schema)
+        stdout.write(json.dumps(bundle(schema, resolver=resolver)))
+        stdout.write("\n")
+        return False
+
+    jobs = arguments.get("jobs")
+    if jobs is None:
+        results = (
+            _task_errors(validator, error_format, task)
+            for task in _tasks(arguments=arguments, stdin=stdin, chunksize=1)
+        )
+    else:
+        results = _run_in_pool(arguments=arguments, jobs=jobs, stdin=stdin)
+
     errored = False
-    for instance in arguments["instances"] or ():
-        for error in validator.iter_errors(instance):
-            stderr.write(error_format.format(error=error))
+    for errors in results:
+        for error in errors:
+            stderr.write(error)
             errored = True
     return errored
+
+
+def _tasks(arguments, stdin, chunksize):
+    """
+    Split up the instances to validate into independent tasks.
+
+    Each task is a function to call (with the validator and error format)
+    along with its arguments, and produces the error output for its
+    instances. Newline-delimited JSON instances are read lazily, in chunks
+    of (at most) ``chunksize`` lines.
+
+    """
+
+    for instance in arguments["instances"] or ():
+        yield _instance_errors, (instance,)
+
+    for path in arguments.get("ndjson") or ():
+        with open(path) as file:
+            for chunk in _utils.chunks(enumerate(file, 1), chunksize):
+                yield _ndjson_errors, (path, chunk)
+
+    if arguments.get("stdin"):
+        for chunk in _utils.chunks(enumerate(stdin, 1), chunksize):
+            yield _ndjson_errors, ("<stdin>", chunk)
+
+
+def _task_errors(validator, error_format, task):
+    function, args = task
+    return function(validator, error_format, *args)
+
+
+def _instance_errors(validator, error_format, instance):
+    for error in validator.iter_errors(instance):
+        yield (error_format or _ERROR_FORMAT).format(error=error)
+
+
+def _ndjson_errors(validator, error_format, filename, lines):
+    """
+    Validate newline-delimited JSON instances one line at a time.
+
+    Errors are produced as soon as they are found, so that input of any
+    size can be validated using a constant amount of memory.
+
+    """
+
+    error_format = error_format or _NDJSON_ERROR_FORMAT
+    for line, text in lines:
+        if not text.strip():
+            continue
+
+        try:
+            instance = json.loads(text)
+        except ValueError as error:
+            yield "%s:%s: %s\n" % (filename, line, error)
+            continue
+
+        for error in validator.iter_errors(instance):
+            yield error_format.format(
+                error=error, filename=filename, line=line,
+            )
+
+
+#: The validator and error format used by this (worker) process
+_worker = None
+
+
+def _run_in_pool(arguments, jobs, stdin):
+    """
+    Validate each task in a pool of worker processes.
+
+    The error output for each task is produced in the same order as the
+    tasks themselves, regardless of which worker finishes first, and only
+    a few tasks are in flight at once, so that lazily read input stays
+    lazily read.
+
+    """
+
+    pool = multiprocessing.Pool(
+        processes=jobs,
+        initializer=_initialize,
+        initargs=(
+            arguments["validator"],
+            arguments["schema"],
+            arguments["error_format"],
+        ),
+    )
+    try:
+        tasks = _tasks(
+            arguments=arguments, stdin=stdin, chunksize=_NDJSON_CHUNKSIZE,
+        )
+        pending = collections.deque()
+        for task in tasks:
+            pending.append(pool.apply_async(_validate, (task,)))
+            if len(pending) >= 2 * jobs:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+        pool.close()
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+
+def _initialize(cls, schema, error_format):
+    global _worker
+    _worker = cls(schema=schema), error_format
+
+
+def _validate(task):
+    validator, error_format = _worker
+    return list(_task_errors(validator, error_format, task))
@@ -3,6 +3,8 @@ import itertools
 import pprint
 import textwrap
 
+import attr
+
 from jsonschema import _utils
 from jsonschema.compat import PY3, iteritems
 
@@ -39,7 +41,7 @@ class _Error(Exception):
             schema_path,
             parent,
         )
-        self.message = message
+        self._message = message
         self.path = self.relative_path = deque(path)
         self.schema_path = self.relative_schema_path = deque(schema_path)
         self.context = list(context)
@@ -56,6 +58,21 @@ class _Error(Exception):
     def __repr__(self):
         return "<%s: %r>" % (self.__class__.__name__, self.message)
 
+    @property
+    def message(self):
+        """
+        The error message, formatted the first time it is accessed.
+
+        """
+
+        if isinstance(self._message, _utils.Message):
+            self._message = self._message.render()
+        return self._message
+
+    @message.setter
+    def message(self, message):
+        self._message = message
+
     def __unicode__(self):
         essential_for_verbose = (
             self.validator, self.validator_value, self.instance, self.schema,
@@ -120,10 +137,12 @@ class _Error(Exception):
 
     def _contents(self):
         attrs = (
-            "message", "cause", "context", "validator", "validator_value",
+            "cause", "context", "validator", "validator_value",
             "path", "schema_path", "instance", "schema", "parent",
         )
-        return dict((attr, getattr(self, attr)) for attr in attrs)
+        contents = dict((attr, getattr(self, attr)) for attr in attrs)
+        contents["message"] = self._message
+        return contents
 
 
 class ValidationError(_Error):
@@ -136,6 +155,55 @@ class SchemaError(_Error):
     _word_for_instance_in_error_message = "schema"
 
 
+@attr.s(frozen=True)
+class ErrorRecord(object):
+    """
+    A compact summary of a `ValidationError`.
+
+    Unlike the errors themselves, which refer to their parents, contexts,
+    causes and the (sub)schemas and instances involved, records hold only
+    plain data, and so are cheap to pickle and send between processes.
+
+    Attributes:
+
+        message (str):
+
+            The error's message
+
+        validator (str):
+
+            The name of the failed validator
+
+        path (tuple):
+
+            The error's `absolute path <_Error.absolute_path>`
+
+        schema_path (tuple):
+
+            The error's `absolute schema path <_Error.absolute_schema_path>`
+
+    """
+
+    message = attr.ib()
+    validator = attr.ib()
+    path = attr.ib(convert=tuple)
+    schema_path = attr.ib(convert=tuple)
+
+    @classmethod
+    def create_from(cls, error):
+        """
+        Summarize the given error.
+
+        """
+
+        return cls(
+            message=error.message,
+            validator=error.validator,
+            path=error.absolute_path,
+            schema_path=error.absolute_schema_path,
+        )
+
+
 class RefResolutionError(Exception):
     pass
 
@@ -271,6 +339,150 @@ class ErrorTree(object):
         return len(self.errors) + child_errors
 
 
+class CompactErrorTree(object):
+    """
+    An `ErrorTree` which can be built incrementally, in bounded memory.
+
+    Rather than whole errors, which refer to the (sub)schemas and instances
+    involved, each node stores `ErrorRecord`\\s (all sharing the node's
+    path), and at most ``max_errors_per_node`` of them. Every error added is
+    still counted, and counts are kept up to date as errors are added, so
+    that finding how many errors (any part of) the tree contains is cheap.
+
+    Arguments:
+
+        errors (collections.Iterable):
+
+            errors to add to the tree, which may be added (lazily) as they
+            are produced by e.g. `IValidator.iter_errors`
+
+        max_errors_per_node (int):
+
+            the most errors to store at any one node of the tree (by
+            default, there is no limit). Errors for validators a node
+            already has an error for replace it, as with `ErrorTree`.
+
+    Attributes:
+
+        errors (dict):
+
+            the `ErrorRecord`\\s stored for this node, by the name of the
+            validator which failed
+
+        path (tuple):
+
+            the path to this node within the instance
+
+    """
+
+    def __init__(self, errors=(), max_errors_per_node=None):
+        self.errors = {}
+        self.path = ()
+        self.max_errors_per_node = max_errors_per_node
+        self._contents = {}
+        self._total_errors = 0
+
+        self.extend(errors)
+
+    def add(self, error):
+        """
+        Add an error to the tree.
+
+        Arguments:
+
+            error (ValidationError):
+
+                the error, whose (relative) path determines which node of
+                the tree it is added to
+
+        """
+
+        node = self
+        node._total_errors += 1
+        for element in error.path:
+            child = node._contents.get(element)
+            if child is None:
+                child = node._contents[element] = self.__class__(
+                    max_errors_per_node=self.max_errors_per_node,
+                )
+                child.path = node.path + (element,)
+            node = child
+            node._total_errors += 1
+
+        validator, limit = error.validator, self.max_errors_per_node
+        stored = node.errors
+        if validator in stored or limit is None or len(stored) < limit:
+            stored[validator] = ErrorRecord(
+                message=error.message,
+                validator=validator,
+                path=node.path,
+                schema_path=error.absolute_schema_path,
+            )
+
+    def extend(self, errors):
+        """
+        Add each of some errors to the tree.
+        """
+
+        for error in errors:
+            self.add(error)
+
+    def __contains__(self, index):
+        """
+        Check whether ``instance[index]`` has any errors.
+
+        """
+
+        return index in self._contents
+
+    def __getitem__(self, index):
+        """
+        Retrieve the child tree one level down at the given ``index``.
+
+        Since instances aren't kept, indices without errors produce an
+        (empty) tree rather than an error.
+
+        """
+
+        child = self._contents.get(index)
+        if child is None:
+            child = self.__class__(
+                max_errors_per_node=self.max_errors_per_node,
+            )
+            child.path = self.path + (index,)
+        return child
+
+    def __iter__(self):
+        """
+        Iterate (non-recursively) over the indices in the instance with errors.
+
+        """
+
+        return iter(self._contents)
+
+    def __len__(self):
+        """
+        Same as `total_errors`.
+
+        """
+
+        return self._total_errors
+
+    def __repr__(self):
+        return "<%s (%s total errors)>" % (self.__class__.__name__, len(self))
+
+    @property
+    def total_errors(self):
+        """
+        The total number of errors added to the tree, including to children.
+
+        This includes errors which were counted but not stored.
+
+        """
+
+        return self._total_errors
+
+
 def by_relevance(weak=WEAK_MATCHES, strong=STRONG_MATCHES):
     def relevance(error):
         validator = error.validator
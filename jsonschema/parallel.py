@@ -0,0 +1,112 @@
+"""
+Validation of many instances at once, spread across multiple processes.
+
+Validation is CPU bound, so validating large batches of instances in a
+single process leaves other cores idle. `validate_many` instead hands out
+chunks of instances to a pool of worker processes, each of which has
+compiled the schema once up front.
+
+"""
+import multiprocessing
+
+from jsonschema import _utils
+from jsonschema.exceptions import ErrorRecord
+from jsonschema.validators import RefResolver, validator_for
+
+
+#: The validator used by this (worker) process, set by `_initialize`
+_compiled = None
+
+
+def validate_many(
+    schema,
+    instances,
+    workers=None,
+    chunksize=1000,
+    cls=None,
+    store=(),
+    format_checker=None,
+):
+    """
+    Validate each of the given instances under a schema, in parallel.
+
+    Arguments:
+
+        schema (dict):
+
+            The schema to validate with
+
+        instances (collections.Iterable):
+
+            The instances to validate
+
+        workers (int):
+
+            The number of worker processes to use. Defaults to the number
+            of CPUs.
+
+        chunksize (int):
+
+            The number of instances to send to a worker at a time
+
+        cls (IValidator):
+
+            The validator class to use. If unprovided, it is determined
+            from the schema, as in `jsonschema.validate`.
+
+        store (dict):
+
+            A mapping from URIs to documents, used to resolve references
+            within each worker (see `jsonschema.RefResolver`)
+
+        format_checker (jsonschema.FormatChecker):
+
+            The format checker to use, if formats should be checked
+
+    The schema, class, store and format checker are sent to each worker
+    once, and so must be picklable.
+
+    Returns:
+
+        list: one `list` of `jsonschema.exceptions.ErrorRecord`\\s per
+        instance, in the same order as ``instances`` (empty for valid
+        instances)
+
+    """
+
+    if cls is None:
+        cls = validator_for(schema)
+
+    pool = multiprocessing.Pool(
+        processes=workers,
+        initializer=_initialize,
+        initargs=(schema, cls, dict(store), format_checker),
+    )
+    try:
+        results = []
+        chunks = _utils.chunks(instances, chunksize)
+        for chunk_results in pool.imap(_validate, chunks):
+            results.extend(chunk_results)
+        pool.close()
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+    return results
+
+
+def _initialize(schema, cls, store, format_checker):
+    global _compiled
+    resolver = RefResolver.from_schema(schema, store=store)
+    validator = cls(schema, resolver=resolver, format_checker=format_checker)
+    _compiled = validator.compile()
+
+
+def _validate(chunk):
+    return [
+        [
+            ErrorRecord.create_from(error)
+            for error in _compiled.iter_errors(instance)
+        ] for instance in chunk
+    ]
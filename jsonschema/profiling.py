@@ -0,0 +1,224 @@
+"""
+Opt-in instrumentation of where time goes during validation.
+
+Validator classes are left untouched -- instrumentation is only present on
+a separate class created (via `jsonschema.validators.extend`) by
+`Profile.instrument`, so validation with the original class pays nothing
+for it.
+
+"""
+from timeit import default_timer
+import collections
+
+from jsonschema.compat import iteritems, urldefrag
+from jsonschema.validators import extend
+
+
+class Profile(object):
+    """
+    Call counts and cumulative times for each validator (keyword) called.
+
+    Times are cumulative, so the time for a keyword which descends into
+    subschemas (e.g. :validator:`properties`) includes the time spent
+    validating within them, much like the ``cumtime`` reported by
+    `cProfile`. Time spent by whoever is consuming errors between them is
+    not included.
+
+    Statistics are kept both per keyword and per location of a keyword
+    within a schema, given as a URI whose fragment is a JSON pointer.
+
+    """
+
+    def __init__(self):
+        self.keywords = collections.defaultdict(_Stats)
+        self.paths = collections.defaultdict(_Stats)
+        self._pointers = {}
+        self._indexed = {}
+
+    def instrument(self, cls):
+        """
+        Create a version of a validator class which records into this profile.
+
+        Arguments:
+
+            cls (IValidator):
+
+                the validator class to instrument
+
+        Returns:
+
+            a new `jsonschema.IValidator` class, whose validators (and only
+            whose validators) record into this profile
+
+        Only validation done by the interpreted validation methods (i.e.
+        not by compiled validators) is recorded.
+
+        """
+
+        return extend(
+            cls,
+            validators=dict(
+                (keyword, self._wrap(keyword, validator))
+                for keyword, validator in iteritems(cls.VALIDATORS)
+            ),
+        )
+
+    def reset(self):
+        """
+        Clear all statistics recorded so far.
+        """
+
+        self.keywords.clear()
+        self.paths.clear()
+
+    def as_dict(self):
+        """
+        Export the statistics recorded so far.
+
+        Returns:
+
+            dict: with ``keywords`` and ``paths`` keys, each mapping to a
+            `dict` from keywords or schema locations (respectively) to a
+            `dict` with their number of ``calls`` and cumulative ``time``
+
+        """
+
+        return dict(
+            keywords=dict(
+                (keyword, stats.as_dict())
+                for keyword, stats in iteritems(self.keywords)
+            ),
+            paths=dict(
+                (path, stats.as_dict())
+                for path, stats in iteritems(self.paths)
+            ),
+        )
+
+    def report(self, limit=None):
+        """
+        Format the statistics recorded so far, slowest first.
+
+        Arguments:
+
+            limit (int):
+
+                the number of rows to show in each table (by default, all
+                of them)
+
+        Returns:
+
+            str: a report in a similar form to the one shown by `cProfile`
+
+        """
+
+        return u"\n".join(
+            [
+                _table(u"keyword", self.keywords, limit),
+                _table(u"schema path", self.paths, limit),
+            ],
+        )
+
+    def _wrap(self, keyword, validator):
+        def instrumented(validator_instance, value, instance, schema):
+            path = self._path_of(validator_instance, schema) + u"/" + keyword
+            elapsed = 0
+            start = default_timer()
+            try:
+                errors = iter(
+                    validator(validator_instance, value, instance, schema) or
+                    (),
+                )
+                while True:
+                    try:
+                        error = next(errors)
+                    except StopIteration:
+                        return
+                    elapsed += default_timer() - start
+                    start = None
+                    yield error
+                    start = default_timer()
+            finally:
+                if start is not None:
+                    elapsed += default_timer() - start
+                for stats in self.keywords[keyword], self.paths[path]:
+                    stats.calls += 1
+                    stats.time += elapsed
+        return instrumented
+
+    def _path_of(self, validator, schema):
+        """
+        Find the location of a (sub)schema, indexing documents as needed.
+
+        The top-level schema of the validator is indexed the first time it is
+        seen, as is the document for the current resolution scope if it's in
+        the resolver's store.
+
+        """
+
+        found = self._pointers.get(id(schema))
+        if found is None:
+            resolver = validator.resolver
+            self._index(resolver.base_uri, validator.schema)
+            url, _ = urldefrag(resolver.resolution_scope)
+            document = resolver.store.get(url)
+            if document is not None:
+                self._index(url, document)
+            found = self._pointers.get(id(schema), (schema, u"<unknown>"))
+        _, path = found
+        return path
+
+    def _index(self, url, document):
+        if id(document) in self._indexed:
+            return
+        self._indexed[id(document)] = document
+
+        stack = [(document, url + u"#")]
+        while stack:
+            node, pointer = stack.pop()
+            if isinstance(node, dict):
+                # keep the node itself, so that its id stays unique
+                self._pointers.setdefault(id(node), (node, pointer))
+                children = (
+                    (u"%s" % (key,), value) for key, value in iteritems(node)
+                )
+            elif isinstance(node, list):
+                children = (
+                    (u"%s" % (index,), value)
+                    for index, value in enumerate(node)
+                )
+            else:
+                continue
+
+            for key, value in children:
+                key = key.replace(u"~", u"~0").replace(u"/", u"~1")
+                stack.append((value, pointer + u"/" + key))
+
+
+class _Stats(object):
+
+    __slots__ = ("calls", "time")
+
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.0
+
+    def as_dict(self):
+        return dict(calls=self.calls, time=self.time)
+
+
+_HEADER = u"%9s %12s %12s  %s"
+_ROW = u"%9d %12.6f %12.6f  %s"
+
+
+def _table(heading, stats, limit):
+    rows = sorted(
+        iteritems(stats), key=lambda item: item[1].time, reverse=True,
+    )[:limit]
+    lines = [_HEADER % (u"ncalls", u"cumtime", u"percall", heading)]
+    for name, each in rows:
+        lines.append(
+            _ROW % (
+                each.calls, each.time, each.time / each.calls, name,
+            ),
+        )
+    return u"\n".join(lines) + u"\n"
@@ -164,6 +164,14 @@ class _Test(object):
         fn.__name__ = name
         return fn
 
+    def validator(self):
+        resolver = jsonschema.RefResolver.from_schema(
+            schema=self.schema, store=self._remotes,
+        )
+        return self.collection.validator(
+            self.schema, resolver=resolver, **self._validate_kwargs
+        )
+
     def validate(self):
         resolver = jsonschema.RefResolver.from_schema(
             schema=self.schema, store=self._remotes,
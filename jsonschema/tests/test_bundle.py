@@ -0,0 +1,138 @@
+from unittest import TestCase
+
+from jsonschema import Draft4Validator, RefResolver, bundle
+from jsonschema.exceptions import RefResolutionError
+
+
+class TestBundle(TestCase):
+    def resolver(self, **store):
+        return RefResolver(
+            base_uri=u"http://example.com/root.json",
+            referrer={},
+            store=dict(
+                (u"http://example.com/" + uri, document)
+                for uri, document in store.items()
+            ),
+        )
+
+    def test_no_references(self):
+        schema = {u"properties": {u"foo": {u"type": u"integer"}}}
+        self.assertEqual(bundle(schema), schema)
+
+    def test_local_references_are_untouched(self):
+        schema = {
+            u"properties": {u"foo": {u"$ref": u"#/definitions/foo"}},
+            u"definitions": {u"foo": {u"type": u"integer"}},
+        }
+        self.assertEqual(bundle(schema, self.resolver()), schema)
+
+    def test_remote_reference(self):
+        resolver = self.resolver(**{u"other.json": {u"type": u"integer"}})
+        schema = {u"items": {u"$ref": u"other.json"}}
+        self.assertEqual(
+            bundle(schema, resolver), {
+                u"items": {u"$ref": u"#/definitions/other.json"},
+                u"definitions": {u"other.json": {u"type": u"integer"}},
+            },
+        )
+
+    def test_schema_is_unmodified(self):
+        resolver = self.resolver(**{u"other.json": {u"type": u"integer"}})
+        schema = {u"items": {u"$ref": u"other.json"}}
+        bundle(schema, resolver)
+        self.assertEqual(schema, {u"items": {u"$ref": u"other.json"}})
+
+    def test_references_within_remote_documents(self):
+        resolver = self.resolver(
+            **{
+                u"a.json": {
+                    u"definitions": {u"b": {u"$ref": u"b.json"}},
+                    u"items": {u"$ref": u"#/definitions/b"},
+                },
+                u"b.json": {u"type": u"integer"},
+            }
+        )
+        bundled = bundle({u"$ref": u"a.json"}, resolver)
+
+        validator = Draft4Validator(bundled)
+        self.assertTrue(validator.is_valid([1, 2]))
+        self.assertFalse(validator.is_valid([1, u"2"]))
+        self.assertEqual(
+            sorted(bundled[u"definitions"]),
+            [u"a.json", u"a.json-definitions_b", u"b.json"],
+        )
+
+    def test_recursive_remote_reference(self):
+        resolver = self.resolver(
+            **{u"tree.json": {u"items": {u"$ref": u"tree.json"}}}
+        )
+        bundled = bundle({u"$ref": u"tree.json"}, resolver)
+        self.assertEqual(
+            bundled, {
+                u"$ref": u"#/definitions/tree.json",
+                u"definitions": {
+                    u"tree.json": {
+                        u"items": {u"$ref": u"#/definitions/tree.json"},
+                    },
+                },
+            },
+        )
+
+    def test_references_back_into_the_root(self):
+        resolver = self.resolver(
+            **{u"other.json": {u"items": {u"$ref": u"root.json#/foo"}}}
+        )
+        schema = {u"foo": {u"type": u"integer"}, u"$ref": u"other.json"}
+        self.assertEqual(
+            bundle(schema, resolver)[u"definitions"],
+            {u"other.json": {u"items": {u"$ref": u"#/foo"}}},
+        )
+
+    def test_ids_change_scope_and_are_removed(self):
+        resolver = self.resolver(
+            **{u"nested/other.json": {u"type": u"integer"}}
+        )
+        schema = {
+            u"properties": {
+                u"foo": {
+                    u"id": u"nested/",
+                    u"items": {u"$ref": u"other.json"},
+                },
+            },
+        }
+        self.assertEqual(
+            bundle(schema, resolver), {
+                u"properties": {
+                    u"foo": {
+                        u"items": {u"$ref": u"#/definitions/other.json"},
+                    },
+                },
+                u"definitions": {u"other.json": {u"type": u"integer"}},
+            },
+        )
+
+    def test_names_do_not_collide(self):
+        resolver = self.resolver(
+            **{
+                u"a/foo.json": {u"type": u"integer"},
+                u"b/foo.json": {u"type": u"string"},
+            }
+        )
+        schema = {
+            u"anyOf": [{u"$ref": u"a/foo.json"}, {u"$ref": u"b/foo.json"}],
+            u"definitions": {u"foo.json": {}},
+        }
+        definitions = bundle(schema, resolver)[u"definitions"]
+        self.assertEqual(
+            sorted(definitions), [u"foo.json", u"foo.json-2", u"foo.json-3"],
+        )
+        self.assertEqual(definitions[u"foo.json"], {})
+
+    def test_enums_are_not_schemas(self):
+        schema = {u"enum": [{u"$ref": u"http://example.com/nonexistent"}]}
+        self.assertEqual(bundle(schema, self.resolver()), schema)
+
+    def test_unresolvable_reference(self):
+        resolver = self.resolver(**{u"other.json": {}})
+        with self.assertRaises(RefResolutionError):
+            bundle({u"$ref": u"other.json#/nonexistent"}, resolver)
@@ -0,0 +1,212 @@
+from unittest import TestCase
+import os
+import shutil
+import tempfile
+import threading
+
+from jsonschema import validators
+from jsonschema.cache import CacheEntry, DiskCache, _max_age, _no_store
+from jsonschema.tests.compat import mock
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDiskCache(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.clock = Clock()
+        self.cache = DiskCache(self.directory, ttl=60, clock=self.clock)
+
+    def test_set_and_get(self):
+        self.cache.set("http://example.com/", {"foo": 12}, etag='"abc"')
+        self.assertEqual(
+            self.cache.get("http://example.com/"),
+            CacheEntry(document={"foo": 12}, etag='"abc"', expires=1060.0),
+        )
+
+    def test_get_missing(self):
+        self.assertIsNone(self.cache.get("http://example.com/"))
+
+    def test_keys_are_normalized(self):
+        self.cache.set("http://example.com/#", {"foo": 12})
+        entry = self.cache.get("http://example.com/")
+        self.assertEqual(entry.document, {"foo": 12})
+
+    def test_max_age(self):
+        self.cache.set("http://example.com/", {}, max_age=5)
+        entry = self.cache.get("http://example.com/")
+        self.assertEqual(entry.expires, 1005.0)
+
+    def test_shared_between_instances(self):
+        self.cache.set("http://example.com/", {"foo": 12})
+        other = DiskCache(self.directory, clock=self.clock)
+        self.assertEqual(
+            other.get("http://example.com/").document, {"foo": 12},
+        )
+
+    def test_nested_directories_are_created(self):
+        directory = os.path.join(self.directory, "a", "b")
+        DiskCache(directory).set("http://example.com/", {})
+        self.assertTrue(os.listdir(directory))
+
+    def test_no_temporary_files_are_left_behind(self):
+        self.cache.set("http://example.com/", {})
+        self.cache.set("http://example.com/", {"foo": 12})
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+
+    def test_unwritable_documents_leave_no_files_behind(self):
+        with self.assertRaises(Exception):
+            self.cache.set("http://example.com/", {"foo": object()})
+        self.assertEqual(os.listdir(self.directory), [])
+        self.assertIsNone(self.cache.get("http://example.com/"))
+
+    def test_corrupt_entries_are_ignored(self):
+        self.cache.set("http://example.com/", {})
+        path, = os.listdir(self.directory)
+        with open(os.path.join(self.directory, path), "w") as file:
+            file.write("{not json")
+        self.assertIsNone(self.cache.get("http://example.com/"))
+
+    def test_lookup_counts_hits_and_misses(self):
+        self.cache.lookup("http://example.com/")
+        self.cache.set("http://example.com/", {})
+        self.cache.lookup("http://example.com/")
+        self.clock.now += 61
+        self.cache.lookup("http://example.com/")
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_parse_max_age(self):
+        self.assertEqual(
+            [
+                _max_age(None),
+                _max_age("public"),
+                _max_age("public, max-age=300"),
+                _max_age("max-age=\"30\""),
+                _max_age("no-cache, max-age=300"),
+            ],
+            [None, None, 300, 30, 0],
+        )
+
+    def test_no_store(self):
+        self.assertEqual(
+            [
+                _no_store(None),
+                _no_store("no-cache"),
+                _no_store("private, no-store"),
+            ],
+            [False, False, True],
+        )
+
+
+class TestRefResolverDiskCache(TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.clock = Clock()
+        self.cache = DiskCache(directory, ttl=60, clock=self.clock)
+
+    def resolve(self, ref, **kwargs):
+        resolver = validators.RefResolver(
+            "", {}, disk_cache=self.cache, **kwargs
+        )
+        with resolver.resolving(ref) as resolved:
+            return resolved
+
+    def test_fresh_documents_are_not_retrieved(self):
+        retrieved = []
+
+        def handler(uri):
+            retrieved.append(uri)
+            return {"foo": len(retrieved)}
+
+        resolved = [
+            self.resolve("foo://bar#/foo", handlers={"foo": handler}),
+            self.resolve("foo://bar#/foo", handlers={"foo": handler}),
+        ]
+        self.clock.now += 61
+        resolved.append(
+            self.resolve("foo://bar#/foo", handlers={"foo": handler}),
+        )
+
+        self.assertEqual(resolved, [1, 1, 2])
+        self.assertEqual(retrieved, ["foo://bar", "foo://bar"])
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_stale_documents_are_revalidated_over_http(self):
+        requests = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                etag = self.headers.get("If-None-Match")
+                requests.append(etag)
+                if etag == '"v1"':
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("ETag", '"v1"')
+                self.send_header("Cache-Control", "max-age=10")
+                self.end_headers()
+                self.wfile.write(b'{"foo": 12}')
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        ref = "http://127.0.0.1:%s/schema#/foo" % (server.server_port,)
+        with mock.patch("jsonschema.validators.requests", None):
+            resolved = [self.resolve(ref), self.resolve(ref)]
+            self.clock.now += 11
+            resolved.append(self.resolve(ref))
+            resolved.append(self.resolve(ref))
+
+        self.assertEqual(resolved, [12, 12, 12, 12])
+        self.assertEqual(requests, [None, '"v1"'])
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 2))
+
+    def test_no_store_documents_are_not_written(self):
+        requests = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                requests.append(self.path)
+                self.send_response(200)
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                self.wfile.write(b'{"foo": 12}')
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        uri = "http://127.0.0.1:%s/schema" % (server.server_port,)
+        with mock.patch("jsonschema.validators.requests", None):
+            resolved = [self.resolve(uri + "#/foo") for _ in range(2)]
+
+        self.assertEqual(resolved, [12, 12])
+        self.assertEqual(len(requests), 2)
+        self.assertIsNone(self.cache.lookup(uri))
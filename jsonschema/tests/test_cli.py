@@ -1,4 +1,8 @@
 from unittest import TestCase
+import json
+import os
+import shutil
+import tempfile
 
 from jsonschema import Draft4Validator, ValidationError, cli
 from jsonschema.compat import StringIO
@@ -60,6 +64,13 @@ class TestParser(TestCase):
         )
         self.assertIs(arguments["validator"], Draft4Validator)
 
+    def test_jobs_must_be_positive(self):
+        for jobs in "0", "-1":
+            with mock.patch("sys.stderr", StringIO()) as stderr:
+                with self.assertRaises(SystemExit):
+                    cli.parse_args(["--jobs", jobs, "schema.json"])
+            self.assertIn("is not positive", stderr.getvalue())
+
 
 class TestCLI(TestCase):
     def test_draft3_schema_draft4_validator(self):
@@ -135,3 +146,163 @@ class TestCLI(TestCase):
         self.assertFalse(stdout.getvalue())
         self.assertEqual(stderr.getvalue(), "1 - 9\t1 - 8\t2 - 7\t")
         self.assertEqual(exit_code, 1)
+
+    def test_ndjson_from_stdin(self):
+        stdin = StringIO('{"foo": 1}\n\n{"foo": "bar"}\n[]\n')
+        stdout, stderr = StringIO(), StringIO()
+        exit_code = cli.run(
+            {
+                "validator": Draft4Validator,
+                "schema": {"properties": {"foo": {"type": "integer"}}},
+                "instances": None,
+                "stdin": True,
+                "error_format": None,
+            },
+            stdout=stdout,
+            stderr=stderr,
+            stdin=stdin,
+        )
+        self.assertFalse(stdout.getvalue())
+        self.assertEqual(
+            stderr.getvalue(),
+            "<stdin>:3: %r is not of type 'integer'\n" % (u"bar",),
+        )
+        self.assertEqual(exit_code, 1)
+
+    def test_ndjson_file(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "instances.ndjson")
+        with open(path, "w") as file:
+            file.write("12\n37\n3\n")
+
+        stdout, stderr = StringIO(), StringIO()
+        exit_code = cli.run(
+            {
+                "validator": Draft4Validator,
+                "schema": {"minimum": 10},
+                "instances": None,
+                "ndjson": [path],
+                "error_format": "{line} - {error.message}\n",
+            },
+            stdout=stdout,
+            stderr=stderr,
+        )
+        self.assertFalse(stdout.getvalue())
+        self.assertEqual(
+            stderr.getvalue(), "3 - 3 is less than the minimum of 10\n",
+        )
+        self.assertEqual(exit_code, 1)
+
+    def test_ndjson_successful_validation(self):
+        stdout, stderr = StringIO(), StringIO()
+        exit_code = cli.run(
+            {
+                "validator": Draft4Validator,
+                "schema": {"type": "integer"},
+                "instances": None,
+                "stdin": True,
+                "error_format": None,
+            },
+            stdout=stdout,
+            stderr=stderr,
+            stdin=StringIO("1\n2\n3\n"),
+        )
+        self.assertFalse(stdout.getvalue())
+        self.assertFalse(stderr.getvalue())
+        self.assertEqual(exit_code, 0)
+
+    def test_ndjson_invalid_json_line(self):
+        stdout, stderr = StringIO(), StringIO()
+        exit_code = cli.run(
+            {
+                "validator": Draft4Validator,
+                "schema": {"type": "integer"},
+                "instances": None,
+                "stdin": True,
+                "error_format": None,
+            },
+            stdout=stdout,
+            stderr=stderr,
+            stdin=StringIO("1\n{not json\n3\n"),
+        )
+        self.assertFalse(stdout.getvalue())
+        self.assertTrue(stderr.getvalue().startswith("<stdin>:2: "))
+        self.assertEqual(exit_code, 1)
+
+    def test_jobs(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        paths = []
+        for name, count in [("first", 2500), ("second", 30)]:
+            path = os.path.join(directory, name + ".ndjson")
+            with open(path, "w") as file:
+                file.writelines("%s\n" % (i,) for i in range(count))
+            paths.append(path)
+
+        arguments = {
+            "validator": Draft4Validator,
+            "schema": {"not": {"multipleOf": 7}},
+            "instances": [7, 8, 14],
+            "ndjson": paths,
+            "stdin": True,
+            "error_format": "{error.instance} - {error.message}\n",
+        }
+
+        stdout, stderr = StringIO(), StringIO()
+        exit_code = cli.run(
+            arguments,
+            stdout=stdout,
+            stderr=stderr,
+            stdin=StringIO("21\n22\n"),
+        )
+
+        arguments["jobs"] = 3
+        parallel_stdout, parallel_stderr = StringIO(), StringIO()
+        parallel_exit_code = cli.run(
+            arguments,
+            stdout=parallel_stdout,
+            stderr=parallel_stderr,
+            stdin=StringIO("21\n22\n"),
+        )
+
+        self.assertEqual(
+            (
+                parallel_stdout.getvalue(),
+                parallel_stderr.getvalue(),
+                parallel_exit_code,
+            ),
+            (stdout.getvalue(), stderr.getvalue(), exit_code),
+        )
+        self.assertEqual(len(stderr.getvalue().splitlines()), 2 + 358 + 5 + 1)
+
+    def test_bundle(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        with open(os.path.join(directory, "other.json"), "w") as file:
+            file.write('{"definitions": {"foo": {"type": "integer"}}}')
+
+        stdout, stderr = StringIO(), StringIO()
+        exit_code = cli.run(
+            {
+                "validator": Draft4Validator,
+                "schema": {"$ref": "other.json#/definitions/foo"},
+                "instances": [12],
+                "error_format": None,
+                "bundle": True,
+                "base_uri": "file://" + directory + "/",
+            },
+            stdout=stdout,
+            stderr=stderr,
+        )
+        self.assertEqual(
+            json.loads(stdout.getvalue()),
+            {
+                "$ref": "#/definitions/other.json-definitions_foo",
+                "definitions": {
+                    "other.json-definitions_foo": {"type": "integer"},
+                },
+            },
+        )
+        self.assertFalse(stderr.getvalue())
+        self.assertEqual(exit_code, 0)
@@ -0,0 +1,174 @@
+"""
+Tests for schemas compiled into Python source code.
+
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from jsonschema import (
+    FormatChecker, ValidationError, draft3_format_checker,
+    draft4_format_checker, validators,
+)
+from jsonschema.exceptions import UnknownType
+from jsonschema.tests.test_compiler import compare_with_interpreted
+from jsonschema.tests.test_jsonschema_test_suite import DRAFT3, DRAFT4
+
+
+@compare_with_interpreted(tests=DRAFT3.tests())
+@compare_with_interpreted(
+    tests=DRAFT3.optional_tests_of(name="format"),
+    format_checker=draft3_format_checker,
+)
+@compare_with_interpreted(tests=DRAFT3.optional_tests_of(name="bignum"))
+@compare_with_interpreted(
+    tests=DRAFT3.optional_tests_of(name="zeroTerminatedFloats"),
+)
+class TestGeneratedDraft3(unittest.TestCase):
+    def compile(self, validator):
+        return validator.compile(backend="source")
+
+
+@compare_with_interpreted(tests=DRAFT4.tests())
+@compare_with_interpreted(
+    tests=DRAFT4.optional_tests_of(name="format"),
+    format_checker=draft4_format_checker,
+)
+@compare_with_interpreted(tests=DRAFT4.optional_tests_of(name="bignum"))
+@compare_with_interpreted(
+    tests=DRAFT4.optional_tests_of(name="zeroTerminatedFloats"),
+)
+class TestGeneratedDraft4(unittest.TestCase):
+    def compile(self, validator):
+        return validator.compile(backend="source")
+
+
+class TestGeneratedValidator(unittest.TestCase):
+    def test_validate(self):
+        validator = validators.Draft4Validator({"maxItems": 2})
+        generated = validator.compile(backend="source")
+        generated.validate([1])
+        with self.assertRaises(ValidationError) as e:
+            generated.validate([2, 3, 4])
+        self.assertEqual(e.exception.message, "[2, 3, 4] is too long")
+
+    def test_type_checks_are_inlined(self):
+        schema = {"properties": {"foo": {"type": "integer"}}}
+        generated = validators.Draft4Validator(schema).compile(
+            backend="source",
+        )
+        self.assertNotIn("is_type", generated.source)
+        self.assertIn("isinstance(instance, int_types)", generated.source)
+
+    def test_unknown_types_are_only_complained_about_when_checked(self):
+        schema = {"type": "object", "properties": {"foo": {"type": "bar"}}}
+        generated = validators.Draft4Validator(schema).compile(
+            backend="source",
+        )
+        self.assertTrue(generated.is_valid({}))
+        with self.assertRaises(UnknownType):
+            generated.is_valid({"foo": 12})
+
+    def test_custom_type_checkers_are_unsupported(self):
+        validator = validators.Draft4Validator(
+            {"type": "number"}, types={"number": (str,)},
+        )
+        with self.assertRaises(ValueError):
+            validator.compile(backend="source")
+
+    def test_custom_keywords_are_unsupported(self):
+        def even(validator, value, instance, schema):
+            return ()
+
+        Validator = validators.extend(
+            validators.Draft4Validator, validators={u"even": even},
+        )
+        with self.assertRaises(ValueError):
+            Validator({"even": True}).compile(backend="source")
+
+    def test_recursive_refs(self):
+        schema = {
+            "properties": {
+                "value": {"type": "integer"},
+                "next": {"$ref": "#"},
+            },
+        }
+        generated = validators.Draft4Validator(schema).compile(
+            backend="source",
+        )
+        instance = {"value": 1, "next": {"value": 2, "next": {"value": "3"}}}
+        error, = generated.iter_errors(instance)
+        self.assertEqual(list(error.path), ["next", "next", "value"])
+        self.assertEqual(generated.source.count("\ndef _v"), 3)
+
+    def test_object_keywords_walk_each_object_once(self):
+        schema = {
+            "properties": {"a": {"type": "integer"}},
+            "patternProperties": {"^x": {"type": "integer"}},
+            "additionalProperties": {"type": "string"},
+        }
+        generated = validators.Draft4Validator(schema).compile(
+            backend="source",
+        )
+        self.assertEqual(generated.source.count(".dispatch(instance)"), 1)
+        errors = generated.iter_errors({"a": "a", "x1": "1", "y": 2, "z": ""})
+        self.assertEqual(
+            sorted(list(error.path) for error in errors),
+            [["a"], ["x1"], ["y"]],
+        )
+
+    def test_patterns_with_flags(self):
+        schema = {"patternProperties": {"a": {}, "(?i)b": {"type": "string"}}}
+        generated = validators.Draft4Validator(schema).compile(
+            backend="source",
+        )
+        self.assertNotIn(".dispatch(instance)", generated.source)
+        self.assertTrue(generated.is_valid({"B": "1"}))
+        self.assertFalse(generated.is_valid({"B": 1}))
+
+    def test_patterns_which_cannot_be_combined(self):
+        schema = {
+            "patternProperties": {
+                "(?P<x>a)": {"type": "string"},
+                "(?P<x>b)": {},
+            },
+        }
+        generated = validators.Draft4Validator(schema).compile(
+            backend="source",
+        )
+        self.assertTrue(generated.is_valid({"b": 1}))
+        self.assertFalse(generated.is_valid({"a": 1}))
+
+
+class TestDump(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_dumped_modules_are_importable(self):
+        schema = {
+            "properties": {"foo": {"format": "ipv4", "minLength": 8}},
+        }
+        validator = validators.Draft4Validator(
+            schema, format_checker=FormatChecker(),
+        )
+        path = os.path.join(self.directory, "generated.py")
+        validator.compile(backend="source").dump(path)
+
+        sys.path.insert(0, self.directory)
+        self.addCleanup(sys.path.remove, self.directory)
+        self.addCleanup(sys.modules.pop, "generated", None)
+        import generated as module
+        self.assertEqual(
+            [error.message for error in module.iter_errors({"foo": "1"})],
+            ["'1' is too short"],
+        )
+
+        module.format_checker = validator.format_checker
+        self.assertEqual(
+            [error.message for error in module.iter_errors({"foo": "1"})],
+            ["'1' is not a 'ipv4'", "'1' is too short"],
+        )
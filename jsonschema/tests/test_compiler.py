@@ -0,0 +1,280 @@
+"""
+Tests for compiled schemas.
+
+The bulk of these check that compiling a schema produces exactly the same
+errors as the interpreted validator does, for every test in the official
+test suite.
+
+"""
+
+import gc
+import re
+import unittest
+import weakref
+
+from jsonschema import (
+    ValidationError,
+    _utils,
+    draft3_format_checker,
+    draft4_format_checker,
+    validators,
+)
+from jsonschema.compat import PY3
+from jsonschema.exceptions import UnknownType
+from jsonschema.tests.compat import mock
+from jsonschema.tests.test_jsonschema_test_suite import DRAFT3, DRAFT4
+
+
+def details(error):
+    return (
+        error.message,
+        error.validator,
+        error.validator_value,
+        list(error.path),
+        list(error.schema_path),
+        error.instance,
+        error.schema,
+        repr(error.cause),
+        [details(each) for each in error.context],
+    )
+
+
+def outcome(errors):
+    try:
+        return [details(error) for error in errors()]
+    except Exception as exception:
+        return repr(exception)
+
+
+def compare_with_interpreted(tests, **validate_kwargs):
+    def add_test_methods(test_class):
+        for test in tests:
+            test = test.with_validate_kwargs(**validate_kwargs)
+            name = "test_%s_%s_%s" % (
+                test.subject,
+                re.sub(r"[\W ]+", "_", test.case_description),
+                re.sub(r"[\W ]+", "_", test.description),
+            )
+            if not PY3:
+                name = name.encode("utf-8")
+
+            def fn(this, test=test):
+                validator = test.validator()
+                this.assertEqual(
+                    outcome(
+                        lambda: this.compile(validator).iter_errors(test.data),
+                    ),
+                    outcome(lambda: validator.iter_errors(test.data)),
+                )
+
+            fn.__name__ = name
+            assert not hasattr(test_class, name), test
+            setattr(test_class, name, fn)
+        return test_class
+    return add_test_methods
+
+
+@compare_with_interpreted(tests=DRAFT3.tests())
+@compare_with_interpreted(
+    tests=DRAFT3.optional_tests_of(name="format"),
+    format_checker=draft3_format_checker,
+)
+@compare_with_interpreted(tests=DRAFT3.optional_tests_of(name="bignum"))
+@compare_with_interpreted(
+    tests=DRAFT3.optional_tests_of(name="zeroTerminatedFloats"),
+)
+class TestCompiledDraft3(unittest.TestCase):
+    def compile(self, validator):
+        return validator.compile()
+
+
+@compare_with_interpreted(tests=DRAFT4.tests())
+@compare_with_interpreted(
+    tests=DRAFT4.optional_tests_of(name="format"),
+    format_checker=draft4_format_checker,
+)
+@compare_with_interpreted(tests=DRAFT4.optional_tests_of(name="bignum"))
+@compare_with_interpreted(
+    tests=DRAFT4.optional_tests_of(name="zeroTerminatedFloats"),
+)
+class TestCompiledDraft4(unittest.TestCase):
+    def compile(self, validator):
+        return validator.compile()
+
+
+class TestCompiledValidator(unittest.TestCase):
+    def test_validate(self):
+        compiled = validators.Draft4Validator({"maxItems": 2}).compile()
+        compiled.validate([1])
+        with self.assertRaises(ValidationError) as e:
+            compiled.validate([2, 3, 4])
+        self.assertEqual(e.exception.message, "[2, 3, 4] is too long")
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            validators.Draft4Validator({}).compile(backend="foo")
+
+    def test_unknown_keywords_are_ignored(self):
+        compiled = validators.Draft4Validator({"foo": "bar"}).compile()
+        self.assertTrue(compiled.is_valid(12))
+
+    def test_unknown_types_are_only_complained_about_when_checked(self):
+        schema = {"type": "object", "properties": {"foo": {"type": "bar"}}}
+        compiled = validators.Draft4Validator(schema).compile()
+        self.assertTrue(compiled.is_valid({}))
+        with self.assertRaises(UnknownType):
+            compiled.is_valid({"foo": 12})
+
+    def test_it_reuses_the_validator_type_checker(self):
+        validator = validators.Draft4Validator(
+            {"type": "number"}, types={"number": (str,)},
+        )
+        compiled = validator.compile()
+        self.assertTrue(compiled.is_valid("foo"))
+        self.assertFalse(compiled.is_valid(12))
+
+    def test_keywords_it_does_not_know_how_to_compile_are_called(self):
+        seen = []
+
+        def even(validator, value, instance, schema):
+            seen.append((validator.resolver.resolution_scope, instance))
+            if instance % 2:
+                yield ValidationError("%r is odd" % (instance,))
+
+        Validator = validators.extend(
+            validators.Draft4Validator, validators={u"even": even},
+        )
+        schema = {
+            "id": "http://example.com/",
+            "items": {"id": "foo/", "even": True},
+        }
+        compiled = Validator(schema).compile()
+
+        errors = list(compiled.iter_errors([2, 3]))
+        self.assertEqual(
+            [(e.message, e.validator, list(e.path)) for e in errors],
+            [("3 is odd", "even", [1])],
+        )
+        self.assertEqual(
+            seen, [
+                ("http://example.com/foo/", 2),
+                ("http://example.com/foo/", 3),
+            ],
+        )
+
+    def test_overridden_keywords_are_not_compiled(self):
+        def maxItems(validator, mI, instance, schema):
+            yield ValidationError("nope")
+
+        Validator = validators.extend(
+            validators.Draft4Validator, validators={u"maxItems": maxItems},
+        )
+        compiled = Validator({"maxItems": 2}).compile()
+        self.assertEqual(
+            [error.message for error in compiled.iter_errors([])], ["nope"],
+        )
+
+    def test_recursive_refs(self):
+        schema = {
+            "properties": {
+                "value": {"type": "integer"},
+                "next": {"$ref": "#"},
+            },
+        }
+        compiled = validators.Draft4Validator(schema).compile()
+        instance = {"value": 1, "next": {"value": 2, "next": {"value": "3"}}}
+        error, = compiled.iter_errors(instance)
+        self.assertEqual(list(error.path), ["next", "next", "value"])
+
+    def test_refs_are_resolved_in_the_scope_they_appear_in(self):
+        schema = {
+            "id": "http://example.com/root.json",
+            "items": {
+                "id": "nested/",
+                "items": {"$ref": "item.json"},
+            },
+        }
+        resolver = validators.RefResolver.from_schema(
+            schema, store={
+                "http://example.com/nested/item.json": {"type": "integer"},
+            },
+        )
+        validator = validators.Draft4Validator(schema, resolver=resolver)
+        compiled = validator.compile()
+        self.assertTrue(compiled.is_valid([[1, 2]]))
+        self.assertFalse(compiled.is_valid([[1, "2"]]))
+        self.assertEqual(resolver.resolution_scope, schema["id"])
+
+    def test_refs_are_resolved_lazily(self):
+        schema = {"anyOf": [{}, {"$ref": "http://example.com/unreachable"}]}
+        compiled = validators.Draft4Validator(schema).compile()
+        self.assertTrue(compiled.is_valid(12))
+
+    def test_object_keywords_walk_each_object_once(self):
+        schema = {
+            "properties": {"a": {"type": "integer"}},
+            "patternProperties": {
+                "^x": {"type": "integer"},
+                "x$": {"minimum": 5},
+            },
+            "required": ["a"],
+            "additionalProperties": {"type": "string"},
+        }
+        instance = dict(
+            ("%s%s" % (prefix, i), i)
+            for prefix in ("x", "y", "zx") for i in range(100)
+        )
+        instance.update(a="a", xx=3, yy="yy")
+        validator = validators.Draft4Validator(schema)
+        compiled = validator.compile()
+
+        dispatch = _utils.PropertyDispatcher.dispatch
+        with mock.patch.object(
+            _utils.PropertyDispatcher, "dispatch", autospec=True,
+            side_effect=dispatch,
+        ) as walked:
+            errors = outcome(lambda: compiled.iter_errors(instance))
+        self.assertEqual(walked.call_count, 1)
+        self.assertEqual(
+            errors, outcome(lambda: validator.iter_errors(instance)),
+        )
+
+    def test_compiled_schemas_do_not_hold_on_to_instances(self):
+        class Object(dict):
+            pass
+
+        schema = {
+            "patternProperties": {"^x": {"type": "integer"}},
+            "additionalProperties": False,
+        }
+        compiled = validators.Draft4Validator(schema).compile()
+        instance = Object(x="x", y=1)
+        self.assertFalse(compiled.is_valid(instance))
+        reference = weakref.ref(instance)
+        del instance
+        gc.collect()
+        self.assertIsNone(reference())
+
+    def test_object_keywords_of_recursive_schemas(self):
+        schema = {
+            "patternProperties": {"^n": {"$ref": "#"}},
+            "additionalProperties": {"type": "integer"},
+        }
+        instance = {"n1": {"n2": {"a": "a"}, "b": "b"}, "c": "c"}
+        validator = validators.Draft4Validator(schema)
+        self.assertEqual(
+            outcome(lambda: validator.compile().iter_errors(instance)),
+            outcome(lambda: validator.iter_errors(instance)),
+        )
+
+    def test_patterns_which_refer_to_their_groups(self):
+        schema = {
+            "patternProperties": {"(x)": {}, "^(a)\\1$": {"minimum": 5}},
+            "additionalProperties": False,
+        }
+        validator = validators.Draft4Validator(schema)
+        for instance in {"aa": 3}, {"aa": 7, "x": 1}, {"b": 2}:
+            self.assertEqual(
+                outcome(lambda: validator.compile().iter_errors(instance)),
+                outcome(lambda: validator.iter_errors(instance)),
+            )
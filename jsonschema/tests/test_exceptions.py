@@ -1,7 +1,7 @@
 from unittest import TestCase
 import textwrap
 
-from jsonschema import Draft4Validator, exceptions
+from jsonschema import Draft4Validator, _utils, exceptions
 from jsonschema.compat import PY3
 from jsonschema.tests.compat import mock
 
@@ -288,6 +288,93 @@ class TestErrorTree(TestCase):
         self.assertIsInstance(tree["foo"], exceptions.ErrorTree)
 
 
+class TestCompactErrorTree(TestCase):
+    def test_it_counts_errors_in_each_subtree(self):
+        errors = [
+            exceptions.ValidationError("1", validator="foo", path=["bar", 0]),
+            exceptions.ValidationError("2", validator="foo", path=["bar", 1]),
+            exceptions.ValidationError("3", validator="foo", path=["baz"]),
+            exceptions.ValidationError("4", validator="foo"),
+        ]
+        tree = exceptions.CompactErrorTree(errors)
+        self.assertEqual(
+            (len(tree), len(tree["bar"]), len(tree["bar"][0])), (4, 2, 1),
+        )
+
+    def test_it_can_be_fed_errors_incrementally(self):
+        tree = exceptions.CompactErrorTree()
+        self.assertNotIn("bar", tree)
+        tree.add(exceptions.ValidationError("1", path=["bar"]))
+        self.assertIn("bar", tree)
+        tree.extend([exceptions.ValidationError("2", path=["bar", 0])])
+        self.assertEqual((len(tree), list(tree["bar"])), (2, [0]))
+
+    def test_it_stores_records(self):
+        error = exceptions.ValidationError(
+            "a message",
+            validator="foo",
+            path=["bar", 0],
+            schema_path=["items", "foo"],
+            instance=12,
+        )
+        tree = exceptions.CompactErrorTree([error])
+        self.assertEqual(
+            tree["bar"][0].errors, {
+                "foo": exceptions.ErrorRecord(
+                    message="a message",
+                    validator="foo",
+                    path=("bar", 0),
+                    schema_path=("items", "foo"),
+                ),
+            },
+        )
+
+    def test_records_share_their_nodes_path(self):
+        tree = exceptions.CompactErrorTree(
+            exceptions.ValidationError("", validator=validator, path=[0])
+            for validator in ["foo", "bar"]
+        )
+        foo, bar = tree[0].errors["foo"], tree[0].errors["bar"]
+        self.assertIs(foo.path, bar.path)
+
+    def test_max_errors_per_node(self):
+        tree = exceptions.CompactErrorTree(
+            [
+                exceptions.ValidationError("1", validator="foo", path=[0]),
+                exceptions.ValidationError("2", validator="bar", path=[0]),
+                exceptions.ValidationError("3", validator="foo", path=[0]),
+                exceptions.ValidationError("4", validator="baz"),
+            ],
+            max_errors_per_node=1,
+        )
+        self.assertEqual(
+            dict(
+                (validator, record.message)
+                for validator, record in tree[0].errors.items()
+            ),
+            {"foo": "3"},
+        )
+        self.assertEqual((len(tree), len(tree[0])), (4, 3))
+        self.assertEqual(list(tree.errors), ["baz"])
+
+    def test_missing_indices_are_empty_and_not_added(self):
+        tree = exceptions.CompactErrorTree()
+        self.assertEqual((len(tree["foo"]), tree["foo"].errors), (0, {}))
+        self.assertNotIn("foo", tree)
+
+    def test_it_agrees_with_error_tree(self):
+        schema = {"items": {"type": "string", "minLength": 3}}
+        instance = ["a", 1, "abc", 2]
+        errors = list(Draft4Validator(schema).iter_errors(instance))
+        tree = exceptions.ErrorTree(errors)
+        compact = exceptions.CompactErrorTree(errors)
+        self.assertEqual(
+            [(i, sorted(compact[i].errors)) for i in sorted(compact)],
+            [(i, sorted(tree[i].errors)) for i in sorted(tree)],
+        )
+        self.assertEqual(len(compact), len(tree))
+
+
 class TestErrorInitReprStr(TestCase):
     def make_error(self, **kwargs):
         defaults = dict(
@@ -399,3 +486,57 @@ class TestErrorInitReprStr(TestCase):
         )
         str(error)
         self.assertFalse(instance.__eq__.called)
+
+
+class Repred(object):
+    reprs = 0
+
+    def __repr__(self):
+        self.reprs += 1
+        return "<Repred>"
+
+
+class TestLazyMessages(TestCase):
+    def test_messages_are_only_formatted_when_accessed(self):
+        instance = Repred()
+        error = exceptions.ValidationError(
+            _utils.Message("%r is too long", instance),
+        )
+        self.assertEqual(instance.reprs, 0)
+        self.assertEqual(error.message, "<Repred> is too long")
+        self.assertEqual(str(error), "<Repred> is too long")
+        self.assertEqual(instance.reprs, 1)
+
+    def test_messages_can_be_assigned(self):
+        error = exceptions.ValidationError(_utils.Message("%r is bad", 12))
+        error.message = "something else"
+        self.assertEqual(str(error), "something else")
+
+    def test_create_from_keeps_messages_lazy(self):
+        instance = Repred()
+        error = exceptions.ValidationError(
+            _utils.Message("%r is too long", instance),
+        )
+        schema_error = exceptions.SchemaError.create_from(error)
+        self.assertEqual(instance.reprs, 0)
+        self.assertEqual(schema_error.message, error.message)
+
+    def test_small_instances_are_shown_exactly(self):
+        instance = {u"foo": [1, 2.5, None, True, (u"bar",)], u"baz": {}}
+        error = exceptions.ValidationError(
+            _utils.Message("%r is bad, %s", instance, u"so %r"),
+        )
+        self.assertEqual(error.message, "%r is bad, so %%r" % (instance,))
+
+    def test_large_instances_are_truncated(self):
+        error, = Draft4Validator({"maxItems": 1}).iter_errors(
+            list(range(10 ** 6)),
+        )
+        self.assertEqual(
+            error.message,
+            repr(list(range(10 ** 6)))[:_utils.REPR_LIMIT] + "... is too long",
+        )
+
+    def test_large_strings_are_truncated(self):
+        error, = Draft4Validator({"maxLength": 1}).iter_errors(u"a" * 10 ** 6)
+        self.assertEqual(len(error.message), _utils.REPR_LIMIT + 15)
@@ -0,0 +1,62 @@
+from unittest import TestCase
+import pickle
+
+from jsonschema import Draft3Validator, FormatChecker, parallel
+from jsonschema.exceptions import ErrorRecord
+
+
+class TestValidateMany(TestCase):
+    def test_results_are_in_input_order(self):
+        schema = {"items": {"type": "integer"}}
+        instances = [
+            [index, str(index)] if index % 3 else [] for index in range(50)
+        ]
+        results = parallel.validate_many(
+            schema, instances, workers=2, chunksize=7,
+        )
+        self.assertEqual(
+            results, [
+                [
+                    ErrorRecord(
+                        message="%r is not of type 'integer'" % (str(index),),
+                        validator="type",
+                        path=(1,),
+                        schema_path=("items", "type"),
+                    ),
+                ] if index % 3 else []
+                for index in range(50)
+            ],
+        )
+
+    def test_instances_can_be_any_iterable(self):
+        results = parallel.validate_many(
+            {"minimum": 3}, iter(range(5)), workers=1, chunksize=2,
+        )
+        self.assertEqual([len(errors) for errors in results], [1, 1, 1, 0, 0])
+
+    def test_refs_are_resolved_from_the_store(self):
+        schema = {"$ref": "http://example.com/integer.json"}
+        store = {"http://example.com/integer.json": {"type": "integer"}}
+        results = parallel.validate_many(
+            schema, [1, "foo"], workers=1, store=store,
+        )
+        self.assertEqual([len(errors) for errors in results], [0, 1])
+
+    def test_cls_and_format_checker(self):
+        results = parallel.validate_many(
+            {"type": "any", "format": "ipv4"},
+            ["1.1.1.1", "foo"],
+            workers=1,
+            cls=Draft3Validator,
+            format_checker=FormatChecker(),
+        )
+        self.assertEqual([len(errors) for errors in results], [0, 1])
+
+
+class TestErrorRecord(TestCase):
+    def test_it_is_picklable(self):
+        record = ErrorRecord(
+            message="foo", validator="type", path=[0], schema_path=["type"],
+        )
+        self.assertEqual(pickle.loads(pickle.dumps(record)), record)
+        self.assertEqual(record.path, (0,))
@@ -0,0 +1,78 @@
+"""
+Tests for checking validity without creating errors.
+
+These check that `IValidator.is_valid` agrees with whether
+`IValidator.iter_errors` produces any errors, for every test in the official
+test suite.
+
+"""
+
+import re
+import unittest
+
+from jsonschema import draft3_format_checker, draft4_format_checker
+from jsonschema.compat import PY3
+from jsonschema.tests.test_jsonschema_test_suite import DRAFT3, DRAFT4
+
+
+def outcome(fn):
+    try:
+        return fn()
+    except Exception as exception:
+        return repr(exception)
+
+
+def compare_with_iter_errors(tests, **validate_kwargs):
+    def add_test_methods(test_class):
+        for test in tests:
+            test = test.with_validate_kwargs(**validate_kwargs)
+            name = "test_%s_%s_%s" % (
+                test.subject,
+                re.sub(r"[\W ]+", "_", test.case_description),
+                re.sub(r"[\W ]+", "_", test.description),
+            )
+            if not PY3:
+                name = name.encode("utf-8")
+
+            def fn(this, test=test):
+                validator = test.validator()
+                this.assertEqual(
+                    outcome(lambda: validator.is_valid(test.data)),
+                    outcome(
+                        lambda: next(
+                            validator.iter_errors(test.data), None,
+                        ) is None,
+                    ),
+                )
+
+            fn.__name__ = name
+            assert not hasattr(test_class, name), test
+            setattr(test_class, name, fn)
+        return test_class
+    return add_test_methods
+
+
+@compare_with_iter_errors(tests=DRAFT3.tests())
+@compare_with_iter_errors(
+    tests=DRAFT3.optional_tests_of(name="format"),
+    format_checker=draft3_format_checker,
+)
+@compare_with_iter_errors(tests=DRAFT3.optional_tests_of(name="bignum"))
+@compare_with_iter_errors(
+    tests=DRAFT3.optional_tests_of(name="zeroTerminatedFloats"),
+)
+class TestDraft3Predicates(unittest.TestCase):
+    pass
+
+
+@compare_with_iter_errors(tests=DRAFT4.tests())
+@compare_with_iter_errors(
+    tests=DRAFT4.optional_tests_of(name="format"),
+    format_checker=draft4_format_checker,
+)
+@compare_with_iter_errors(tests=DRAFT4.optional_tests_of(name="bignum"))
+@compare_with_iter_errors(
+    tests=DRAFT4.optional_tests_of(name="zeroTerminatedFloats"),
+)
+class TestDraft4Predicates(unittest.TestCase):
+    pass
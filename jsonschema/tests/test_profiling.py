@@ -0,0 +1,123 @@
+from unittest import TestCase
+
+from jsonschema import Draft4Validator, RefResolver
+from jsonschema.profiling import Profile
+
+
+class TestProfile(TestCase):
+    def setUp(self):
+        self.profile = Profile()
+        self.Validator = self.profile.instrument(Draft4Validator)
+
+    def calls(self):
+        stats = self.profile.as_dict()
+        return (
+            dict(
+                (keyword, each["calls"])
+                for keyword, each in stats["keywords"].items()
+            ),
+            dict(
+                (path, each["calls"])
+                for path, each in stats["paths"].items()
+            ),
+        )
+
+    def test_counts_calls_per_keyword_and_path(self):
+        schema = {
+            "properties": {
+                "foo": {"items": {"minimum": 3}},
+                "bar": {"$ref": "#/definitions/bar"},
+            },
+            "definitions": {"bar": {"type": "string"}},
+        }
+        validator = self.Validator(schema)
+        errors = list(validator.iter_errors({"foo": [1, 2, 3], "bar": 12}))
+        self.assertEqual(len(errors), 3)
+        self.assertEqual(
+            self.calls(), (
+                {
+                    "properties": 1,
+                    "items": 1,
+                    "minimum": 3,
+                    "$ref": 1,
+                    "type": 1,
+                },
+                {
+                    "#/properties": 1,
+                    "#/properties/foo/items": 1,
+                    "#/properties/foo/items/minimum": 3,
+                    "#/properties/bar/$ref": 1,
+                    "#/definitions/bar/type": 1,
+                },
+            ),
+        )
+
+    def test_is_valid_is_recorded(self):
+        validator = self.Validator({"minimum": 3})
+        self.assertTrue(validator.is_valid(4))
+        self.assertFalse(validator.is_valid(2))
+        self.assertEqual(
+            self.calls(), ({"minimum": 2}, {"#/minimum": 2}),
+        )
+
+    def test_remote_references(self):
+        resolver = RefResolver(
+            "",
+            {},
+            store={
+                "http://example.com/": {"definitions": {"a": {"type": []}}},
+            },
+        )
+        validator = self.Validator(
+            {"$ref": "http://example.com/#/definitions/a"},
+            resolver=resolver,
+        )
+        validator.is_valid(12)
+        self.assertEqual(
+            self.calls()[1], {
+                "#/$ref": 1,
+                "http://example.com/#/definitions/a/type": 1,
+            },
+        )
+
+    def test_times_are_cumulative(self):
+        validator = self.Validator({"items": {"items": {"type": "string"}}})
+        validator.is_valid([[u"foo"] * 100] * 100)
+        keywords = self.profile.as_dict()["keywords"]
+        self.assertGreaterEqual(
+            keywords["items"]["time"], keywords["type"]["time"],
+        )
+        self.assertGreater(keywords["type"]["time"], 0)
+
+    def test_abandoned_iteration(self):
+        validator = self.Validator({"items": {"type": "string"}})
+        errors = validator.iter_errors([1, 2, 3])
+        next(errors)
+        errors.close()
+        self.assertEqual(self.calls()[0], {"items": 1, "type": 1})
+
+    def test_original_class_is_untouched(self):
+        Draft4Validator({"minimum": 3}).validate(4)
+        self.assertIsNot(self.Validator, Draft4Validator)
+        self.assertEqual(self.calls(), ({}, {}))
+
+    def test_reset(self):
+        self.Validator({"minimum": 3}).validate(4)
+        self.profile.reset()
+        self.assertEqual(self.calls(), ({}, {}))
+
+    def test_report(self):
+        self.Validator({"minimum": 3}).validate(4)
+        self.Validator({"minimum": 3}).validate(5)
+        report = self.profile.report().splitlines()
+        self.assertEqual(
+            [line.split()[0] for line in report if line],
+            ["ncalls", "2", "ncalls", "2"],
+        )
+        self.assertEqual(report[1].split()[-1], "minimum")
+        self.assertEqual(report[-1].split()[-1], "#/minimum")
+
+    def test_report_limit(self):
+        self.Validator({"minimum": 3, "maximum": 5}).validate(4)
+        report = self.profile.report(limit=1)
+        self.assertEqual(len(report.splitlines()), 5)
@@ -3,7 +3,7 @@ Tests on the new type interface. The actual correctness of the type checking
 is handled in test_jsonschema_test_suite; these tests check that TypeChecker
 functions correctly and can facilitate extensions to type checking
 """
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 from unittest import TestCase
 
 from jsonschema import _types, ValidationError, _validators
@@ -144,6 +144,62 @@ class TestTypeChecker(TestCase):
         self.assertIn("internal error", str(context.exception))
 
 
+class TestTypeDispatch(TestCase):
+    instances = [
+        None, True, False, 0, 1, 1.5, u"", u"foo", b"foo", [], [1], {},
+        {u"a": 1}, (), set(), object(), OrderedDict(), type("S", (str,), {})(),
+    ]
+
+    def test_built_in_checkers_agree_with_their_functions(self):
+        for checker in _types.draft3_type_checker, _types.draft4_type_checker:
+            for type, fn in checker._type_checkers.items():
+                for instance in self.instances:
+                    self.assertEqual(
+                        checker.is_type(instance, type),
+                        fn(checker, instance),
+                        msg="%r is_type %r" % (instance, type),
+                    )
+
+    def test_classify_agrees_with_is_type(self):
+        for checker in _types.draft3_type_checker, _types.draft4_type_checker:
+            for instance in self.instances:
+                self.assertEqual(
+                    checker.classify(instance),
+                    frozenset(
+                        type for type in checker._type_checkers
+                        if checker.is_type(instance, type)
+                    ),
+                    msg="%r" % (instance,),
+                )
+
+    def test_classify_redefined_types(self):
+        checker = _types.draft4_type_checker.redefine(
+            u"integer", is_int_or_string_int,
+        )
+        self.assertEqual(
+            checker.classify(u"12"), frozenset([u"integer", u"string"]),
+        )
+        self.assertEqual(checker.classify(12.5), frozenset([u"number"]))
+
+    def test_subclasses_are_checked_with_their_functions(self):
+        checker = _types.draft4_type_checker
+        self.assertTrue(checker.is_type(OrderedDict(), u"object"))
+
+    def test_redefined_types_are_not_dispatched_by_type(self):
+        checker = _types.draft4_type_checker.redefine(
+            u"integer", is_int_or_string_int,
+        )
+        self.assertTrue(checker.is_type(u"12", u"integer"))
+        self.assertTrue(checker.is_type(u"12", u"string"))
+        self.assertFalse(checker.is_type(12.5, u"integer"))
+
+    def test_removed_types_are_unknown(self):
+        checker = _types.draft4_type_checker.remove(u"object")
+        with self.assertRaises(UndefinedTypeCheck):
+            checker.is_type({}, u"object")
+        self.assertFalse(checker.is_type({}, u"array"))
+
+
 class TestCustomTypes(TestCase):
 
     def test_simple_type_can_be_extended(self):
@@ -2,8 +2,18 @@ from collections import deque
 from contextlib import contextmanager
 from unittest import TestCase
 import ujson as json
+import itertools
+import re
 import sys
+import threading
+import time
 import unittest
+import warnings
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
 
 from twisted.trial.unittest import SynchronousTestCase
 
@@ -13,8 +23,12 @@ from jsonschema import (
     ValidationError,
     TypeChecker,
     _types,
+    _utils,
+    _validators,
+    exceptions,
     validators,
 )
+from jsonschema.compat import PY3, lru_cache
 from jsonschema.tests.compat import mock
 
 
@@ -283,6 +297,119 @@ class TestIterErrors(TestCase):
         self.assertEqual(len(errors), 4)
 
 
+class TestErrorLimits(TestCase):
+    def errors(self, schema, instance, cls=validators.Draft4Validator, **kw):
+        """
+        Validate with each of the interpreted and compiled validators.
+
+        """
+
+        validator = cls(schema, **kw)
+        results = [
+            list(validator.iter_errors(instance)),
+            list(validator.compile().iter_errors(instance)),
+            list(validator.compile(backend="source").iter_errors(instance)),
+        ]
+        for errors in results[1:]:
+            self.assertEqual(
+                [(e.message, list(e.path)) for e in errors],
+                [(e.message, list(e.path)) for e in results[0]],
+            )
+            self.assertEqual(
+                [len(e.context) for e in errors],
+                [len(e.context) for e in results[0]],
+            )
+        return results[0]
+
+    def test_max_errors(self):
+        errors = self.errors(
+            {u"items": {u"type": u"string"}}, list(range(100)), max_errors=3,
+        )
+        self.assertEqual(
+            [list(error.path) for error in errors], [[0], [1], [2]],
+        )
+
+    def test_stop_on_first(self):
+        errors = self.errors(
+            {u"items": {u"type": u"string"}, u"minItems": 200},
+            list(range(100)),
+            max_errors=1,
+        )
+        self.assertEqual(len(errors), 1)
+
+    def test_errors_are_not_looked_for_past_the_limit(self):
+        seen = []
+
+        def counted(validator, value, instance, schema):
+            seen.append(instance)
+            yield ValidationError("counted")
+
+        Validator = validators.extend(
+            validators.Draft4Validator, {u"counted": counted},
+        )
+        validator = Validator({u"items": {u"counted": True}}, max_errors=2)
+        errors = validator.iter_errors(list(range(100)))
+        self.assertEqual(len(list(errors)), 2)
+        self.assertEqual(seen, [0, 1])
+
+    def test_max_errors_per_path(self):
+        errors = self.errors(
+            {
+                u"items": {u"type": u"string", u"enum": [u"a"]},
+                u"maxItems": 1,
+                u"minItems": 3,
+            },
+            [1, 2],
+            max_errors_per_path=1,
+        )
+        self.assertEqual(
+            sorted(list(error.path) for error in errors), [[], [0], [1]],
+        )
+
+    def test_limits_do_not_apply_to_explicit_schemas(self):
+        validator = validators.Draft4Validator({}, max_errors=1)
+        errors = validator.iter_errors(
+            [1, 2], {u"items": {u"type": u"string"}},
+        )
+        self.assertEqual(len(list(errors)), 2)
+
+    def test_max_context_errors_anyOf(self):
+        branch = {u"type": u"string", u"minimum": 3}
+        errors = self.errors(
+            {u"anyOf": [branch, branch, branch]}, 1, max_context_errors=3,
+        )
+        self.assertEqual([len(error.context) for error in errors], [3])
+
+    def test_max_context_errors_oneOf(self):
+        branch = {u"type": u"string", u"minimum": 3}
+        errors = self.errors(
+            {u"oneOf": [branch, branch, branch]}, 1, max_context_errors=1,
+        )
+        self.assertEqual([len(error.context) for error in errors], [1])
+
+    def test_max_context_errors_draft3_type(self):
+        branch = {u"type": u"string", u"minimum": 3}
+        errors = self.errors(
+            {u"type": [branch, branch]},
+            1,
+            cls=validators.Draft3Validator,
+            max_context_errors=3,
+        )
+        self.assertEqual([len(error.context) for error in errors], [3])
+
+    def test_valid_branches_past_the_context_limit(self):
+        invalid = {u"type": u"string", u"minimum": 3}
+        errors = self.errors(
+            {u"anyOf": [invalid, invalid, {}]}, 1, max_context_errors=1,
+        )
+        self.assertEqual(errors, [])
+
+    def test_no_limits(self):
+        branch = {u"type": u"string", u"minimum": 3}
+        errors = self.errors({u"anyOf": [branch, branch, branch]}, 1)
+        self.assertEqual([len(error.context) for error in errors], [6])
+
+
 class TestValidationErrorMessages(TestCase):
     def message_for(self, instance, schema, *args, **kwargs):
         kwargs.setdefault("cls", validators.Draft3Validator)
@@ -290,6 +417,27 @@ class TestValidationErrorMessages(TestCase):
             validators.validate(instance, schema, *args, **kwargs)
         return e.exception.message
 
+    def test_uniqueItems(self):
+        message = self.message_for(
+            instance=[1, 2, 3, 2.0], schema={u"uniqueItems": True},
+        )
+        self.assertEqual(
+            message,
+            "[1, 2, 3, 2.0] has non-unique elements (items 1 and 3 are equal)",
+        )
+
+    def test_compiled_uniqueItems(self):
+        validator = validators.Draft4Validator({u"uniqueItems": True})
+        for backend in "closures", "source":
+            errors = validator.compile(backend).iter_errors([{}, [], {}])
+            self.assertEqual(
+                [error.message for error in errors],
+                [
+                    "[{}, [], {}] has non-unique elements "
+                    "(items 0 and 2 are equal)",
+                ],
+            )
+
     def test_single_type_failure(self):
         message = self.message_for(instance=1, schema={u"type": u"string"})
         self.assertEqual(message, "1 is not of type %r" % u"string")
@@ -802,24 +950,67 @@ class ValidatorTestMixin(object):
         self.validator = self.validator_class(self.schema)
 
     def test_valid_instances_are_valid(self):
-        errors = iter([])
-
-        with mock.patch.object(
-            self.validator, "iter_errors", return_value=errors,
-        ):
-            self.assertTrue(
-                self.validator.is_valid(self.instance, self.schema)
-            )
+        self.assertTrue(self.validator.is_valid([1, 2], {"maxItems": 2}))
 
     def test_invalid_instances_are_not_valid(self):
-        errors = iter([mock.Mock()])
+        self.assertFalse(self.validator.is_valid([1, 2, 3], {"maxItems": 2}))
 
+    def test_is_valid_does_not_create_errors(self):
+        schema = {
+            "items": {"maxItems": 1},
+            "anyOf": [{"minItems": 3}, {"items": {"type": "string"}}],
+        }
         with mock.patch.object(
-            self.validator, "iter_errors", return_value=errors,
+            ValidationError, "__init__", side_effect=AssertionError,
         ):
-            self.assertFalse(
-                self.validator.is_valid(self.instance, self.schema)
-            )
+            self.assertFalse(self.validator.is_valid([[1], [1, 2]], schema))
+
+    def test_is_valid_with_validators_without_a_predicate(self):
+        def even(validator, value, instance, schema):
+            if instance % 2:
+                yield ValidationError("%r is odd" % (instance,))
+
+        Validator = validators.extend(
+            self.validator_class, validators={u"even": even},
+        )
+        validator = Validator({"even": True})
+        self.assertTrue(validator.is_valid(2))
+        self.assertFalse(validator.is_valid(3))
+
+    def test_iter_errors_many(self):
+        validator = self.validator_class({"items": {"maxLength": 1}})
+        results = dict(
+            validator.iter_errors_many([[], ["a", "bb"], ["c"], ["dd", "ee"]]),
+        )
+        self.assertEqual(
+            dict(
+                (index, [(e.message, list(e.path)) for e in errors])
+                for index, errors in results.items()
+            ), {
+                1: [("'bb' is too long", [1])],
+                3: [("'dd' is too long", [0]), ("'ee' is too long", [1])],
+            },
+        )
+
+    def test_iter_errors_many_is_lazy(self):
+        validator = self.validator_class({"maxItems": 1})
+
+        def instances():
+            yield [1, 2]
+            raise AssertionError("Consumed too many instances!")
+
+        (index, errors), = itertools.islice(
+            validator.iter_errors_many(instances()), 1,
+        )
+        self.assertEqual(index, 0)
+
+    def test_validate_many(self):
+        validator = self.validator_class({"items": {"maxLength": 1}})
+        validator.validate_many([[], ["a", "b"]])
+        with self.assertRaises(ValidationError) as e:
+            validator.validate_many([[], ["a", "bb"], ["cc"]])
+        self.assertEqual(e.exception.message, "'bb' is too long")
+        self.assertEqual(list(e.exception.path), [1, 1])
 
     def test_non_existent_properties_are_ignored(self):
         instance, my_property, my_value = mock.Mock(), mock.Mock(), mock.Mock()
@@ -858,6 +1049,27 @@ class ValidatorTestMixin(object):
         with self.assertRaises(ValidationError):
             self.validator_class(schema, resolver=resolver).validate(None)
 
+    def test_it_creates_a_regex_cache_if_not_provided(self):
+        schema = {"items": {"pattern": "^a"}}
+        validator = self.validator_class(schema)
+        validator.validate(["a", "ab", "abc"])
+        info = validator.regex_cache.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 1))
+
+    def test_it_uses_the_provided_regex_cache(self):
+        regex_cache = lru_cache(maxsize=1)(re.compile)
+        schema = {
+            "properties": {"foo": {"pattern": "^a"}},
+            "patternProperties": {"^b": {}, "^c": {}},
+            "additionalProperties": False,
+        }
+        validator = self.validator_class(schema, regex_cache=regex_cache)
+        self.assertTrue(validator.is_valid({"foo": "a", "bar": 1, "cat": 2}))
+        self.assertFalse(validator.is_valid({"foo": "a", "dog": 1}))
+        self.assertFalse(validator.is_valid({"foo": "b"}))
+        self.assertEqual(regex_cache.cache_info().currsize, 1)
+        self.assertGreater(regex_cache.cache_info().misses, 3)
+
     def test_is_type_is_true_for_valid_type(self):
         self.assertTrue(self.validator.is_type("foo", "string"))
 
@@ -962,6 +1174,9 @@ class TestValidatorFor(TestCase):
 
 
 class TestValidate(TestCase):
+    def setUp(self):
+        validators.validator_cache.clear()
+
     def test_draft3_validator_is_chosen(self):
         schema = {"$schema": "http://json-schema.org/draft-03/schema#"}
         with mock.patch.object(
@@ -1013,6 +1228,180 @@ class TestValidate(TestCase):
         )
 
 
+class TestValidatorCache(TestCase):
+    def setUp(self):
+        self.cache = validators.ValidatorCache(maxsize=2)
+
+    def test_schemas_are_only_checked_once(self):
+        with mock.patch.object(
+            validators.Draft4Validator, "check_schema",
+        ) as check_schema:
+            first = self.cache.validator({u"type": u"string"})
+            second = self.cache.validator({u"type": u"string"})
+        check_schema.assert_called_once_with({u"type": u"string"})
+        self.assertIs(first, second)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_changed_schemas_are_checked_again(self):
+        schema = {u"type": u"string"}
+        first = self.cache.validator(schema)
+        schema[u"type"] = u"integer"
+        second = self.cache.validator(schema)
+        self.assertIsNot(first, second)
+        self.assertTrue(second.is_valid(12))
+
+    def test_cached_validators_are_unaffected_by_later_changes(self):
+        schema = {u"type": u"string"}
+        self.cache.validator(schema)
+        schema[u"type"] = u"integer"
+        validator = self.cache.validator({u"type": u"string"})
+        self.assertTrue(validator.is_valid(u"x"))
+
+    def test_floats_are_not_integers(self):
+        self.cache.validator({u"minLength": 1})
+        with self.assertRaises(SchemaError):
+            self.cache.validator({u"minLength": 1.0})
+
+    def test_booleans_are_not_numbers(self):
+        first = self.cache.validator({u"enum": [1]})
+        second = self.cache.validator({u"enum": [True]})
+        self.assertIsNot(first, second)
+
+    def test_classes_and_arguments_are_part_of_the_key(self):
+        schema = {}
+        draft4 = self.cache.validator(schema)
+        draft3 = self.cache.validator(schema, validators.Draft3Validator)
+        checker = FormatChecker()
+        formats = self.cache.validator(schema, format_checker=checker)
+        self.assertEqual(
+            [draft4.__class__, draft3.__class__, formats.format_checker],
+            [validators.Draft4Validator, validators.Draft3Validator, checker],
+        )
+
+    def test_unhashable_arguments_are_not_cached(self):
+        self.cache.validator({}, types={u"array": (list, tuple)})
+        self.assertEqual(len(self.cache), 0)
+
+    def test_least_recently_used_are_evicted(self):
+        first = self.cache.validator({u"minimum": 1})
+        self.cache.validator({u"minimum": 2})
+        self.cache.validator({u"minimum": 1})
+        self.cache.validator({u"minimum": 3})
+        self.assertIs(self.cache.validator({u"minimum": 1}), first)
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.misses, 3)
+
+    def test_invalid_schemas_are_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(SchemaError):
+                self.cache.validator({u"type": 12})
+        self.assertEqual((len(self.cache), self.cache.misses), (0, 2))
+
+    def test_invalidate(self):
+        first = self.cache.validator({u"minimum": 1})
+        self.cache.validator({u"minimum": 1}, validators.Draft3Validator)
+        self.cache.validator({u"minimum": 2})
+        self.cache.invalidate({u"minimum": 1})
+        self.assertEqual(len(self.cache), 1)
+        self.assertIsNot(self.cache.validator({u"minimum": 1}), first)
+
+    def test_clear(self):
+        self.cache.validator({u"minimum": 1})
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_validate_uses_the_cache(self):
+        validators.validator_cache.clear()
+        validators.validate(12, {u"type": u"integer", u"minimum": 3})
+        validator = validators.validator_cache.validator(
+            {u"minimum": 3, u"type": u"integer"},
+        )
+        self.assertEqual(validator.schema[u"minimum"], 3)
+        self.assertEqual(len(validators.validator_cache), 1)
+
+
+class TestCheckedSchemas(TestCase):
+    def setUp(self):
+        self.checked = validators.CheckedSchemas(maxsize=2)
+
+    def test_valid_schemas_are_remembered(self):
+        schema = {u"type": u"string"}
+        self.checked.check(validators.Draft4Validator, schema)
+        with mock.patch.object(
+            validators.Draft4Validator, "compile",
+        ) as compile:
+            self.checked.check(validators.Draft4Validator, dict(schema))
+        self.assertFalse(compile.called)
+        self.assertEqual((self.checked.hits, self.checked.misses), (1, 1))
+
+    def test_invalid_schemas_are_not(self):
+        for _ in range(2):
+            with self.assertRaises(SchemaError):
+                self.checked.check(validators.Draft4Validator, {u"type": 12})
+        self.assertEqual((self.checked.hits, self.checked.misses), (0, 2))
+
+    def test_changed_schemas_are_checked_again(self):
+        schema = {u"type": u"string"}
+        self.checked.check(validators.Draft4Validator, schema)
+        schema[u"type"] = 12
+        with self.assertRaises(SchemaError):
+            self.checked.check(validators.Draft4Validator, schema)
+
+    def test_floats_are_not_integers(self):
+        self.checked.check(validators.Draft4Validator, {u"minLength": 1})
+        with self.assertRaises(SchemaError):
+            self.checked.check(validators.Draft4Validator, {u"minLength": 1.0})
+
+    def test_each_class_has_its_own_metaschema(self):
+        schema = {u"type": u"string", u"required": True}
+        self.checked.check(validators.Draft3Validator, schema)
+        with self.assertRaises(SchemaError):
+            self.checked.check(validators.Draft4Validator, schema)
+
+    def test_metaschemas_are_compiled_once(self):
+        with mock.patch.object(
+            validators.Draft4Validator,
+            "compile",
+            side_effect=validators.Draft4Validator.compile,
+            autospec=True,
+        ) as compile:
+            for maximum in range(3):
+                self.checked.check(
+                    validators.Draft4Validator, {u"maximum": maximum},
+                )
+        self.assertEqual(compile.call_count, 1)
+
+    def test_errors_are_the_same_as_uncompiled(self):
+        schema = {u"properties": {u"foo": {u"items": {u"type": 12}}}}
+        Validator = validators.Draft4Validator
+        meta = Validator(Validator.META_SCHEMA)
+        expected = exceptions.SchemaError.create_from(
+            next(meta.iter_errors(schema)),
+        )
+        with self.assertRaises(SchemaError) as e:
+            self.checked.check(validators.Draft4Validator, schema)
+        self.assertEqual(str(e.exception), str(expected))
+
+    def test_least_recently_checked_are_forgotten(self):
+        for maximum in [1, 2, 1, 3, 1]:
+            self.checked.check(
+                validators.Draft4Validator, {u"maximum": maximum},
+            )
+        self.assertEqual((len(self.checked), self.checked.misses), (2, 3))
+
+    def test_clear(self):
+        self.checked.check(validators.Draft4Validator, {})
+        self.checked.clear()
+        self.checked.check(validators.Draft4Validator, {})
+        self.assertEqual((len(self.checked), self.checked.misses), (1, 2))
+
+    def test_check_schema_uses_the_memo(self):
+        validators.checked_schemas.clear()
+        validators.Draft4Validator.check_schema({u"minimum": 3})
+        validators.Draft4Validator.check_schema({u"minimum": 3})
+        self.assertEqual(len(validators.checked_schemas), 1)
+
+
 class TestRefResolver(TestCase):
 
     base_uri = ""
@@ -1063,10 +1452,91 @@ class TestRefResolver(TestCase):
         schema = {"baz": 12}
 
         with mock.patch("jsonschema.validators.requests") as requests:
-            requests.get.return_value.json.return_value = schema
-            with self.resolver.resolving(ref) as resolved:
+            with mock.patch("jsonschema.validators._session", None):
+                session = requests.Session.return_value
+                session.get.return_value.json.return_value = schema
+                with self.resolver.resolving(ref) as resolved:
+                    self.assertEqual(resolved, 12)
+        session.get.assert_called_once_with("http://bar", timeout=30)
+
+    def test_the_default_session_is_shared(self):
+        with mock.patch("jsonschema.validators.requests") as requests:
+            with mock.patch("jsonschema.validators._session", None):
+                session = requests.Session.return_value
+                session.get.return_value.json.return_value = {}
+                for uri in "http://foo", "http://bar":
+                    resolver = validators.RefResolver("", {})
+                    with resolver.resolving(uri):
+                        pass
+        requests.Session.assert_called_once_with()
+        self.assertEqual(
+            session.get.call_args_list, [
+                mock.call("http://foo", timeout=30),
+                mock.call("http://bar", timeout=30),
+            ],
+        )
+
+    def test_it_retrieves_with_a_given_session(self):
+        session = mock.Mock()
+        session.get.return_value.json.return_value = {"baz": 12}
+        resolver = validators.RefResolver(
+            "", {}, session=session, timeout=(1, 2),
+        )
+        with mock.patch("jsonschema.validators.requests") as requests:
+            with resolver.resolving("http://bar#baz") as resolved:
                 self.assertEqual(resolved, 12)
-        requests.get.assert_called_once_with("http://bar")
+        session.get.assert_called_once_with("http://bar", timeout=(1, 2))
+        self.assertFalse(requests.Session.called)
+
+    def test_pooled_session_without_requests(self):
+        with mock.patch("jsonschema.validators.requests", None):
+            with self.assertRaises(ImportError) as e:
+                validators.pooled_session()
+        self.assertIn("requests", str(e.exception))
+
+    def test_pooled_session(self):
+        with mock.patch("jsonschema.validators.requests") as requests:
+            session = validators.pooled_session(
+                retries=2, pool_connections=3, pool_maxsize=4,
+            )
+        self.assertIs(session, requests.Session.return_value)
+        requests.adapters.Retry.assert_called_once_with(
+            total=2, backoff_factor=0.1, status_forcelist=(502, 503, 504),
+        )
+        adapter = requests.adapters.HTTPAdapter
+        adapter.assert_called_once_with(
+            pool_connections=3,
+            pool_maxsize=4,
+            max_retries=requests.adapters.Retry.return_value,
+        )
+        self.assertEqual(
+            session.mount.call_args_list, [
+                mock.call("http://", adapter.return_value),
+                mock.call("https://", adapter.return_value),
+            ],
+        )
+
+    def test_retrieving_over_urlopen_times_out(self):
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                time.sleep(0.5)
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        resolver = validators.RefResolver("", {}, timeout=0.05)
+        uri = "http://127.0.0.1:%s/" % (server.server_port,)
+        with mock.patch("jsonschema.validators.requests", None):
+            with self.assertRaises(validators.RefResolutionError):
+                with resolver.resolving(uri):
+                    pass
 
     def test_it_retrieves_unstored_refs_via_urlopen(self):
         ref = "http://bar#baz"
@@ -1078,7 +1548,7 @@ class TestRefResolver(TestCase):
                     json.dumps(schema).encode("utf8"))
                 with self.resolver.resolving(ref) as resolved:
                     self.assertEqual(resolved, 12)
-        urlopen.assert_called_once_with("http://bar")
+        urlopen.assert_called_once_with("http://bar", timeout=30)
 
     def test_it_can_construct_a_base_uri_from_a_schema(self):
         schema = {"id": "foo"}
@@ -1155,6 +1625,528 @@ class TestRefResolver(TestCase):
             resolver.pop_scope()
         self.assertIn("Failed to pop the scope", str(exc.exception))
 
+    def test_scopes_are_per_thread(self):
+        resolver = validators.RefResolver("http://example.com/", {})
+        scopes = []
+
+        def in_another_thread():
+            scopes.append(resolver.resolution_scope)
+            resolver.push_scope("bar/")
+            scopes.append(resolver.resolution_scope)
+
+        with resolver.in_scope("foo/"):
+            thread = threading.Thread(target=in_another_thread)
+            thread.start()
+            thread.join()
+            self.assertEqual(
+                resolver.resolution_scope, "http://example.com/foo/",
+            )
+
+        self.assertEqual(
+            scopes, ["http://example.com/", "http://example.com/bar/"],
+        )
+        self.assertEqual(resolver.resolution_scope, "http://example.com/")
+
+    def test_a_validator_can_be_shared_between_threads(self):
+        schema = {
+            "id": "http://example.com/",
+            "properties": {
+                "foo": {"$ref": "#/definitions/bar"},
+                "bar": {"$ref": "other.json#/a"},
+            },
+            "definitions": {
+                "bar": {"id": "#bar", "items": {"type": "integer"}},
+            },
+        }
+        resolver = validators.RefResolver.from_schema(
+            schema, store={"http://example.com/other.json": {"a": {}}},
+        )
+        validator = validators.Draft4Validator(schema, resolver=resolver)
+
+        def validate(instance):
+            return [
+                [error.message for error in validator.iter_errors(instance)]
+                for _ in range(200)
+            ]
+
+        instances = [
+            {"foo": [1, index, "x"], "bar": index} for index in range(8)
+        ]
+        results = [None] * len(instances)
+
+        def run(index):
+            results[index] = validate(instances[index])
+
+        threads = [
+            threading.Thread(target=run, args=(index,))
+            for index in range(len(instances))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(
+            results,
+            [[["'x' is not of type 'integer'"]] * 200] * len(instances),
+        )
+        self.assertEqual(resolver.resolution_scope, "http://example.com/")
+
+    def test_linked_references(self):
+        schema = {
+            "id": "http://example.com/root.json",
+            "definitions": {"a": {"type": "integer"}},
+            "properties": {
+                "local": {"$ref": "#/definitions/a"},
+                "stored": {"$ref": "other.json#/b"},
+                "nested": {
+                    "id": "nested/",
+                    "properties": {"foo": {"$ref": "../other.json"}},
+                },
+            },
+        }
+        other = {"b": {"$ref": "root.json"}}
+        resolver = validators.RefResolver.from_schema(
+            schema, store={"http://example.com/other.json": other},
+        )
+
+        with mock.patch.object(resolver, "resolve_remote") as remote:
+            local = schema["properties"]["local"]
+            self.assertEqual(
+                resolver.linked(local),
+                (
+                    "http://example.com/root.json#/definitions/a",
+                    {"type": "integer"},
+                ),
+            )
+
+            stored = schema["properties"]["stored"]
+            self.assertEqual(
+                resolver.linked(stored),
+                ("http://example.com/other.json#/b", other["b"]),
+            )
+
+            with resolver.in_scope("http://example.com/other.json#/b"):
+                self.assertEqual(
+                    resolver.linked(other["b"]),
+                    ("http://example.com/root.json", schema),
+                )
+
+            nested = schema["properties"]["nested"]
+            with resolver.in_scope(nested["id"]):
+                self.assertEqual(
+                    resolver.linked(nested["properties"]["foo"]),
+                    ("http://example.com/other.json", other),
+                )
+        self.assertFalse(remote.called)
+
+    def test_linked_references_are_found_from_the_current_scope_only(self):
+        schema = {"definitions": {"a": {"$ref": "#/definitions/b"}, "b": {}}}
+        resolver = validators.RefResolver.from_schema(schema)
+        self.assertIsNotNone(resolver.linked(schema["definitions"]["a"]))
+        with resolver.in_scope("http://example.com/"):
+            self.assertIsNone(resolver.linked(schema["definitions"]["a"]))
+
+    def test_unlinkable_references(self):
+        schema = {
+            "properties": {
+                "remote": {"$ref": "http://example.com/"},
+                "missing": {"$ref": "#/nope"},
+            },
+            "enum": [{"$ref": 12}],
+        }
+        resolver = validators.RefResolver.from_schema(schema)
+        with mock.patch.object(resolver, "resolve_remote") as remote:
+            self.assertIsNone(resolver.linked(schema["properties"]["remote"]))
+            self.assertIsNone(resolver.linked(schema["properties"]["missing"]))
+            self.assertIsNone(resolver.linked(schema["enum"][0]))
+            self.assertIsNone(resolver.linked({"$ref": "#"}))
+        self.assertFalse(remote.called)
+
+    def test_validation_follows_linked_references(self):
+        schema = {
+            "definitions": {
+                "node": {
+                    "properties": {
+                        "children": {"items": {"$ref": "#/definitions/node"}},
+                        "value": {"type": "integer"},
+                    },
+                },
+            },
+            "$ref": "#/definitions/node",
+        }
+        instance = {"children": [{"children": [{"value": "foo"}]}]}
+        resolver = validators.RefResolver.from_schema(schema)
+        validator = validators.Draft4Validator(schema, resolver=resolver)
+        with mock.patch.object(resolver, "resolve") as resolve:
+            error, = validator.iter_errors(instance)
+            self.assertFalse(validator.is_valid(instance))
+        self.assertFalse(resolve.called)
+        self.assertEqual(
+            list(error.path), ["children", 0, "children", 0, "value"],
+        )
+
+
+@unittest.skipIf(not PY3, "asyncio is only available on Python 3")
+class TestRefResolverPrefetch(TestCase):
+    documents = {
+        "http://example.com/a.json": {"b": {"$ref": "b.json"}},
+        "http://example.com/b.json": {
+            "type": "integer",
+            "definitions": {"c": {"$ref": "c.json#/d"}},
+        },
+        "http://example.com/c.json": {"d": {"$ref": "#/e"}, "e": {}},
+    }
+    schema = {
+        "properties": {
+            "a": {"$ref": "http://example.com/a.json#/b"},
+            "c": {"$ref": "http://example.com/c.json"},
+            "local": {"$ref": "#/properties/a"},
+        },
+    }
+
+    def test_it_stores_all_reachable_documents(self):
+        fetched = []
+
+        def fetch(uri):
+            fetched.append(uri)
+            return self.documents[uri]
+
+        resolver = validators.RefResolver.from_schema(self.schema)
+        resolver.prefetch(fetch=fetch)
+        self.assertEqual(sorted(fetched), sorted(self.documents))
+        for uri, document in self.documents.items():
+            self.assertIs(resolver.store[uri], document)
+
+        with mock.patch.object(resolver, "resolve_remote") as remote:
+            validator = validators.Draft4Validator(
+                self.schema, resolver=resolver,
+            )
+            self.assertFalse(validator.is_valid({"a": "foo"}))
+            self.assertTrue(validator.is_valid({"a": 12, "c": 13}))
+        self.assertFalse(remote.called)
+
+    def test_references_only_within_the_store(self):
+        stored = {"$ref": "http://b.example/"}
+        resolver = validators.RefResolver.from_schema(
+            {}, store={"http://stored.example/": stored},
+        )
+        resolver.prefetch(fetch=lambda uri: {"from": uri})
+        self.assertEqual(
+            resolver.store["http://b.example/"], {"from": "http://b.example/"},
+        )
+
+    def test_documents_are_fetched_concurrently(self):
+        schema = {
+            "items": [
+                {"$ref": "http://example.com/%s.json" % (index,)}
+                for index in range(5)
+            ],
+        }
+        all_started = threading.Barrier(5, timeout=5)
+
+        def fetch(uri):
+            all_started.wait()
+            return {}
+
+        resolver = validators.RefResolver.from_schema(schema)
+        resolver.prefetch(fetch=fetch)
+        self.assertEqual(
+            sorted(uri for uri in resolver.store if "example" in uri),
+            ["http://example.com/%s.json" % (index,) for index in range(5)],
+        )
+
+    @unittest.skipIf(
+        not hasattr(mock, "AsyncMock"), "AsyncMock is new in Python 3.8",
+    )
+    def test_coroutine_function_fetcher(self):
+        import asyncio
+
+        fetch = mock.AsyncMock(side_effect=self.documents.__getitem__)
+        resolver = validators.RefResolver.from_schema(self.schema)
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        loop.run_until_complete(
+            resolver.prefetch_async(fetch=fetch, loop=loop),
+        )
+        self.assertEqual(
+            sorted(call[0][0] for call in fetch.await_args_list),
+            sorted(self.documents),
+        )
+
+    def test_async_defaults_to_the_running_loop(self):
+        import asyncio
+
+        resolver = validators.RefResolver.from_schema(self.schema)
+
+        def run():
+            loop = asyncio.new_event_loop()
+            done = loop.create_future()
+
+            def prefetch():
+                prefetched = resolver.prefetch_async(
+                    fetch=self.documents.__getitem__,
+                )
+                prefetched.add_done_callback(
+                    lambda _: done.set_result(prefetched.result()),
+                )
+
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("error", DeprecationWarning)
+                    loop.call_soon(prefetch)
+                    loop.run_until_complete(done)
+            finally:
+                loop.close()
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        self.assertEqual(
+            sorted(uri for uri in resolver.store if "example" in uri),
+            sorted(self.documents),
+        )
+
+    def test_it_uses_the_resolvers_handlers_by_default(self):
+        resolver = validators.RefResolver.from_schema(
+            self.schema, handlers={"http": self.documents.__getitem__},
+        )
+        resolver.prefetch()
+        self.assertEqual(
+            resolver.linked(self.schema["properties"]["c"]),
+            (
+                "http://example.com/c.json",
+                self.documents["http://example.com/c.json"],
+            ),
+        )
+
+    def test_failures(self):
+        def fetch(uri):
+            raise ValueError("Nope!")
+
+        resolver = validators.RefResolver.from_schema(self.schema)
+        with self.assertRaises(validators.RefResolutionError) as e:
+            resolver.prefetch(fetch=fetch)
+        self.assertEqual(str(e.exception), "Nope!")
+
+    def test_nothing_to_fetch(self):
+        resolver = validators.RefResolver.from_schema({"$ref": "#"})
+        resolver.prefetch(fetch=self.fail)
+
+    def test_over_http(self):
+        documents = self.documents
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                document = documents["http://example.com" + self.path]
+                self.send_response(200)
+                self.end_headers()
+                self.wfile.write(json.dumps(document).encode("utf-8"))
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        base = "http://127.0.0.1:%s/" % (server.server_port,)
+        resolver = validators.RefResolver.from_schema(
+            {"$ref": base + "a.json#/b"},
+        )
+        resolver.prefetch()
+        self.assertEqual(
+            sorted(uri for uri in resolver.store if uri.startswith(base)),
+            [base + "a.json", base + "b.json", base + "c.json"],
+        )
+
+
+class TestUniqueItems(TestCase):
+    def valid(self, instance):
+        validator = validators.Draft4Validator({u"uniqueItems": True})
+        return validator.is_valid(instance)
+
+    def test_objects(self):
+        self.assertTrue(self.valid([{u"a": 1, u"b": 2}, {u"a": 1}]))
+        self.assertFalse(self.valid([{u"a": 1, u"b": 2}, {u"b": 2, u"a": 1}]))
+
+    def test_arrays(self):
+        self.assertTrue(self.valid([[1, 2], [2, 1]]))
+        self.assertFalse(self.valid([[1, [2]], [1, [2]]]))
+
+    def test_objects_are_not_arrays(self):
+        self.assertTrue(self.valid([{}, []]))
+
+    def test_numbers_compare_numerically_at_any_depth(self):
+        self.assertFalse(self.valid([1, 1.0]))
+        self.assertFalse(self.valid([{u"a": [1]}, {u"a": [1.0]}]))
+
+    def test_booleans_are_not_numbers_at_any_depth(self):
+        self.assertTrue(self.valid([1, True]))
+        self.assertTrue(self.valid([[0], [False]]))
+        self.assertTrue(self.valid([{u"a": 1}, {u"a": True}]))
+
+    def test_large_arrays_of_objects(self):
+        instance = [{u"id": i, u"tags": [i % 7]} for i in range(20000)]
+        self.assertTrue(self.valid(instance))
+        instance.append({u"id": 4, u"tags": [4]})
+        self.assertFalse(self.valid(instance))
+
+    def test_elements_without_a_canonical_form(self):
+        class Unhashable(object):
+            __hash__ = None
+
+            def __init__(self, value):
+                self.value = value
+
+            def __eq__(self, other):
+                return self.value == other.value
+
+        self.assertEqual(
+            _utils.duplicate([Unhashable(1), Unhashable(2), Unhashable(1)]),
+            (0, 2),
+        )
+        self.assertIsNone(_utils.duplicate([Unhashable(1), Unhashable(2)]))
+
+
+class TestLargeEnums(TestCase):
+    enum = [u"code %s" % (i,) for i in range(100)] + [
+        1, None, {u"foo": [1]}, [1, 2],
+    ]
+
+    def valid(self, instance):
+        validator = validators.Draft4Validator({u"enum": self.enum})
+        results = set([
+            validator.is_valid(instance),
+            not list(validator.iter_errors(instance)),
+            validator.compile().is_valid(instance),
+            validator.compile(backend="source").is_valid(instance),
+        ])
+        self.assertEqual(len(results), 1)
+        return results.pop()
+
+    def test_hashable_members(self):
+        self.assertTrue(self.valid(u"code 37"))
+        self.assertTrue(self.valid(None))
+        self.assertFalse(self.valid(u"code 100"))
+
+    def test_unhashable_members(self):
+        self.assertTrue(self.valid({u"foo": [1]}))
+        self.assertTrue(self.valid([1, 2]))
+        self.assertFalse(self.valid({u"foo": [2]}))
+        self.assertFalse(self.valid([2, 1]))
+
+    def test_numbers_compare_as_for_small_enums(self):
+        self.assertTrue(self.valid(1.0))
+        self.assertEqual(self.valid(True), True in [1])
+
+    def test_members_are_built_once_per_validator(self):
+        validator = validators.Draft4Validator({u"enum": self.enum})
+        with mock.patch.object(_utils, "Members") as Members:
+            Members.return_value.enums = self.enum
+            validator.is_valid(u"code 1")
+            validator.is_valid(u"code 2")
+        Members.assert_called_once_with(self.enum)
+
+    def test_small_enums_are_searched(self):
+        members = _utils.members(validators.Draft4Validator({}), [1, 2])
+        self.assertEqual(members, [1, 2])
+
+
+class TestTypeClassification(TestCase):
+    def setUp(self):
+        self.calls = []
+
+    def spy(self, validator, value, instance, schema, types=None):
+        self.calls.append(instance)
+        self.types = types
+        if value:
+            yield ValidationError(u"Spied on")
+
+    def test_validators_for_other_types_are_skipped(self):
+        Validator = validators.extend(
+            validators.Draft4Validator, {u"spy": self.spy},
+        )
+        validator = Validator({u"spy": True})
+        with mock.patch.dict(_validators.APPLIES_TO, {self.spy: u"number"}):
+            self.assertTrue(validator.is_valid(u"foo"))
+            self.assertEqual(list(validator.iter_errors([])), [])
+            self.assertFalse(validator.is_valid(12))
+        self.assertEqual(self.calls, [12])
+        self.assertIn(u"number", self.types)
+
+    def test_built_in_validators_do_not_check_types_again(self):
+        validator = validators.Draft4Validator(
+            {
+                u"properties": {u"foo": {}},
+                u"additionalProperties": False,
+                u"required": [u"foo"],
+                u"dependencies": {u"foo": [u"bar"]},
+                u"minProperties": 1,
+                u"maxProperties": 2,
+            },
+        )
+        instance = {u"foo": 1}
+        with mock.patch.object(
+            validator, "is_type", wraps=validator.is_type,
+        ) as is_type:
+            self.assertFalse(validator.is_valid(instance))
+            self.assertEqual(len(list(validator.iter_errors(instance))), 1)
+        checked = [args for args, _ in is_type.call_args_list]
+        self.assertNotIn(instance, [each for each, _ in checked])
+
+    def test_other_validators_are_always_called(self):
+        Validator = validators.extend(
+            validators.Draft4Validator, {u"minimum": self.spy},
+        )
+        validator = Validator({u"minimum": False})
+        for instance in u"foo", 12, None:
+            validator.is_valid(instance)
+        self.assertEqual(self.calls, [u"foo", 12, None])
+
+    def test_overridden_is_type(self):
+        class Validator(validators.Draft4Validator):
+            def is_type(self, instance, type):
+                if type == u"array" and isinstance(instance, tuple):
+                    return True
+                return super(Validator, self).is_type(instance, type)
+
+        validator = Validator({u"maxItems": 1})
+        self.assertTrue(validator.is_valid(u"foo"))
+        self.assertTrue(validator.is_valid((1,)))
+        self.assertFalse(validator.is_valid((1, 2)))
+        errors = list(validator.iter_errors((1, 2)))
+        self.assertEqual([error.validator for error in errors], [u"maxItems"])
+
+    def test_unknown_types_are_still_unknown(self):
+        Validator = validators.extend(
+            validators.Draft4Validator,
+            type_checker=_types.draft4_type_checker.remove(u"number"),
+        )
+        validator = Validator({u"minimum": 1})
+        with self.assertRaises(exceptions.UnknownType):
+            validator.is_valid(12)
+        with self.assertRaises(exceptions.UnknownType):
+            list(validator.iter_errors(u"foo"))
+
+    def test_redefined_types(self):
+        Validator = validators.extend(
+            validators.Draft4Validator,
+            type_checker=_types.draft4_type_checker.redefine(
+                u"array",
+                lambda checker, instance: isinstance(instance, (list, tuple)),
+            ),
+        )
+        validator = Validator({u"maxItems": 1})
+        self.assertTrue(validator.is_valid(u"foo"))
+        self.assertTrue(validator.is_valid((1,)))
+        self.assertFalse(validator.is_valid((1, 2)))
+        errors = list(validator.iter_errors((1, 2)))
+        self.assertEqual([error.validator for error in errors], [u"maxItems"])
+
 
 class UniqueTupleItemsMixin(object):
     """
@@ -1,12 +1,16 @@
 from __future__ import division
 
 from warnings import warn
+import collections
 import contextlib
+import copy
 try:
     import ujson as json
 except:
     import json
 import numbers
+import re
+import threading
 
 from six import add_metaclass
 
@@ -15,10 +19,12 @@ try:
 except ImportError:
     requests = None
 
-from jsonschema import _utils, _validators, _types
+from jsonschema import (
+    _codegen, _compiler, _predicates, _types, _utils, _validators, cache,
+)
 from jsonschema.compat import (
-    Sequence, urljoin, urlsplit, urldefrag, unquote, urlopen,
-    str_types, int_types, iteritems, lru_cache,
+    Sequence, urljoin, urlsplit, urldefrag, unquote, urlopen, HTTPError,
+    Request, str_types, int_types, iteritems, lru_cache,
 )
 from jsonschema.exceptions import (
     RefResolutionError, SchemaError, UnknownType, UndefinedTypeCheck
@@ -32,6 +38,7 @@ ErrorTree
 
 
 _unset = _utils.Unset()
+_APPLICABLE_TYPES = frozenset(_validators.APPLIES_TO.values())
 
 validators = {}
 meta_schemas = _utils.URIDict()
@@ -115,6 +122,112 @@ class _DefaultTypesDeprecatingMetaClass(type):
         return self._DEFAULT_TYPES
 
 
+class CheckedSchemas(object):
+    """
+    A memo of the schemas which have been found valid by `check_schema`.
+
+    Schemas are remembered by their contents, so that a schema which has
+    since been changed is checked again, and are checked by a compiled
+    validator for each class' metaschema, which is created only once.
+
+    A class' metaschema (and validator functions) are assumed not to change
+    once schemas have been checked with it. Call `clear` after changing
+    them in place.
+
+    Arguments:
+
+        maxsize (int):
+
+            the most schemas to remember (the least recently checked of
+            which are forgotten first)
+
+    Attributes:
+
+        hits (int):
+
+            the number of checks which found a remembered schema
+
+        misses (int):
+
+            the number of checks which had to check a schema
+
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._valid = collections.OrderedDict()
+        self._meta_validators = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._valid)
+
+    def __repr__(self):
+        return "<%s (%s/%s, hits=%s, misses=%s)>" % (
+            self.__class__.__name__,
+            len(self),
+            self.maxsize,
+            self.hits,
+            self.misses,
+        )
+
+    def check(self, cls, schema):
+        """
+        Check a schema against a validator class' metaschema.
+
+        Raises:
+
+            `jsonschema.exceptions.SchemaError` if the schema is invalid
+
+        """
+
+        try:
+            key = cls, id(cls.META_SCHEMA), _utils.fingerprint(schema)
+            hash(key)
+        except TypeError:
+            key = None
+
+        if key is not None:
+            with self._lock:
+                if self._valid.pop(key, None) is not None:
+                    self._valid[key] = True
+                    self.hits += 1
+                    return
+                self.misses += 1
+
+        for error in self._meta_validator(cls).iter_errors(schema):
+            raise SchemaError.create_from(error)
+
+        if key is not None:
+            with self._lock:
+                self._valid[key] = True
+                while len(self._valid) > self.maxsize:
+                    self._valid.popitem(last=False)
+
+    def _meta_validator(self, cls):
+        key = cls, id(cls.META_SCHEMA)
+        meta_validator = self._meta_validators.get(key)
+        if meta_validator is None:
+            meta_validator = cls(cls.META_SCHEMA).compile()
+            self._meta_validators[key] = meta_validator
+        return meta_validator
+
+    def clear(self):
+        """
+        Forget every schema, as well as the compiled metaschemas.
+        """
+
+        with self._lock:
+            self._valid.clear()
+            self._meta_validators.clear()
+
+
+#: The memo used by every validator class' `IValidator.check_schema`
+checked_schemas = CheckedSchemas()
+
+
 def create(
     meta_schema,
     validators=(),
@@ -214,6 +327,10 @@ def create(
             types=(),
             resolver=None,
             format_checker=None,
+            regex_cache=None,
+            max_errors=None,
+            max_errors_per_path=None,
+            max_context_errors=None,
         ):
             if types:
                 warn(
@@ -232,20 +349,45 @@ def create(
 
             if resolver is None:
                 resolver = RefResolver.from_schema(schema)
+            if regex_cache is None:
+                regex_cache = lru_cache(1024)(re.compile)
 
             self.resolver = resolver
             self.format_checker = format_checker
+            self.regex_cache = regex_cache
+            self.max_errors = max_errors
+            self.max_errors_per_path = max_errors_per_path
+            self.max_context_errors = max_context_errors
             self.schema = schema
+            self._enum_members = {}
+
+            # Validators which only constrain one type are skipped for
+            # instances of other ones, which are found once per instance.
+            # Validators with their own idea of what types are (or ones whose
+            # type checker doesn't know a type) call them all, as ever.
+            checker = self.TYPE_CHECKER
+            if (
+                self.__class__.is_type != Validator.is_type or
+                not _APPLICABLE_TYPES.issubset(checker._checks)
+            ):
+                self._classify = None
+            else:
+                self._classify = checker.classify
 
         @classmethod
         def check_schema(cls, schema):
-            for error in cls(cls.META_SCHEMA).iter_errors(schema):
-                raise SchemaError.create_from(error)
+            checked_schemas.check(cls, schema)
 
         def iter_errors(self, instance, _schema=None):
             if _schema is None:
-                _schema = self.schema
+                return _utils.limit_errors(
+                    self._iter_errors(instance, self.schema),
+                    max_errors=self.max_errors,
+                    max_errors_per_path=self.max_errors_per_path,
+                )
+            return self._iter_errors(instance, _schema)
 
+        def _iter_errors(self, instance, _schema):
             scope = _schema.get(u"id")
             if scope:
                 self.resolver.push_scope(scope)
@@ -256,12 +398,24 @@ def create(
                 else:
                     validators = iteritems(_schema)
 
+                classify, types = self._classify, None
                 for k, v in validators:
                     validator = self.VALIDATORS.get(k)
                     if validator is None:
                         continue
 
-                    errors = validator(self, v, instance, _schema) or ()
+                    applies_to = None
+                    if classify is not None:
+                        applies_to = _validators.APPLIES_TO.get(validator)
+
+                    if applies_to is None:
+                        errors = validator(self, v, instance, _schema) or ()
+                    else:
+                        if types is None:
+                            types = classify(instance)
+                        if applies_to not in types:
+                            continue
+                        errors = validator(self, v, instance, _schema, types)
                     for error in errors:
                         # set details if not already set by the called fn
                         error._set(
@@ -289,6 +443,19 @@ def create(
             for error in self.iter_errors(*args, **kwargs):
                 raise error
 
+        def iter_errors_many(self, instances):
+            compiled = self.compile()
+            for index, instance in enumerate(instances):
+                errors = list(compiled.iter_errors(instance))
+                if errors:
+                    yield index, errors
+
+        def validate_many(self, instances):
+            for index, errors in self.iter_errors_many(instances):
+                error = errors[0]
+                error.path.appendleft(index)
+                raise error
+
         def is_type(self, instance, type):
             try:
                 return self.TYPE_CHECKER.is_type(instance, type)
@@ -296,12 +463,64 @@ def create(
                 raise UnknownType(type, instance, self.schema)
 
         def is_valid(self, instance, _schema=None):
-            error = next(self.iter_errors(instance, _schema), None)
-            return error is None
+            if _schema is None:
+                _schema = self.schema
+
+            scope = _schema.get(u"id")
+            if scope:
+                self.resolver.push_scope(scope)
+            try:
+                ref = _schema.get(u"$ref")
+                if ref is not None:
+                    validators = [(u"$ref", ref)]
+                else:
+                    validators = iteritems(_schema)
+
+                classify, types = self._classify, None
+                for k, v in validators:
+                    validator = self.VALIDATORS.get(k)
+                    if validator is None:
+                        continue
+
+                    applies_to = None
+                    if classify is not None:
+                        applies_to = _validators.APPLIES_TO.get(validator)
+
+                    if applies_to is None:
+                        arguments = self, v, instance, _schema
+                    else:
+                        if types is None:
+                            types = classify(instance)
+                        if applies_to not in types:
+                            continue
+                        arguments = self, v, instance, _schema, types
+
+                    # avoid creating errors at all where possible
+                    predicate = _predicates.PREDICATES.get(validator)
+                    if predicate is not None:
+                        if not predicate(*arguments):
+                            return False
+                        continue
+
+                    errors = validator(*arguments) or ()
+                    if next(iter(errors), None) is not None:
+                        return False
+                return True
+            finally:
+                if scope:
+                    self.resolver.pop_scope()
+
+        def compile(self, backend="closures"):
+            if backend == "closures":
+                return _compiler.CompiledValidator(self)
+            elif backend == "source":
+                return _codegen.GeneratedValidator(self)
+            raise ValueError("Unknown compilation backend %r" % (backend,))
 
     if version is not None:
         Validator = validates(version)(Validator)
         Validator.__name__ = version.title().replace(" ", "") + "Validator"
+        Validator.__qualname__ = Validator.__name__
 
     return Validator
 
@@ -481,12 +700,46 @@ class RefResolver(object):
             A cache that will be used for caching the results of
             resolved remote URLs.
 
+        disk_cache (jsonschema.cache.DiskCache):
+
+            A persistent cache to look for remote documents in before
+            retrieving them, and to store them in once retrieved
+
+        session (requests.Session):
+
+            The session to retrieve remote documents over HTTP(S) with, if
+            the requests library is present. If unprovided, a session
+            created by `pooled_session` is shared by all resolvers.
+
+        timeout (float):
+
+            The number of seconds to wait for a server when retrieving a
+            remote document, or ``None`` to wait forever
+
     Attributes:
 
         cache_remote (bool):
 
             Whether remote refs should be cached after first resolution
 
+        disk_cache (jsonschema.cache.DiskCache):
+
+            The persistent cache of remote documents, if any
+
+        session (requests.Session):
+
+            The session to retrieve remote documents with, if not the
+            shared one
+
+        timeout (float):
+
+            The number of seconds to wait for a server
+
+    A resolver (and so a validator using it) may be shared between threads.
+    Each thread has its own resolution scope, while the store and caches
+    (which should themselves be thread-safe, as `functools.lru_cache`\\s
+    are) are shared between all of them.
+
     """
 
     def __init__(
@@ -498,6 +751,9 @@ class RefResolver(object):
         handlers=(),
         urljoin_cache=None,
         remote_cache=None,
+        disk_cache=None,
+        session=None,
+        timeout=30,
     ):
         if urljoin_cache is None:
             urljoin_cache = lru_cache(1024)(urljoin)
@@ -506,9 +762,13 @@ class RefResolver(object):
 
         self.referrer = referrer
         self.cache_remote = cache_remote
+        self.disk_cache = disk_cache
+        self.session = session
+        self.timeout = timeout
         self.handlers = dict(handlers)
 
-        self._scopes_stack = [base_uri]
+        self._scopes = _Scopes(base_uri)
+        self._lock = threading.Lock()
         self.store = _utils.URIDict(
             (id, validator.META_SCHEMA)
             for id, validator in iteritems(meta_schemas)
@@ -518,6 +778,7 @@ class RefResolver(object):
 
         self._urljoin_cache = urljoin_cache
         self._remote_cache = remote_cache
+        self._links = None
 
     @classmethod
     def from_schema(cls, schema, *args, **kwargs):
@@ -539,13 +800,13 @@ class RefResolver(object):
         return cls(schema.get(u"id", u""), schema, *args, **kwargs)
 
     def push_scope(self, scope):
-        self._scopes_stack.append(
+        self._scopes.stack.append(
             self._urljoin_cache(self.resolution_scope, scope),
         )
 
     def pop_scope(self):
         try:
-            self._scopes_stack.pop()
+            self._scopes.stack.pop()
         except IndexError:
             raise RefResolutionError(
                 "Failed to pop the scope from an empty stack. "
@@ -555,7 +816,7 @@ class RefResolver(object):
 
     @property
     def resolution_scope(self):
-        return self._scopes_stack[-1]
+        return self._scopes.stack[-1]
 
     @property
     def base_uri(self):
@@ -595,6 +856,144 @@ class RefResolver(object):
         url = self._urljoin_cache(self.resolution_scope, ref)
         return url, self._remote_cache(url)
 
+    def linked(self, schema):
+        """
+        Find what the ``$ref`` in a schema was linked to ahead of time.
+
+        Every reference within the referring document, and within any
+        documents in the store that those lead to, is resolved once, the
+        first time this is called. References which cannot be resolved
+        without retrieving a remote document are not linked.
+
+        Arguments:
+
+            schema:
+
+                a (sub)schema containing a ``$ref``, which is about to be
+                resolved from the current resolution scope
+
+        Returns:
+
+            the same URL and resolved document that `resolve` would
+            return, or ``None`` if the reference was not linked (or was
+            linked from a different resolution scope), in which case it
+            should be resolved with `resolve`
+
+        Schemas are assumed not to change once they have been linked.
+
+        """
+
+        links = self._links
+        if links is None:
+            with self._lock:
+                if self._links is None:
+                    self._links = self._link(
+                        self.referrer, self._scopes.stack[0],
+                    )
+            links = self._links
+
+        link = links.get(id(schema))
+        if link is not None and link[0] is schema:
+            return link[1].get(self._scopes.stack[-1])
+
+    def _link(self, document, scope):
+        links = {}
+        seen = set()
+        documents = [(document, scope)]
+        while documents:
+            document, scope = documents.pop()
+            if (id(document), scope) in seen:
+                continue
+            seen.add((id(document), scope))
+
+            for node, scope in _walk(document, scope, self._urljoin_cache):
+                ref = node.get(u"$ref")
+                if not isinstance(ref, str_types):
+                    continue
+
+                url = self._urljoin_cache(scope, ref)
+                uri, fragment = urldefrag(url)
+                try:
+                    resolved = self.resolve_fragment(self.store[uri], fragment)
+                except (KeyError, RefResolutionError):
+                    continue
+                _, by_scope = links.setdefault(id(node), (node, {}))
+                by_scope[scope] = url, resolved
+                documents.append((resolved, self._urljoin_cache(scope, url)))
+        return links
+
+    def prefetch(self, fetch=None):
+        """
+        Retrieve every remote document reachable from the referrer, up front.
+
+        Remote references are discovered by walking the referring document,
+        as well as each retrieved document in turn, and all documents
+        which aren't already in the store are retrieved concurrently (using
+        `asyncio`) and then stored, so that resolving references to them
+        during validation doesn't block on the network.
+
+        Only available on Python 3.
+
+        Arguments:
+
+            fetch (callable):
+
+                called with each URI to retrieve, and which should return
+                the document at it. It may also be a coroutine function. If
+                unprovided, `resolve_remote` is called (in a thread pool).
+
+        Raises:
+
+            `RefResolutionError` if any document cannot be retrieved
+
+        """
+
+        import asyncio
+
+        loop = asyncio.new_event_loop()
+        try:
+            prefetched = self.prefetch_async(fetch=fetch, loop=loop)
+            loop.run_until_complete(prefetched)
+        finally:
+            loop.close()
+
+    def prefetch_async(self, fetch=None, loop=None):
+        """
+        Retrieve every remote document reachable from the referrer, up front.
+
+        As with `prefetch`, but for use within an already running `asyncio`
+        event loop.
+
+        Arguments:
+
+            fetch (callable):
+
+                as in `prefetch`
+
+            loop (asyncio.AbstractEventLoop):
+
+                the event loop to retrieve documents within (by default,
+                the running event loop)
+
+        Returns:
+
+            `asyncio.Future`: which is done once all documents have been
+            stored
+
+        """
+
+        from jsonschema import _prefetch
+
+        if fetch is None:
+            fetch = self.resolve_remote
+        return _prefetch.prefetch(resolver=self, fetch=fetch, loop=loop)
+
+    def _store(self, uri, document):
+        with self._lock:
+            self.store[uri] = document
+            # Relink, to include references into the newly stored document
+            self._links = None
+
     def resolve_from_url(self, url):
         url, fragment = urldefrag(url)
         try:
@@ -661,6 +1060,11 @@ class RefResolver(object):
             If it isn't, or if the scheme of the ``uri`` is not ``http`` or
             ``https``, UTF-8 is assumed.
 
+        If the resolver has a `disk_cache`, a fresh document cached in it is
+        used instead of retrieving one, and a stale document is revalidated
+        using its ``ETag`` (if it had one). Responses marked ``no-store``
+        aren't written to the cache.
+
         Arguments:
 
             uri (str):
@@ -675,28 +1079,178 @@ class RefResolver(object):
 
         """
 
+        disk_cache, cached = self.disk_cache, None
+        if disk_cache is not None:
+            cached = disk_cache.lookup(uri)
+
+        if cached is not None and disk_cache.is_fresh(cached):
+            result = cached.document
+        else:
+            etag = cached.etag if cached is not None else None
+            result, headers = self._retrieve(uri, etag=etag)
+            if result is _NOT_MODIFIED:
+                result = cached.document
+            cache_control = headers.get("Cache-Control")
+            if disk_cache is not None and not cache._no_store(cache_control):
+                disk_cache.set(
+                    uri,
+                    result,
+                    etag=headers.get("ETag") or etag,
+                    max_age=cache._max_age(cache_control),
+                )
+
+        if self.cache_remote:
+            self._store(uri, result)
+        return result
+
+    def _retrieve(self, uri, etag):
+        """
+        Retrieve a remote document, unless it matches a known ``ETag``.
+
+        Returns:
+
+            a 2-tuple of the document (or ``_NOT_MODIFIED``) and the
+            headers of the response it came in
+
+        """
+
         scheme = urlsplit(uri).scheme
+        if etag is None:
+            request_headers = {}
+        else:
+            request_headers = {"If-None-Match": etag}
 
         if scheme in self.handlers:
-            result = self.handlers[scheme](uri)
+            return self.handlers[scheme](uri), {}
         elif (
             scheme in [u"http", u"https"] and
             requests and
             getattr(requests.Response, "json", None) is not None
         ):
+            session = self.session
+            if session is None:
+                session = _shared_session()
+            if request_headers:
+                response = session.get(
+                    uri, headers=request_headers, timeout=self.timeout,
+                )
+            else:
+                response = session.get(uri, timeout=self.timeout)
+            if response.status_code == 304:
+                result = _NOT_MODIFIED
             # Requests has support for detecting the correct encoding of
             # json over http
-            if callable(requests.Response.json):
-                result = requests.get(uri).json()
+            elif callable(requests.Response.json):
+                result = response.json()
             else:
-                result = requests.get(uri).json
+                result = response.json
+            return result, response.headers
         else:
             # Otherwise, pass off to urllib and assume utf-8
-            result = json.loads(urlopen(uri).read().decode("utf-8"))
+            if request_headers:
+                request = Request(uri, headers=request_headers)
+            else:
+                request = uri
+            try:
+                response = urlopen(request, timeout=self.timeout)
+            except HTTPError as error:
+                if error.code != 304:
+                    raise
+                return _NOT_MODIFIED, error.info()
+            return json.loads(response.read().decode("utf-8")), response.info()
+
+
+_NOT_MODIFIED = _utils.Unset()
+
+
+def pooled_session(retries=3, pool_connections=10, pool_maxsize=10):
+    """
+    Create a `requests.Session` which pools and retries its connections.
+
+    Arguments:
+
+        retries (int):
+
+            how many times to retry failed connections, as well as requests
+            which failed with a 502, 503 or 504 status
+
+        pool_connections (int):
+
+            how many hosts to keep pools of connections to
+
+        pool_maxsize (int):
+
+            the maximum number of connections to keep to each host
+
+    Returns:
+
+        `requests.Session`
+
+    Raises:
+
+        `ImportError` if `requests` isn't installed
+
+    """
+
+    if requests is None:
+        raise ImportError("pooled_session requires requests to be installed")
+
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=requests.adapters.Retry(
+            total=retries,
+            backoff_factor=0.1,
+            status_forcelist=(502, 503, 504),
+        ),
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
-        if self.cache_remote:
-            self.store[uri] = result
-        return result
+
+#: The session shared by all resolvers which weren't given one
+_session = None
+_session_lock = threading.Lock()
+
+
+def _shared_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = pooled_session()
+        return _session
+
+
+def _walk(document, scope, urljoin):
+    """
+    Yield each object within a document along with its resolution scope.
+    """
+
+    stack = [(document, scope)]
+    while stack:
+        node, scope = stack.pop()
+        if isinstance(node, dict):
+            id_of = node.get(u"id")
+            if isinstance(id_of, str_types):
+                scope = urljoin(scope, id_of)
+            yield node, scope
+            children = node.values()
+        elif isinstance(node, list):
+            children = node
+        else:
+            continue
+        stack.extend((child, scope) for child in children)
+
+
+class _Scopes(threading.local):
+    """
+    A stack of resolution scopes for each thread using a `RefResolver`.
+    """
+
+    def __init__(self, base_uri):
+        self.stack = [base_uri]
 
 
 def validator_for(schema, default=_unset):
@@ -741,6 +1295,10 @@ def validate(instance, schema, cls=None, *args, **kwargs):
     `IValidator.validate` method directly on a specific validator
     (e.g. ``Draft4Validator.validate``).
 
+    Schemas which have been verified, along with the validators created for
+    them, are kept in `validator_cache`, so that validating with the same
+    schema again does neither again.
+
 
     Arguments:
 
@@ -779,7 +1337,124 @@ def validate(instance, schema, cls=None, *args, **kwargs):
     .. [#] known by a validator registered with
         `jsonschema.validators.validates`
     """
-    if cls is None:
-        cls = validator_for(schema)
-    cls.check_schema(schema)
-    cls(schema, *args, **kwargs).validate(instance)
+    validator_cache.validator(schema, cls, *args, **kwargs).validate(instance)
+
+
+class ValidatorCache(object):
+    """
+    A bounded cache of validators for schemas which have been checked.
+
+    Schemas are looked up by their contents (rather than their identity),
+    along with the validator class and any arguments to create validators
+    with, so that a schema which has since been changed is checked again.
+    The least recently used validators are evicted once the cache is full.
+
+    Arguments:
+
+        maxsize (int):
+
+            the most validators to hold
+
+    Attributes:
+
+        hits (int):
+
+            the number of lookups which found a cached validator
+
+        misses (int):
+
+            the number of lookups which had to check a schema and create a
+            validator
+
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._validators = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._validators)
+
+    def __repr__(self):
+        return "<%s (%s/%s, hits=%s, misses=%s)>" % (
+            self.__class__.__name__,
+            len(self),
+            self.maxsize,
+            self.hits,
+            self.misses,
+        )
+
+    def validator(self, schema, cls=None, *args, **kwargs):
+        """
+        Retrieve a validator for a schema, checking the schema if needed.
+
+        Arguments are as for `validate`. Schemas which aren't plain JSON,
+        or arguments which can't be hashed, aren't cached.
+
+        Raises:
+
+            `jsonschema.exceptions.SchemaError` if the schema is invalid
+
+        """
+
+        if cls is None:
+            cls = validator_for(schema)
+
+        try:
+            key = cls, _utils.fingerprint(schema), args, frozenset(
+                iteritems(kwargs),
+            )
+            hash(key)
+        except TypeError:
+            cls.check_schema(schema)
+            return cls(schema, *args, **kwargs)
+
+        with self._lock:
+            validator = self._validators.pop(key, None)
+            if validator is not None:
+                self._validators[key] = validator
+                self.hits += 1
+                return validator
+            self.misses += 1
+
+        # The validator outlives this call, so it mustn't see any later
+        # changes the caller makes to their schema
+        schema = copy.deepcopy(schema)
+        cls.check_schema(schema)
+        validator = cls(schema, *args, **kwargs)
+
+        with self._lock:
+            self._validators[key] = validator
+            while len(self._validators) > self.maxsize:
+                self._validators.popitem(last=False)
+        return validator
+
+    def invalidate(self, schema):
+        """
+        Forget any validators for a schema (or any schema equal to it).
+        """
+
+        try:
+            fingerprint = _utils.fingerprint(schema)
+        except TypeError:
+            return
+
+        with self._lock:
+            for key in list(self._validators):
+                if key[1] == fingerprint:
+                    del self._validators[key]
+
+    def clear(self):
+        """
+        Forget every validator.
+        """
+
+        with self._lock:
+            self._validators.clear()
+
+
+#: The cache used by `validate`
+validator_cache = ValidatorCache()